@@ -0,0 +1,39 @@
+"""
+Compares the encoding and decoding throughput of the available JSON codecs over
+conversation and message payloads
+
+    python -m benchmarks.bench_codec --number 2000
+"""
+
+import argparse
+import timeit
+
+from benchmarks.payloads import conversation_payload, message_payload
+from freshchat.client.codec import CODEC_FACTORIES
+
+
+def main(number: int) -> None:
+    payloads = {
+        "message": message_payload("conversation"),
+        "conversation (50 messages)": conversation_payload(messages=50),
+    }
+    for name, factory in CODEC_FACTORIES.items():
+        try:
+            codec = factory()
+        except ImportError:
+            print(f"{name:<8} not installed")
+            continue
+        for payload_name, payload in payloads.items():
+            encoded = codec.dumps(payload)
+            dumps = timeit.timeit(lambda: codec.dumps(payload), number=number)
+            loads = timeit.timeit(lambda: codec.loads(encoded), number=number)
+            print(
+                f"{name:<8} {payload_name:<28} {len(encoded):>7} bytes "
+                f"dumps={number / dumps:>10.0f}/s loads={number / loads:>10.0f}/s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    main(parser.parse_args().number)
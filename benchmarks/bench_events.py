@@ -0,0 +1,58 @@
+"""
+Measures incoming events per second of a filter-and-drop workload, where only the
+action and the conversation id of an event are inspected, with eager
+IncomingEvent parsing against lazy parsing
+
+    python -m benchmarks.bench_events --events 100000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from benchmarks.payloads import message_payload
+from freshchat.models.events import IncomingEvent
+
+
+def event_payloads(events: int) -> List[Dict[str, Any]]:
+    payloads = []
+    for index in range(events):
+        message = message_payload(f"conversation_{index % 100}", index)
+        payloads.append(
+            {
+                "actor": {"actor_type": "user", "actor_id": message["actor_id"]},
+                "action": "message_create",
+                "action_time": message["created_time"],
+                "data": {"message": message},
+            }
+        )
+    return payloads
+
+
+def eager(payload: Dict[str, Any]) -> bool:
+    event = IncomingEvent(**payload)
+    return event.action == "conversation_resolution" or event.conversation_id is None
+
+
+def lazy(payload: Dict[str, Any]) -> bool:
+    event = IncomingEvent.lazy(payload)
+    return event.action == "conversation_resolution" or event.conversation_id is None
+
+
+def run(name: str, consume: Callable[[Dict[str, Any]], bool], payloads) -> None:
+    start = time.perf_counter()
+    kept = sum(1 for payload in payloads if consume(payload))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<6} {len(payloads) / elapsed:>10.0f} events/s (kept {kept})")
+
+
+def main(events: int) -> None:
+    payloads = event_payloads(events)
+    run("eager", eager, payloads)
+    run("lazy", lazy, payloads)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100_000)
+    main(parser.parse_args().events)
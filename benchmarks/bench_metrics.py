@@ -0,0 +1,60 @@
+"""
+Measures the overhead of the metrics hooks of FreshChatClient, without hooks, with
+an empty hook and with the MetricsCollector
+
+    python -m benchmarks.bench_metrics --requests 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Sequence
+
+from benchmarks.fake import create_fake
+from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import FreshChatConfiguration
+from freshchat.client.metrics import MetricsCollector, MetricsHook
+
+
+async def measure(
+    config: FreshChatConfiguration,
+    user_ids: List[str],
+    requests: int,
+    hooks: Sequence[MetricsHook],
+) -> List[float]:
+    timings = []
+    async with FreshChatClient(config=config, hooks=hooks) as client:
+        for index in range(requests):
+            start = time.perf_counter()
+            await client.get(f"/users/{user_ids[index % len(user_ids)]}")
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: List[float]) -> None:
+    timings = sorted(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(
+        f"{name:<16} mean={statistics.mean(timings) * 1e6:.1f}us "
+        f"p50={statistics.median(timings) * 1e6:.1f}us p99={p99 * 1e6:.1f}us"
+    )
+
+
+async def main(requests: int) -> None:
+    fake, user_ids, _ = create_fake()
+    async with fake:
+        config = fake.configuration()
+        # warm up the connection pool and the server
+        await measure(config, user_ids, 100, ())
+        report("no hooks", await measure(config, user_ids, requests, ()))
+        report("empty hook", await measure(config, user_ids, requests, [MetricsHook()]))
+        collector = MetricsCollector()
+        report("collector", await measure(config, user_ids, requests, [collector]))
+        print(collector.render())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,63 @@
+"""
+Compares the memory per instance and the construction time of the slotted models
+against equivalent dataclasses with a per-instance __dict__
+
+    python -m benchmarks.bench_models --instances 100000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from freshchat.models import Conversation, Message, User
+from freshchat.models import events
+
+
+def unslotted(cls: type) -> type:
+    """
+    Returns a dataclass with the same fields as the given one but without slots
+    """
+    return make_dataclass(
+        f"{cls.__name__}WithDict", [(f.name, f.type, f) for f in fields(cls)]
+    )
+
+
+def measure(factory: Callable[[], Any], instances: int) -> Tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [factory() for _ in range(instances)]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size / instances, elapsed
+
+
+def main(instances: int) -> None:
+    cases: Dict[str, Tuple[type, Dict[str, Any]]] = {
+        "User": (User, {"id": "user", "email": "peter.griffin@test.ai"}),
+        "Message": (
+            Message,
+            {"id": "message", "conversation_id": "conversation", "actor_id": "user"},
+        ),
+        "Conversation": (Conversation, {"conversation_id": "conversation"}),
+        "events.Message": (events.Message, {"id": "message", "actor_id": "user"}),
+    }
+    for name, (model, kwargs) in cases.items():
+        baseline = unslotted(model)
+        for label, cls in (("dict", baseline), ("slots", model)):
+            per_instance, elapsed = measure(lambda: cls(**kwargs), instances)
+            print(
+                f"{name:<15} {label:<6} {per_instance:>7.1f} bytes/instance "
+                f"{elapsed * 1000:>8.1f}ms for {instances} instances"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--instances", type=int, default=100_000)
+    main(parser.parse_args().instances)
@@ -0,0 +1,70 @@
+"""
+Compares the cost per message of the send path serialisation with
+dataclasses.asdict against Model.to_payload, and of building models from response
+payloads with the constructor against Model.from_payload
+
+    python -m benchmarks.bench_serialization --number 100000
+"""
+
+import argparse
+import timeit
+from dataclasses import asdict
+
+from benchmarks.payloads import conversation_payload, message_payload
+from freshchat.models import Conversation, Message
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<36} {seconds / number * 1e6:>8.2f}us/op")
+
+
+def main(number: int) -> None:
+    message = Message(
+        conversation_id="conversation",
+        actor_id="user",
+        message_parts=[{"text": {"content": "Hello dude!"}}],
+    )
+    report(
+        "send: asdict(Message)",
+        timeit.timeit(lambda: asdict(message), number=number),
+        number,
+    )
+    report(
+        "send: Message.to_payload",
+        timeit.timeit(message.to_payload, number=number),
+        number,
+    )
+
+    conversation = Conversation.from_payload(conversation_payload(messages=10))
+    conversation.messages = [
+        Message.from_payload(item) for item in conversation.messages
+    ]
+    fraction = max(1, number // 20)
+    report(
+        "asdict(Conversation, 10 messages)",
+        timeit.timeit(lambda: asdict(conversation), number=fraction),
+        fraction,
+    )
+    report(
+        "Conversation.to_payload",
+        timeit.timeit(conversation.to_payload, number=fraction),
+        fraction,
+    )
+
+    response = message_payload("conversation")
+    report(
+        "response: Message(**body)",
+        timeit.timeit(lambda: Message(**response), number=number),
+        number,
+    )
+    report(
+        "response: Message.from_payload",
+        timeit.timeit(lambda: Message.from_payload(response), number=number),
+        number,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    main(parser.parse_args().number)
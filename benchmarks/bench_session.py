@@ -0,0 +1,70 @@
+"""
+Compares the per request latency of a new session per request against the pooled
+session of FreshChatClient
+
+    python -m benchmarks.bench_session --requests 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import aiohttp
+
+from benchmarks.fake import create_fake
+from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import FreshChatConfiguration
+
+
+async def per_request_session(
+    config: FreshChatConfiguration, endpoint: str, requests: int
+) -> List[float]:
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                config.get_url(endpoint), headers=config.authorization_header
+            ) as response:
+                await response.read()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def pooled_session(
+    config: FreshChatConfiguration, endpoint: str, requests: int
+) -> List[float]:
+    timings = []
+    async with FreshChatClient(config=config) as client:
+        for _ in range(requests):
+            start = time.perf_counter()
+            await client.get(endpoint)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name: str, timings: List[float]) -> None:
+    timings = sorted(timings)
+    p99 = timings[int(len(timings) * 0.99) - 1]
+    print(
+        f"{name:<24} mean={statistics.mean(timings) * 1000:.3f}ms "
+        f"p50={statistics.median(timings) * 1000:.3f}ms p99={p99 * 1000:.3f}ms"
+    )
+
+
+async def main(requests: int) -> None:
+    fake, user_ids, _ = create_fake(users=1)
+    async with fake:
+        config, endpoint = fake.configuration(), f"/users/{user_ids[0]}"
+        report(
+            "session per request",
+            await per_request_session(config, endpoint, requests),
+        )
+        report("pooled session", await pooled_session(config, endpoint, requests))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    asyncio.run(main(parser.parse_args().requests))
@@ -0,0 +1,71 @@
+"""
+Measures webhook signature verifications per second when the public key is parsed
+for every verification against the cached verifiers of SecurityManager, and the
+throughput of the asynchronous verifications on thread and process pools
+
+    python -m benchmarks.bench_webhook --number 2000 --workers 4
+"""
+
+import argparse
+import asyncio
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from base64 import b64encode
+
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import PKCS1_v1_5
+
+from freshchat.webhook.security import SecurityManager
+
+
+def signed_payload(key, size: int = 2048):
+    payload = b'{"action": "message_create", "data": "' + b"x" * size + b'"}'
+    signature = b64encode(PKCS1_v1_5.new(key).sign(SHA256.new(payload))).decode()
+    body = b64encode(key.publickey().exportKey("DER")).decode()
+    public_key = f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
+    return public_key, signature, payload
+
+
+async def verify_on_pool(manager: SecurityManager, signature, payload, number: int):
+    start = time.perf_counter()
+    await manager.verify_many([(signature, payload)] * number)
+    return time.perf_counter() - start
+
+
+def main(number: int, workers: int) -> None:
+    key = RSA.generate(2048)
+    public_key, signature, payload = signed_payload(key)
+
+    def uncached():
+        SecurityManager(public_key).verify_signature(signature, payload)
+
+    manager = SecurityManager(public_key)
+
+    def cached():
+        manager.verify_signature(signature, payload)
+
+    for name, verify in (("key parsed per call", uncached), ("cached", cached)):
+        seconds = timeit.timeit(verify, number=number)
+        print(f"{name:<20} {number / seconds:>10.0f} verifications/s")
+
+    for name, executor_class in (
+        ("thread pool", ThreadPoolExecutor),
+        ("process pool", ProcessPoolExecutor),
+    ):
+        with executor_class(max_workers=workers) as executor:
+            pooled = SecurityManager(public_key, executor=executor)
+            seconds = asyncio.run(verify_on_pool(pooled, signature, payload, number))
+        print(
+            f"{name + ' (' + str(workers) + ')':<20} "
+            f"{number / seconds:>10.0f} verifications/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=4)
+    arguments = parser.parse_args()
+    main(arguments.number, arguments.workers)
@@ -0,0 +1,27 @@
+"""
+Fake Freshchat API used by the benchmarks, seeded with realistic payloads
+"""
+
+from typing import List, Tuple
+
+from benchmarks.payloads import channel_payload, user_payload
+from freshchat.testing import FakeFreshchat, constant
+
+
+def create_fake(
+    latency: float = 0.0, users: int = 100, channels: int = 30
+) -> Tuple[FakeFreshchat, List[str], str]:
+    """
+    Creates a :class:`FakeFreshchat` answering after the given latency in seconds
+    with the given number of users and channels and one conversation
+    :return: the fake, the ids of its users and the id of its conversation
+    """
+    fake = FakeFreshchat(latency=constant(latency) if latency else None)
+    fake.channels = [channel_payload(index) for index in range(channels)]
+    user_ids = []
+    for _ in range(users):
+        user = user_payload()
+        del user["id"], user["created_time"]
+        user_ids.append(fake.add_user(**user)["id"])
+    conversation = fake.add_conversation(users=[{"id": user_ids[0]}])
+    return fake, user_ids, conversation["conversation_id"]
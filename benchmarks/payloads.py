@@ -0,0 +1,64 @@
+"""
+Realistic Freshchat payloads shared by the benchmarks
+"""
+
+from typing import Any, Dict
+from uuid import uuid4
+
+
+def user_payload() -> Dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "created_time": "2020-01-01T10:00:00.000Z",
+        "email": "peter.griffin@test.ai",
+        "first_name": "Peter",
+        "last_name": "Griffin",
+        "phone": "+440000000000",
+        "avatar": {"url": "https://example.com/avatar.png"},
+        "social_profiles": [],
+        "properties": [{"name": "plan", "value": "premium"}],
+    }
+
+
+def message_payload(conversation_id: str, index: int = 0) -> Dict[str, Any]:
+    return {
+        "created_time": "2020-01-01T10:00:00.000Z",
+        "id": str(uuid4()),
+        "app_id": str(uuid4()),
+        "actor_type": "user" if index % 2 else "agent",
+        "actor_id": str(uuid4()),
+        "channel_id": str(uuid4()),
+        "conversation_id": conversation_id,
+        "message_type": "normal",
+        "message_parts": [
+            {"text": {"content": f"Message number {index} with some Grüße ✓ " * 4}}
+        ],
+    }
+
+
+def conversation_payload(messages: int = 50) -> Dict[str, Any]:
+    conversation_id = str(uuid4())
+    return {
+        "conversation_id": conversation_id,
+        "app_id": str(uuid4()),
+        "channel_id": str(uuid4()),
+        "status": "new",
+        "agents": [],
+        "users": [user_payload()],
+        "messages": [
+            message_payload(conversation_id, index) for index in range(messages)
+        ],
+    }
+
+
+def channel_payload(index: int = 0) -> Dict[str, Any]:
+    return {
+        "id": str(uuid4()),
+        "icon": {"url": "https://example.com/icon.png"},
+        "updated_time": "2020-01-01T10:00:00.000Z",
+        "enabled": True,
+        "public": True,
+        "name": f"Channel {index}",
+        "tags": [],
+        "welcome_message": {"message_parts": [{"text": {"content": "Hi!"}}]},
+    }
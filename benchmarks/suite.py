@@ -0,0 +1,261 @@
+"""
+Runs the client and webhook scenarios against the local fake of the Freshchat API
+at increasing concurrency and reports the requests per second, the p50 and p99
+latency and the memory of each run. The results are written as JSON, and compared
+with the results of a previous run if a baseline is given
+
+    python -m benchmarks.suite --concurrency 1 8 32 --operations 500 \\
+        --latency 0.005 --output results.json --baseline previous.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from base64 import b64encode
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import PKCS1_v1_5
+
+from benchmarks.fake import create_fake
+from benchmarks.payloads import message_payload
+from freshchat.client.client import FreshChatClient
+from freshchat.client.codec import get_codec
+from freshchat.client.configuration import PoolConfiguration
+from freshchat.models import Channels, Conversation, User
+from freshchat.models.events import IncomingEvent
+from freshchat.webhook.security import SecurityManager
+
+Operation = Callable[[int], Awaitable[Any]]
+
+
+def percentile(timings: List[float], percent: float) -> float:
+    index = max(0, min(len(timings) - 1, int(round(len(timings) * percent)) - 1))
+    return timings[index]
+
+
+async def run(operation: Operation, operations: int, concurrency: int) -> dict:
+    """
+    Runs the operation the given number of times on ``concurrency`` workers
+    """
+    timings: List[float] = []
+    errors = 0
+    indexes = iter(range(operations))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in indexes:
+            start = time.perf_counter()
+            try:
+                await operation(index)
+            except Exception:
+                errors += 1
+            timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+    timings.sort()
+    return {
+        "operations": operations,
+        "errors": errors,
+        "seconds": round(seconds, 6),
+        "rps": round(operations / seconds, 2),
+        "mean_ms": round(statistics.mean(timings) * 1000, 3),
+        "p50_ms": round(percentile(timings, 0.5) * 1000, 3),
+        "p99_ms": round(percentile(timings, 0.99) * 1000, 3),
+    }
+
+
+def webhook_operation(size: int = 20) -> Operation:
+    """
+    Returns an operation which verifies and parses a signed message webhook
+    """
+    key = RSA.generate(2048)
+    body = b64encode(key.publickey().exportKey("DER")).decode()
+    manager = SecurityManager(
+        f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
+    )
+    payload = json.dumps(
+        {
+            "actor": {"actor_type": "user", "actor_id": "user"},
+            "action": "message_create",
+            "action_time": "2020-01-01T10:00:00.000Z",
+            "data": {"message": message_payload("conversation", size)},
+        }
+    ).encode()
+    signature = b64encode(PKCS1_v1_5.new(key).sign(SHA256.new(payload))).decode()
+
+    async def operation(_: int) -> None:
+        if not await manager.verify_async(signature, payload):
+            raise ValueError("Invalid signature")
+        IncomingEvent.from_payload(json.loads(payload))
+
+    return operation
+
+
+def client_operations(
+    client: FreshChatClient, user_ids: List[str], conversation_id: str
+) -> Dict[str, Operation]:
+    """
+    Returns the operations of the scenarios driving the client and the models
+    """
+    conversation = Conversation(
+        conversation_id=conversation_id, users=[User(id=user_ids[0])]
+    )
+
+    async def client_get(index: int) -> None:
+        await client.get(f"/users/{user_ids[index % len(user_ids)]}")
+
+    async def user_get(index: int) -> None:
+        await User.get(client, user_ids[index % len(user_ids)])
+
+    async def user_create(index: int) -> None:
+        await User.create(client, email=f"user-{index}@test.ai", first_name="Peter")
+
+    async def conversation_send(index: int) -> None:
+        await conversation.send(client, f"Message number {index}")
+
+    async def channels_iter(_: int) -> None:
+        async for _ in Channels.iter(client, page_size=10):
+            pass
+
+    return {
+        "client_get": client_get,
+        "user_get": user_get,
+        "user_create": user_create,
+        "conversation_send": conversation_send,
+        "channels_iter": channels_iter,
+    }
+
+
+def max_rss_kb() -> int:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+async def measure(
+    name: str,
+    operation: Operation,
+    operations: int,
+    concurrency: int,
+    trace_memory: bool,
+) -> dict:
+    # one unmeasured operation per worker warms up the connections
+    await run(operation, concurrency, concurrency)
+    if trace_memory:
+        tracemalloc.start()
+    result = await run(operation, operations, concurrency)
+    result["memory_peak_kb"] = None
+    if trace_memory:
+        result["memory_peak_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    result["max_rss_kb"] = max_rss_kb()
+    return {"scenario": name, "concurrency": concurrency, **result}
+
+
+async def main(arguments: argparse.Namespace) -> dict:
+    results = []
+    fake, user_ids, conversation_id = create_fake(latency=arguments.latency)
+    async with fake:
+        pool = PoolConfiguration(limit=max(arguments.concurrency))
+        async with FreshChatClient(
+            config=fake.configuration(), pool=pool, codec=get_codec(arguments.codec)
+        ) as client:
+            operations = client_operations(client, user_ids, conversation_id)
+            operations["webhook_verify_parse"] = webhook_operation()
+            for name, operation in operations.items():
+                if arguments.scenarios and name not in arguments.scenarios:
+                    continue
+                for concurrency in arguments.concurrency:
+                    result = await measure(
+                        name,
+                        operation,
+                        arguments.operations,
+                        concurrency,
+                        arguments.trace_memory,
+                    )
+                    print(
+                        f"{name:<22} c={concurrency:<4} {result['rps']:>9.1f} rps "
+                        f"p50={result['p50_ms']:.3f}ms p99={result['p99_ms']:.3f}ms "
+                        f"errors={result['errors']}"
+                    )
+                    results.append(result)
+
+    return {
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "operations": arguments.operations,
+            "concurrency": arguments.concurrency,
+            "latency": arguments.latency,
+            "codec": client.codec.name,
+            "trace_memory": arguments.trace_memory,
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """
+    Prints the change of the throughput and the p99 latency of every run compared
+    to the same run of the baseline
+    """
+    previous = {
+        (result["scenario"], result["concurrency"]): result
+        for result in baseline.get("results", [])
+    }
+    for result in report["results"]:
+        before: Optional[dict] = previous.get(
+            (result["scenario"], result["concurrency"])
+        )
+        if before is None:
+            continue
+        rps = (result["rps"] - before["rps"]) / before["rps"] * 100
+        p99 = (result["p99_ms"] - before["p99_ms"]) / before["p99_ms"] * 100
+        print(
+            f"{result['scenario']:<22} c={result['concurrency']:<4} "
+            f"rps {rps:+7.1f}% p99 {p99:+7.1f}%"
+        )
+
+
+def parse_arguments(args: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--operations", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="fake API latency in seconds"
+    )
+    parser.add_argument("--codec", default=None, help="orjson, ujson or json")
+    parser.add_argument("--scenarios", nargs="*", help="scenarios to run, all if empty")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="measure the peak of the allocated memory, slows the runs down",
+    )
+    parser.add_argument("--output", help="path of the JSON results")
+    parser.add_argument("--baseline", help="path of the JSON results to compare with")
+    return parser.parse_args(args)
+
+
+if __name__ == "__main__":
+    arguments = parse_arguments()
+    report = asyncio.run(main(arguments))
+    if arguments.output:
+        with open(arguments.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if arguments.baseline:
+        with open(arguments.baseline) as baseline:
+            compare(report, json.load(baseline))
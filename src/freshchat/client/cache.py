@@ -0,0 +1,247 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, AnyStr, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from freshchat.client.responses import FreshChatResponse
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]
+
+
+def normalise_endpoint(endpoint: str) -> str:
+    """
+    Returns the path of the endpoint with a single leading slash and no trailing one
+    """
+    return "/" + endpoint.split("?", 1)[0].strip("/")
+
+
+def parent_paths(path: str) -> List[str]:
+    """
+    Returns the normalised path followed by the paths of its parent resources
+    """
+    segments = normalise_endpoint(path).strip("/").split("/")
+    return ["/" + "/".join(segments[:end]) for end in range(len(segments), 0, -1)]
+
+
+def copy_body(body: Any) -> Any:
+    """
+    Returns a copy of a decoded JSON body whose dictionaries and lists are not
+    shared with the original
+    """
+    if isinstance(body, dict):
+        return {key: copy_body(value) for key, value in body.items()}
+    if isinstance(body, list):
+        return [copy_body(value) for value in body]
+    return body
+
+
+def copy_response(response: FreshChatResponse) -> FreshChatResponse:
+    return FreshChatResponse(
+        response.http,
+        body=copy_body(response.body),
+        size=response.size,
+        timings=response.timings,
+    )
+
+
+def fingerprint(values: Optional[Dict[AnyStr, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Returns the items of a mapping as sorted pairs of strings
+    """
+    return tuple(
+        sorted((str(key), str(value)) for key, value in (values or {}).items())
+    )
+
+
+def cache_key(
+    endpoint: str,
+    params: Optional[Dict[AnyStr, Any]] = None,
+    headers: Optional[Dict[AnyStr, Any]] = None,
+) -> CacheKey:
+    """
+    Builds the cache key of a GET request from its endpoint, parameters and
+    additional headers, so requests whose headers differ never share a response
+
+    :param endpoint: Resource endpoint
+    :param params: request parameters
+    :param headers: Additional request headers
+    """
+    return normalise_endpoint(endpoint), fingerprint(params), fingerprint(headers)
+
+
+@dataclass
+class CacheStats:
+    """
+    Class represents the counters of a cache
+    """
+
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    evictions: int = field(default=0)
+    invalidations: int = field(default=0)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache:
+    """
+    Class represents a bounded in-memory mapping which evicts the least recently
+    used entry when it is full and expires entries older than the ttl in seconds
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the value stored for the key or None if it is missing or expired
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            self.stats.evictions += 1
+            self.stats.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores the value for the key, evicting the least recently used entries if
+        the cache is full
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._data.get(key)
+        return entry is not None and entry[0] >= time.monotonic()
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResponseCache:
+    """
+    Base class of the response cache backends used by
+    :class:`freshchat.client.client.FreshChatClient` for GET requests
+    """
+
+    stats: CacheStats
+
+    def get(self, key: CacheKey) -> Optional[FreshChatResponse]:
+        """
+        Returns the cached response of the key, if any
+        """
+        raise NotImplementedError
+
+    def set(self, key: CacheKey, response: FreshChatResponse) -> None:
+        """
+        Stores the response of the key
+        """
+        raise NotImplementedError
+
+    def generation(self, endpoint: str) -> Hashable:
+        """
+        Returns a value which changes whenever the cached responses of the endpoint
+        are invalidated. The response of a request which was in flight when its
+        endpoint was invalidated is stale and is not stored
+
+        :param endpoint: Resource endpoint of a GET request
+        """
+        raise NotImplementedError
+
+    def invalidate(self, endpoint: str) -> int:
+        """
+        Removes the cached responses of the endpoint, its parent resources and its
+        sub-resources
+
+        :param endpoint: Resource endpoint which has been modified
+        :return: the number of the removed responses
+        """
+        raise NotImplementedError
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    Class represents an in-memory LRU response cache with a ttl in seconds. The
+    bodies are copied when they are stored and when they are served, so changing a
+    response or the models created from it does not change the cached one
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 30.0) -> None:
+        self._store = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.stats = self._store.stats
+        self._invalidations = 0
+        # the last invalidation of a path itself (False) and of the path or any of
+        # its sub-resources (True), the forgotten ones count as the floor
+        self._stamps: "OrderedDict[Tuple[str, bool], int]" = OrderedDict()
+        self._floor = 0
+
+    def get(self, key: CacheKey) -> Optional[FreshChatResponse]:
+        response = self._store.get(key)
+        return copy_response(response) if response is not None else None
+
+    def set(self, key: CacheKey, response: FreshChatResponse) -> None:
+        self._store.set(key, copy_response(response))
+
+    def generation(self, endpoint: str) -> int:
+        paths = parent_paths(endpoint)
+        return max(
+            self._stamps.get((paths[0], True), self._floor),
+            *(self._stamps.get((path, False), self._floor) for path in paths),
+        )
+
+    def _stamp(self, path: str, subtree: bool) -> None:
+        key = (path, subtree)
+        self._stamps[key] = self._invalidations
+        self._stamps.move_to_end(key)
+        while len(self._stamps) > self._store.maxsize:
+            self._floor = max(self._floor, self._stamps.popitem(last=False)[1])
+
+    def invalidate(self, endpoint: str) -> int:
+        path = normalise_endpoint(endpoint)
+        self._invalidations += 1
+        self._stamp(path, False)
+        for parent in parent_paths(path):
+            self._stamp(parent, True)
+        removed = 0
+        for key in self._store:
+            cached_path = key[0]
+            if (
+                cached_path == path
+                or path.startswith(cached_path + "/")
+                or cached_path.startswith(path + "/")
+            ):
+                self._store.pop(key)
+                removed += 1
+        self.stats.invalidations += removed
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._store)
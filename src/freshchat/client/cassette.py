@@ -0,0 +1,168 @@
+import json
+import queue
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, AnyStr, Dict, Iterable, List, Optional, Tuple
+
+from freshchat.client.responses import FreshChatResponse
+
+REDACTED = "REDACTED"
+REDACTED_HEADERS = frozenset({"authorization", "cookie", "set-cookie"})
+
+# headers describing the transfer of the recorded response which do not apply to
+# the replayed one
+SKIPPED_HEADERS = frozenset(
+    {"content-length", "content-encoding", "transfer-encoding", "connection", "date"}
+)
+
+
+@dataclass
+class Recording:
+    """
+    Class represents one recorded request and its response. The start is the offset
+    in seconds of the request from the creation of the recorder and the duration is
+    the time until its response was read
+    """
+
+    method: str
+    endpoint: str
+    params: Optional[Dict[str, str]] = field(default=None)
+    request_headers: Dict[str, str] = field(default_factory=dict)
+    json: Any = field(default=None)
+    status: int = field(default=200)
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Any = field(default=None)
+    start: float = field(default=0.0)
+    duration: float = field(default=0.0)
+
+    @property
+    def key(self) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+        return request_key(self.method, self.endpoint, self.params)
+
+
+def request_key(
+    method: str, endpoint: str, params: Optional[Dict[AnyStr, Any]] = None
+) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    """
+    Returns the key matching a replayed request with its recordings
+    """
+    return (
+        method.upper(),
+        "/" + endpoint.split("?", 1)[0].strip("/"),
+        tuple(sorted((str(key), str(value)) for key, value in (params or {}).items())),
+    )
+
+
+def redact(
+    headers: Dict[str, Any], names: Iterable[str] = REDACTED_HEADERS
+) -> Dict[str, str]:
+    """
+    Returns a copy of the headers whose values of the given names are redacted
+    """
+    names = {name.lower() for name in names}
+    return {
+        str(key): REDACTED if str(key).lower() in names else str(value)
+        for key, value in headers.items()
+    }
+
+
+class CassetteRecorder:
+    """
+    Class responsible to append the requests of a
+    :class:`freshchat.client.client.FreshChatClient` and their responses to a
+    cassette, a file of one JSON recording per line. The authorisation and cookie
+    headers are redacted before anything is written.
+
+    The recordings are serialised on the event loop and written by a background
+    thread, so recording does not block the loop on the disk. The file is flushed
+    whenever the thread catches up and :meth:`close` waits until all the recordings
+    are written
+    """
+
+    def __init__(
+        self, path: str, redacted_headers: Iterable[str] = REDACTED_HEADERS
+    ) -> None:
+        self.path = path
+        self.redacted_headers = frozenset(name.lower() for name in redacted_headers)
+        self.recorded = 0
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._origin = time.perf_counter()
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[AnyStr, Any]],
+        data: Optional[bytes],
+        headers: Dict[AnyStr, Any],
+        response: FreshChatResponse,
+        started: float,
+    ) -> None:
+        """
+        Appends a request and its response to the cassette
+        :param started: the ``time.perf_counter()`` of the start of the request
+        """
+        try:
+            body = json.loads(data) if data else None
+        except ValueError:
+            body = data.decode("utf-8", "replace")
+        recording = Recording(
+            method=method.upper(),
+            endpoint=endpoint,
+            params={str(k): str(v) for k, v in params.items()} if params else None,
+            request_headers=redact(headers, self.redacted_headers),
+            json=body,
+            status=response.status,
+            headers={
+                key: value
+                for key, value in redact(
+                    response.headers, self.redacted_headers
+                ).items()
+                if key.lower() not in SKIPPED_HEADERS
+            },
+            body=response.body,
+            start=round(started - self._origin, 6),
+            duration=round(time.perf_counter() - started, 6),
+        )
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._write, name="freshchat-cassette", daemon=True
+            )
+            self._writer.start()
+        self._lines.put(json.dumps(asdict(recording), separators=(",", ":")) + "\n")
+        self.recorded += 1
+
+    def _write(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as cassette:
+            while True:
+                line = self._lines.get()
+                if line is None:
+                    return
+                cassette.write(line)
+                if self._lines.empty():
+                    cassette.flush()
+
+    def close(self) -> None:
+        """
+        Waits until the pending recordings are written and closes the cassette
+        """
+        if self._writer is not None:
+            self._lines.put(None)
+            self._writer.join()
+            self._writer = None
+
+    def __enter__(self) -> "CassetteRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_cassette(path: str) -> List[Recording]:
+    """
+    Returns the recordings of a cassette in the order they were recorded
+    """
+    with open(path, encoding="utf-8") as cassette:
+        return [Recording(**json.loads(line)) for line in cassette if line.strip()]
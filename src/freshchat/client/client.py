@@ -1,20 +1,187 @@
-from typing import Any, AnyStr, Dict, Optional
+import asyncio
+import time
+from functools import partial
+from typing import Any, AnyStr, Dict, Hashable, Iterable, Optional
 
 import aiohttp
 from cafeteria.logging import LoggedObject
 
-from freshchat.client.configuration import FreshChatConfiguration
-from freshchat.client.exceptions import HttpResponseCodeError
+from freshchat.client.cache import ResponseCache, cache_key
+from freshchat.client.cassette import CassetteRecorder
+from freshchat.client.codec import STDLIB_CODEC, JSONCodec
+from freshchat.client.configuration import FreshChatConfiguration, PoolConfiguration
+from freshchat.client.exceptions import FreshChatClientException, HttpResponseCodeError
+from freshchat.client.metrics import MetricsHook, RequestMetrics, endpoint_template
+from freshchat.client.ratelimit import RateLimiter
 from freshchat.client.responses import FreshChatResponse
+from freshchat.client.retry import RetryEvent, RetryPolicy
+from freshchat.client.tracing import (
+    RequestTimings,
+    TimingsCallback,
+    create_trace_config,
+)
+
+
+def create_session(
+    pool: Optional[PoolConfiguration] = None,
+    tracing: bool = False,
+    **kwargs: Any,
+) -> aiohttp.ClientSession:
+    """
+    Creates an aiohttp.ClientSession with a connection pool of the given settings
+    :param pool: the settings of the connection pool
+    :param tracing: if True, the session traces the phases of the requests
+    :param kwargs: additional arguments of aiohttp.ClientSession
+    """
+    pool = pool or PoolConfiguration()
+    connector = aiohttp.TCPConnector(
+        limit=pool.limit,
+        limit_per_host=pool.limit_per_host,
+        keepalive_timeout=pool.keepalive_timeout,
+        ttl_dns_cache=pool.ttl_dns_cache,
+        use_dns_cache=pool.ttl_dns_cache is not None,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        trace_configs=[create_trace_config()] if tracing else None,
+        **kwargs,
+    )
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def close_detached(session: aiohttp.ClientSession) -> None:
+    """
+    Closes the connections of a session synchronously, e.g. a session of an event
+    loop which has been closed and can no longer await its closing
+    """
+    connector = session.connector
+    if connector is not None:
+        # BaseConnector.close is a coroutine in recent aiohttp releases while
+        # _close closes the connections synchronously in all of them
+        connector._close()
+    session.detach()
 
 
 class FreshChatClient(LoggedObject):
     """
-    Class represents an HTTP client
+    Class represents an HTTP client. All the requests of a client share one pooled
+    session which is created on the first request and kept alive until
+    :meth:`close` is called, the client can also be used as an async context manager.
+
+    When a :class:`RateLimiter` is given, requests wait for their turn instead of
+    exceeding the quota of the account and when a :class:`RetryPolicy` is given,
+    transient errors are retried on the same pooled session.
+
+    When a :class:`ResponseCache` is given, successful GET responses are served from
+    it and successful requests with any other method invalidate the cached responses
+    of the modified resource. Responses are cached per endpoint, parameters and
+    additional headers.
+
+    When ``coalesce`` is enabled, concurrent identical GET requests of the client
+    share a single in-flight request and its response or error.
+
+    Request and response bodies are encoded and decoded with the given
+    :class:`JSONCodec`, the standard library json module by default.
+
+    Every attempt of a request is reported to the given :class:`MetricsHook`
+    instances, e.g. a :class:`MetricsCollector`. Without hooks, requests are not
+    measured at all.
+
+    When ``tracing`` is enabled or an ``on_timings`` callback is given, the session
+    traces the phases of every attempt, which are available as
+    :attr:`FreshChatResponse.timings` and passed to the callback, also for the
+    attempts which failed.
+
+    When a :class:`CassetteRecorder` is given, every response received is recorded
+    with its request to the cassette of the recorder.
+
+    When an existing ``session`` is given, e.g. one shared by the clients of many
+    accounts, the client sends its requests on it instead of creating its own, and
+    the session is left open when the client is closed
     """
 
-    def __init__(self, config: FreshChatConfiguration) -> None:
+    def __init__(
+        self,
+        config: FreshChatConfiguration,
+        pool: Optional[PoolConfiguration] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        codec: Optional[JSONCodec] = None,
+        hooks: Iterable[MetricsHook] = (),
+        tracing: bool = False,
+        on_timings: Optional[TimingsCallback] = None,
+        recorder: Optional[CassetteRecorder] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self.config = config
+        self.pool = pool or PoolConfiguration()
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.cache = cache
+        self.coalesce = coalesce
+        self.codec = codec or STDLIB_CODEC
+        self.hooks = list(hooks)
+        self.tracing = tracing or on_timings is not None
+        self.on_timings = on_timings
+        self.recorder = recorder
+        self._in_flight: Dict[Hashable, "asyncio.Future[FreshChatResponse]"] = {}
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Property returns the pooled aiohttp.ClientSession, creating it if needed.
+        A session is bound to the event loop which created it, so when the client
+        is used from another loop, e.g. by successive ``asyncio.run`` calls, the
+        connections of the previous session are closed and a new one is created
+        """
+        if not self._owns_session:
+            return self._session
+        loop = _running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or (loop is not None and loop is not self._loop)
+        ):
+            if self._session is not None and not self._session.closed:
+                close_detached(self._session)
+            self._session = create_session(self.pool, tracing=self.tracing)
+            self._loop = loop
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    async def close(self) -> None:
+        """
+        Closes the pooled session and all of its connections, unless the session
+        was given to the client
+        """
+        if not self._owns_session:
+            return
+        if self._session is not None and not self._session.closed:
+            if self._loop is _running_loop():
+                await self._session.close()
+            else:
+                close_detached(self._session)
+        self._session = self._loop = None
+
+    async def __aenter__(self) -> "FreshChatClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def request(
         self,
@@ -32,11 +199,76 @@ class FreshChatClient(LoggedObject):
         :param json: request json body
         :param headers: Additional request headers
         """
-        request_headers = (
-            headers.update(self.config.authorization_header)
-            if headers
-            else self.config.authorization_header
-        )
+        if self.cache is None and not self.coalesce:
+            return await self._request(method, endpoint, params, json, headers)
+
+        if method.upper() != "GET":
+            response = await self._request(method, endpoint, params, json, headers)
+            if self.cache is not None:
+                self.cache.invalidate(endpoint)
+            return response
+
+        key = cache_key(endpoint=endpoint, params=params, headers=headers)
+        generation = None
+        if self.cache is not None:
+            response = self.cache.get(key)
+            if response is not None:
+                return response
+            generation = self.cache.generation(endpoint)
+
+        if self.coalesce:
+            response = await self._coalesced(key, method, endpoint, params, headers)
+        else:
+            response = await self._request(method, endpoint, params, json, headers)
+
+        # the response is stale if the resource was modified while it was fetched
+        if self.cache is not None and self.cache.generation(endpoint) == generation:
+            self.cache.set(key, response)
+        return response
+
+    async def _coalesced(
+        self,
+        key: Hashable,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[AnyStr, Any]],
+        headers: Optional[Dict[AnyStr, Any]],
+    ) -> FreshChatResponse:
+        """
+        Joins the in-flight request with the same key or starts a new one. The
+        request is shielded, so cancelling one of the waiters does not cancel it
+        for the others
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                self._request(method, endpoint, params, None, headers)
+            )
+            self._in_flight[key] = future
+            future.add_done_callback(partial(self._request_landed, key))
+        return await asyncio.shield(future)
+
+    def _request_landed(self, key: Hashable, future: "asyncio.Future") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # the error is raised to the waiters, mark it as retrieved even if all
+            # of them have been cancelled
+            future.exception()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[AnyStr, Any]],
+        json: Optional[Dict[AnyStr, Any]],
+        headers: Optional[Dict[AnyStr, Any]],
+    ) -> FreshChatResponse:
+        request_headers = {**(headers or {}), **self.config.authorization_header}
+        data = None
+        if json is not None:
+            data = self.codec.dumps(json)
+            request_headers.setdefault("Content-Type", "application/json")
 
         url = self.config.get_url(endpoint=endpoint)
 
@@ -48,22 +280,130 @@ class FreshChatClient(LoggedObject):
             headers,
             f"\n> body: {json}" if json else "",
         )
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
+        if self.retry is None:
+            return await self._send(
+                method, endpoint, url, params, data, request_headers
+            )
+
+        start = time.monotonic()
+        attempt = 1
+        while True:
+            try:
+                return await self._send(
+                    method, endpoint, url, params, data, request_headers
+                )
+            except Exception as error:
+                delay = self.retry.next_delay(
+                    method, attempt, error, time.monotonic() - start
+                )
+                if delay is None:
+                    raise
+                self.logger.debug(
+                    "%s %s attempt %d failed with %r, retrying in %.3fs",
+                    method,
+                    url,
+                    attempt,
+                    error,
+                    delay,
+                )
+                if self.retry.on_retry is not None:
+                    self.retry.on_retry(
+                        RetryEvent(
+                            method=method,
+                            endpoint=endpoint,
+                            attempt=attempt,
+                            delay=delay,
+                            exception=error,
+                        )
+                    )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[AnyStr, Any]],
+        data: Optional[bytes],
+        headers: Dict[AnyStr, Any],
+    ) -> FreshChatResponse:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(endpoint)
+        if not self.hooks:
+            return await self._exchange(method, endpoint, url, params, data, headers)
+
+        template = endpoint_template(endpoint)
+        for hook in self.hooks:
+            hook.request_started(method, template)
+        metrics = RequestMetrics(
+            method=method,
+            endpoint=template,
+            duration=0.0,
+            bytes_out=len(data) if data else 0,
+        )
+        start = time.perf_counter()
+        try:
+            response = await self._exchange(
+                method, endpoint, url, params, data, headers
+            )
+            metrics.status, metrics.bytes_in = response.status, response.size
+            return response
+        except BaseException as error:
+            metrics.exception = type(error).__name__
+            if isinstance(error, FreshChatClientException):
+                metrics.status = error.response.status
+                metrics.bytes_in = error.response.size
+            raise
+        finally:
+            metrics.duration = time.perf_counter() - start
+            for hook in self.hooks:
+                hook.request_finished(metrics)
+
+    async def _exchange(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        params: Optional[Dict[AnyStr, Any]],
+        data: Optional[bytes],
+        headers: Dict[AnyStr, Any],
+    ) -> FreshChatResponse:
+        timings = RequestTimings() if self.tracing else None
+        started = time.perf_counter()
+        status = None
+        try:
+            async with self.session.request(
                 method=method,
                 url=url,
                 params=params,
-                json=json,
-                headers=request_headers,
+                data=data,
+                headers=headers,
+                trace_request_ctx=timings,
             ) as response:
-                response = await FreshChatResponse.load(response=response)
-                self.logger.debug(
-                    "%s %s %d \n< %s", method, url, response.http.status, response.body
+                response = await FreshChatResponse.load(
+                    response=response, loads=self.codec.loads, timings=timings
                 )
+                status = response.status
+        finally:
+            if timings is not None:
+                timings.finish(status)
+                if self.on_timings is not None:
+                    self.on_timings(timings)
+
+        if self.recorder is not None:
+            self.recorder.record(
+                method, endpoint, params, data, headers, response, started
+            )
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(endpoint, response.status, response.headers)
+        self.logger.debug(
+            "%s %s %d \n< %s", method, url, response.http.status, response.body
+        )
 
-                if 200 <= response.http.status < 300:
-                    return response
-                raise HttpResponseCodeError(response)
+        if 200 <= response.http.status < 300:
+            return response
+        raise HttpResponseCodeError(response)
 
     async def get(
         self,
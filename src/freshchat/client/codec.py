@@ -0,0 +1,71 @@
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Union
+
+JSONDocument = Union[bytes, bytearray, memoryview, str]
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """
+    Class represents the pair of functions used to encode request bodies to bytes
+    and to decode response bodies from bytes
+    """
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[JSONDocument], Any]
+
+
+def _stdlib_codec() -> JSONCodec:
+    return JSONCodec(
+        name="json", dumps=lambda obj: json.dumps(obj).encode("utf-8"), loads=json.loads
+    )
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    return JSONCodec(name="orjson", dumps=orjson.dumps, loads=orjson.loads)
+
+
+def _ujson_codec() -> JSONCodec:
+    import ujson
+
+    return JSONCodec(
+        name="ujson",
+        dumps=lambda obj: ujson.dumps(obj, ensure_ascii=False).encode("utf-8"),
+        loads=ujson.loads,
+    )
+
+
+CODEC_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+STDLIB_CODEC = _stdlib_codec()
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Returns the codec with the given name. If no name is given, the fastest
+    installed codec is returned, falling back to the standard library
+
+    :param name: one of ``orjson``, ``ujson`` or ``json``
+    :raises ImportError: if the requested codec is not installed
+    """
+    if name is not None:
+        try:
+            factory = CODEC_FACTORIES[name]
+        except KeyError:
+            raise ValueError(f"Unknown JSON codec {name!r}") from None
+        return factory()
+
+    for factory in CODEC_FACTORIES.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+    return STDLIB_CODEC
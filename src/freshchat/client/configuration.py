@@ -40,3 +40,16 @@ class FreshChatConfiguration:
         :return: a string which represents URL
         """
         return urljoin(self.url, endpoint.lstrip("/"))
+
+
+@dataclass
+class PoolConfiguration:
+    """
+    Class represents the connection pool settings of the HTTP session shared by all
+    the requests of a client
+    """
+
+    limit: int = field(default=100)
+    limit_per_host: int = field(default=0)
+    keepalive_timeout: float = field(default=30.0)
+    ttl_dns_cache: Optional[int] = field(default=300)
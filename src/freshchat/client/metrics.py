@@ -0,0 +1,221 @@
+import re
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+ID_SEGMENT = re.compile(r"\d")
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    Returns the endpoint with its resource ids replaced by ``{id}``, e.g.
+    ``/conversations/{id}/messages``, so that the metrics of a resource are not
+    split by id. Path segments containing a digit are considered ids
+    """
+    path = "/" + endpoint.split("?", 1)[0].strip("/")
+    return "/".join(
+        "{id}" if ID_SEGMENT.search(segment) else segment for segment in path.split("/")
+    )
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Class represents the measurements of one attempt of a request. The status is
+    None if no response was received and the exception is the name of the class of
+    the error raised by the attempt, if any
+    """
+
+    method: str
+    endpoint: str
+    duration: float
+    status: Optional[int] = field(default=None)
+    exception: Optional[str] = field(default=None)
+    bytes_out: int = field(default=0)
+    bytes_in: int = field(default=0)
+
+
+class MetricsHook:
+    """
+    Base class of the hooks of :class:`freshchat.client.client.FreshChatClient`
+    which are called around every attempt of a request. The endpoint passed to the
+    hooks is templated with :func:`endpoint_template`
+    """
+
+    def request_started(self, method: str, endpoint: str) -> None:
+        """
+        Method which is called before an attempt is sent
+        """
+
+    def request_finished(self, metrics: RequestMetrics) -> None:
+        """
+        Method which is called once an attempt has completed or failed
+        """
+
+
+@dataclass
+class Histogram:
+    """
+    Class represents a cumulative latency histogram with fixed bucket bounds
+    """
+
+    buckets: Sequence[float] = field(default=DEFAULT_BUCKETS)
+    counts: List[int] = field(default_factory=list)
+    count: int = field(default=0)
+    sum: float = field(default=0.0)
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[int]:
+        """
+        Returns the number of observations lower or equal to each bucket bound
+        """
+        total, cumulative = 0, []
+        for count in self.counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+SeriesKey = Tuple[str, str, str, str]
+
+
+def _format(labels: Dict[str, str]) -> str:
+    return ",".join(
+        '{}="{}"'.format(name, value.replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in labels.items()
+    )
+
+
+def _labels(key: SeriesKey, constant: Dict[str, str], **extra: str) -> str:
+    method, endpoint, status, exception = key
+    return _format(
+        {
+            **constant,
+            "method": method,
+            "endpoint": endpoint,
+            "status": status,
+            "exception": exception,
+            **extra,
+        }
+    )
+
+
+class MetricsCollector(MetricsHook):
+    """
+    Class represents an in-process metrics hook which keeps a latency histogram
+    and the transferred bytes per method, endpoint, status and exception, and
+    renders them in the Prometheus text exposition format. The given labels are
+    added to all the series of the collector, e.g. the account of a client
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        prefix: str = "freshchat",
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.labels = dict(labels or {})
+        self.in_flight = 0
+        self.histograms: Dict[SeriesKey, Histogram] = {}
+        self.bytes_out: Dict[SeriesKey, int] = {}
+        self.bytes_in: Dict[SeriesKey, int] = {}
+
+    def request_started(self, method: str, endpoint: str) -> None:
+        self.in_flight += 1
+
+    def request_finished(self, metrics: RequestMetrics) -> None:
+        self.in_flight -= 1
+        key = (
+            metrics.method,
+            metrics.endpoint,
+            str(metrics.status) if metrics.status is not None else "",
+            metrics.exception or "",
+        )
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(buckets=self.buckets)
+        histogram.observe(metrics.duration)
+        self.bytes_out[key] = self.bytes_out.get(key, 0) + metrics.bytes_out
+        self.bytes_in[key] = self.bytes_in.get(key, 0) + metrics.bytes_in
+
+    def render(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format
+        """
+        return render_metrics([self], prefix=self.prefix)
+
+
+def render_metrics(
+    collectors: Iterable[MetricsCollector], prefix: str = "freshchat"
+) -> str:
+    """
+    Returns the metrics of several collectors, told apart by their labels, in the
+    Prometheus text exposition format
+    """
+    collectors = list(collectors)
+    duration = f"{prefix}_request_duration_seconds"
+    lines = [
+        f"# HELP {duration} Duration of the Freshchat API requests",
+        f"# TYPE {duration} histogram",
+    ]
+    for collector in collectors:
+        for key, histogram in collector.histograms.items():
+            for bound, count in zip(histogram.buckets, histogram.cumulative()):
+                labels = _labels(key, collector.labels, le=str(bound))
+                lines.append(f"{duration}_bucket{{{labels}}} {count}")
+            labels = _labels(key, collector.labels, le="+Inf")
+            lines.append(f"{duration}_bucket{{{labels}}} {histogram.count}")
+            labels = _labels(key, collector.labels)
+            lines.append(f"{duration}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{duration}_count{{{labels}}} {histogram.count}")
+
+    for name, description, attribute in (
+        ("request_bytes_sent_total", "Bytes sent to", "bytes_out"),
+        ("response_bytes_received_total", "Bytes received from", "bytes_in"),
+    ):
+        metric = f"{prefix}_{name}"
+        lines.append(f"# HELP {metric} {description} the Freshchat API")
+        lines.append(f"# TYPE {metric} counter")
+        for collector in collectors:
+            for key, value in getattr(collector, attribute).items():
+                lines.append(f"{metric}{{{_labels(key, collector.labels)}}} {value}")
+
+    in_flight = f"{prefix}_requests_in_flight"
+    lines.append(f"# HELP {in_flight} Freshchat API requests in flight")
+    lines.append(f"# TYPE {in_flight} gauge")
+    for collector in collectors:
+        labels = _format(collector.labels)
+        lines.append(
+            f"{in_flight}{{{labels}}} {collector.in_flight}"
+            if labels
+            else f"{in_flight} {collector.in_flight}"
+        )
+    return "\n".join(lines) + "\n"
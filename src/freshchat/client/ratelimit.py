@@ -0,0 +1,214 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from freshchat.client.cache import normalise_endpoint
+
+LIMIT_HEADERS = ("X-RateLimit-Limit", "X-Ratelimit-Total")
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "X-Ratelimit-Remaining")
+RETRY_AFTER_HEADER = "Retry-After"
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses the value of a Retry-After header which can be either a number of seconds
+    or an HTTP date
+
+    :param value: the value of the header
+    :return: the number of seconds to wait or None if the value is not valid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _header(headers: Mapping[str, str], names: Tuple[str, ...]) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+@dataclass
+class RateLimit:
+    """
+    Class represents a quota of requests allowed in a period of seconds. The burst is
+    the maximum number of requests which can be sent back to back and defaults to
+    the number of requests of the quota
+    """
+
+    requests: int
+    period: float = field(default=60.0)
+    burst: Optional[int] = field(default=None)
+
+
+class TokenBucket:
+    """
+    Class represents a token bucket which refills continuously at the rate of the
+    given limit. Callers acquiring a token queue in order until one is available
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self.capacity = float(limit.burst or limit.requests)
+        self.rate = limit.requests / limit.period
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Waits until a token is available and takes it
+
+        :return: the number of seconds spent waiting
+        """
+        # a lock is bound to the event loop it is first used on, so a new one is
+        # created when the bucket is used from another loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                delay = self.blocked_until - now
+                if delay <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return now - start
+                    delay = (1 - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+
+    def update(
+        self,
+        limit: Optional[float] = None,
+        remaining: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Adjusts the bucket to the quota reported by the server
+
+        :param limit: number of requests allowed in the period of the bucket
+        :param remaining: number of requests remaining in the current period
+        :param retry_after: number of seconds before any request is allowed
+        """
+        now = time.monotonic()
+        self._refill(now)
+        if limit and limit > 0 and self.limit.burst is None:
+            self.capacity = limit
+            self.rate = limit / self.limit.period
+        if remaining is not None:
+            self.tokens = min(self.tokens, max(0.0, remaining))
+        if retry_after is not None:
+            self.tokens = 0.0
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+
+
+class RateLimiter:
+    """
+    Class responsible to pace the requests of a client to stay under the quota of the
+    account and of individual endpoints. Endpoint limits are matched by the longest
+    path prefix, e.g. ``/conversations`` applies to ``/conversations/{id}/messages``.
+
+    If no account limit is given, it is learned from the rate limit headers of the
+    first response which reports one
+    """
+
+    def __init__(
+        self,
+        limit: Optional[RateLimit] = None,
+        endpoints: Optional[Dict[str, RateLimit]] = None,
+        period: float = 60.0,
+    ) -> None:
+        self.period = limit.period if limit else period
+        self.account: Optional[TokenBucket] = TokenBucket(limit) if limit else None
+        self.endpoints: List[Tuple[str, TokenBucket]] = sorted(
+            (
+                (normalise_endpoint(prefix), TokenBucket(endpoint_limit))
+                for prefix, endpoint_limit in (endpoints or {}).items()
+            ),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+
+    def _endpoint_bucket(self, endpoint: str) -> Optional[TokenBucket]:
+        path = normalise_endpoint(endpoint)
+        for prefix, bucket in self.endpoints:
+            if path == prefix or path.startswith(prefix + "/") or prefix == "/":
+                return bucket
+        return None
+
+    def buckets(self, endpoint: str) -> List[TokenBucket]:
+        """
+        Returns the buckets which apply to the given endpoint
+        """
+        endpoint_bucket = self._endpoint_bucket(endpoint)
+        return [
+            bucket for bucket in (self.account, endpoint_bucket) if bucket is not None
+        ]
+
+    async def acquire(self, endpoint: str) -> float:
+        """
+        Waits until a request to the given endpoint is allowed
+
+        :param endpoint: Resource endpoint
+        :return: the number of seconds spent waiting
+        """
+        waited = 0.0
+        for bucket in self.buckets(endpoint):
+            waited += await bucket.acquire()
+        return waited
+
+    def update(self, endpoint: str, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Updates the buckets of the endpoint with the rate limit headers of a response
+
+        :param endpoint: Resource endpoint
+        :param status: http status of the response
+        :param headers: http headers of the response
+        """
+        limit = _header(headers, LIMIT_HEADERS)
+        remaining = _header(headers, REMAINING_HEADERS)
+        retry_after = None
+        if status == 429:
+            retry_after = parse_retry_after(headers.get(RETRY_AFTER_HEADER))
+            if retry_after is None:
+                retry_after = 1.0
+
+        if limit is None and remaining is None and retry_after is None:
+            return
+        if self.account is None and limit:
+            self.account = TokenBucket(
+                RateLimit(requests=int(limit), period=self.period)
+            )
+
+        if self.account is not None:
+            self.account.update(
+                limit=limit, remaining=remaining, retry_after=retry_after
+            )
+        endpoint_bucket = self._endpoint_bucket(endpoint)
+        if endpoint_bucket is not None and retry_after is not None:
+            endpoint_bucket.update(retry_after=retry_after)
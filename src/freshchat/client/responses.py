@@ -1,8 +1,11 @@
 import json
-from typing import Any, AnyStr, Dict, Union
+from typing import Any, AnyStr, Callable, Dict, Optional, Union
 
 from aiohttp import ClientResponse
 
+from freshchat.client.codec import JSONDocument
+from freshchat.client.tracing import RequestTimings
+
 FreshChatResponseBody = Union[str, Dict[AnyStr, Any]]
 
 
@@ -12,10 +15,16 @@ class FreshChatResponse:
     """
 
     def __init__(
-        self, response: ClientResponse, body: FreshChatResponseBody = None
+        self,
+        response: ClientResponse,
+        body: FreshChatResponseBody = None,
+        size: int = 0,
+        timings: Optional[RequestTimings] = None,
     ) -> None:
         self._response = response
         self._body: FreshChatResponseBody = body
+        self._size = size
+        self._timings = timings
 
     @property
     def http(self) -> ClientResponse:
@@ -36,22 +45,50 @@ class FreshChatResponse:
         """
         return self._body
 
+    @property
+    def size(self) -> int:
+        """
+        Property returns the size in bytes of the raw response body
+        """
+        return self._size
+
+    @property
+    def timings(self) -> Optional[RequestTimings]:
+        """
+        Property returns the phase timings of the request if the client traces its
+        requests
+        """
+        return self._timings
+
     @staticmethod
-    def _decode(body: str):
+    def _decode(
+        body: JSONDocument, loads: Callable[[JSONDocument], Any] = json.loads
+    ) -> FreshChatResponseBody:
         try:
-            return json.loads(body)
-        except json.JSONDecodeError:
-            return body
+            return loads(body)
+        except ValueError:
+            return body.decode("utf-8", "replace") if isinstance(body, bytes) else body
 
     @classmethod
-    async def load(cls, response: ClientResponse) -> "FreshChatResponse":
+    async def load(
+        cls,
+        response: ClientResponse,
+        loads: Optional[Callable[[JSONDocument], Any]] = None,
+        timings: Optional[RequestTimings] = None,
+    ) -> "FreshChatResponse":
         """
         Class method creates and returns an instance of the class given
-        an aiohttp.ClientResponse
+        an aiohttp.ClientResponse. JSON bodies are decoded straight from bytes with
+        the given loads function, the standard library one by default
         """
+        raw = await response.read()
         if response.content_type != "application/json":
-            return cls(response, await response.text())
-        return cls(response, await response.json(loads=cls._decode))
+            body = await response.text()
+        elif not raw.strip():
+            body = None
+        else:
+            body = cls._decode(raw, loads or json.loads)
+        return cls(response, body, size=len(raw), timings=timings)
 
     def __getattr__(self, attr):
         return getattr(self.http, attr)
@@ -0,0 +1,102 @@
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Optional, Tuple, Type
+
+import aiohttp
+
+from freshchat.client.exceptions import (
+    FreshChatClientException,
+    ServerSideError,
+    ServerUnavailable,
+    TooManyRequests,
+)
+from freshchat.client.ratelimit import RETRY_AFTER_HEADER, parse_retry_after
+
+
+@dataclass
+class RetryEvent:
+    """
+    Class represents a retry which is about to happen, it is passed to the
+    ``on_retry`` hook of the :class:`RetryPolicy`
+    """
+
+    method: str
+    endpoint: str
+    attempt: int
+    delay: float
+    exception: BaseException
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Class represents the retry policy of a client. Failed requests are retried with
+    exponential backoff and full jitter, unless the server asks for a specific delay
+    with a Retry-After header. Only the given methods are retried, POST requests are
+    not idempotent so they have to be opted in explicitly. Retries stop once either
+    ``max_attempts`` or the ``max_time`` budget in seconds is exhausted
+    """
+
+    max_attempts: int = field(default=3)
+    backoff_factor: float = field(default=0.5)
+    max_backoff: float = field(default=30.0)
+    max_time: Optional[float] = field(default=60.0)
+    methods: FrozenSet[str] = field(default=frozenset({"GET", "PUT"}))
+    exceptions: Tuple[Type[BaseException], ...] = field(
+        default=(
+            ServerUnavailable,
+            ServerSideError,
+            TooManyRequests,
+            aiohttp.ClientConnectionError,
+            asyncio.TimeoutError,
+        )
+    )
+    on_retry: Optional[Callable[[RetryEvent], None]] = field(default=None, repr=False)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns a random delay for the given attempt, bounded by the exponential
+        backoff of the attempt and ``max_backoff``
+
+        :param attempt: the number of the attempt which failed, starting from 1
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(exception: BaseException) -> Optional[float]:
+        """
+        Returns the delay requested by the server in the Retry-After header of the
+        response which caused the exception, if any
+        """
+        if isinstance(exception, FreshChatClientException):
+            headers = getattr(exception.response.http, "headers", None) or {}
+            return parse_retry_after(headers.get(RETRY_AFTER_HEADER))
+        return None
+
+    def next_delay(
+        self, method: str, attempt: int, exception: BaseException, elapsed: float
+    ) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before retrying a failed request or
+        None if it should not be retried
+
+        :param method: http request method
+        :param attempt: the number of the attempt which failed, starting from 1
+        :param exception: the exception raised by the attempt
+        :param elapsed: seconds elapsed since the first attempt
+        """
+        if (
+            attempt >= self.max_attempts
+            or method.upper() not in self.methods
+            or not isinstance(exception, self.exceptions)
+        ):
+            return None
+
+        delay = self.retry_after(exception)
+        if delay is None:
+            delay = self.backoff(attempt)
+        if self.max_time is not None and elapsed + delay > self.max_time:
+            return None
+        return delay
@@ -0,0 +1,166 @@
+import asyncio
+import threading
+from concurrent.futures import TimeoutError
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import FreshChatConfiguration
+from freshchat.models import Channel, Channels, Conversation, Message, User
+
+T = TypeVar("T")
+
+
+class SyncFreshChatClient:
+    """
+    Class represents a blocking facade of :class:`FreshChatClient` for synchronous
+    code, e.g. Celery tasks or Django views. The asynchronous client runs on one
+    event loop in a background thread, started on first use, so all the calls
+    share its pooled session. The facade is thread-safe: any number of threads can
+    call it concurrently and their requests are multiplexed on the pool.
+
+    The calls wait at most ``timeout`` seconds, if given, and the other keyword
+    arguments are passed to :class:`FreshChatClient`::
+
+        client = SyncFreshChatClient(config, retry=RetryPolicy())
+        user = client.get_user("user_id")
+        client.close()
+    """
+
+    def __init__(
+        self,
+        config: FreshChatConfiguration,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.client = FreshChatClient(config=config, **kwargs)
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> FreshChatConfiguration:
+        return self.client.config
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Property returns the event loop of the background thread, starting it if
+        needed
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, ready),
+                    name="freshchat-loop",
+                    daemon=True,
+                )
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """
+        Runs a coroutine on the background loop and blocks until its result
+        :param awaitable: the coroutine to run
+        :param timeout: the timeout in seconds, the default timeout if not given
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            if asyncio.iscoroutine(awaitable):
+                # the coroutine is never scheduled, close it to avoid a warning
+                awaitable.close()
+            raise RuntimeError("The synchronous client cannot be called from its loop")
+        future = asyncio.run_coroutine_threadsafe(awaitable, loop)
+        try:
+            return future.result(timeout if timeout is not None else self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def call(
+        self, function: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Runs an async function taking the client as its first argument, e.g. a
+        method of the models, and blocks until its result
+        """
+        return self.run(function(self.client, *args, **kwargs))
+
+    def request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        return self.run(self.client.request(method, endpoint, **kwargs))
+
+    def get(self, endpoint: str, **kwargs: Any) -> Any:
+        return self.run(self.client.get(endpoint, **kwargs))
+
+    def post(self, endpoint: str, **kwargs: Any) -> Any:
+        return self.run(self.client.post(endpoint, **kwargs))
+
+    def put(self, endpoint: str, **kwargs: Any) -> Any:
+        return self.run(self.client.put(endpoint, **kwargs))
+
+    def create_user(self, **kwargs: Any) -> User:
+        return self.call(User.create, **kwargs)
+
+    def get_user(self, user_id: str) -> User:
+        return self.call(User.get, user_id=user_id)
+
+    def create_conversation(self, **kwargs: Any) -> Conversation:
+        return self.call(Conversation.create, **kwargs)
+
+    def get_conversation(self, conversation_id: str, **kwargs: Any) -> Conversation:
+        return self.call(Conversation.get, conversation_id=conversation_id, **kwargs)
+
+    def send_message(
+        self, conversation: Conversation, message: str, **kwargs: Any
+    ) -> Message:
+        return self.run(conversation.send(self.client, message, **kwargs))
+
+    def resolve_conversation(self, conversation: Conversation) -> Conversation:
+        return self.run(conversation.resolve(self.client))
+
+    def get_channels(self) -> List[Channel]:
+        return self.call(Channels.get)
+
+    def list_channels(self, page_size: Optional[int] = None) -> List[Channel]:
+        """
+        Returns all the channels, following the pages of the list
+        """
+
+        async def collect() -> List[Channel]:
+            return [
+                channel
+                async for channel in Channels.iter(self.client, page_size=page_size)
+            ]
+
+        return self.run(collect())
+
+    def close(self) -> None:
+        """
+        Closes the pooled session and stops the background loop
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.client.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def __enter__(self) -> "SyncFreshChatClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,227 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import aiohttp
+
+from freshchat.client.cache import ResponseCache
+from freshchat.client.client import FreshChatClient, create_session
+from freshchat.client.configuration import FreshChatConfiguration, PoolConfiguration
+from freshchat.client.metrics import MetricsCollector, render_metrics
+from freshchat.client.ratelimit import RateLimiter
+
+
+@dataclass
+class Tenant:
+    """
+    Class represents the client of an account of a :class:`TenantClientPool` and
+    the time it was last used
+    """
+
+    client: FreshChatClient
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class TenantClientPool:
+    """
+    Class represents a registry of the clients of many Freshchat accounts. The
+    clients are created on first use from the registered configuration of their
+    account and send their requests on one shared session, so the sockets are
+    pooled across accounts. Cookies are never stored, so they cannot leak from an
+    account to another.
+
+    Each account has its own rate limiter, created with ``rate_limiter``, its own
+    response cache, created with ``cache``, and its own :class:`MetricsCollector`
+    labelled with the account if ``metrics`` is enabled. Caches are never shared,
+    so an account cannot be served the cached responses of another.
+
+    Clients unused for ``idle_timeout`` seconds are evicted along with their cache,
+    and the least recently used ones are evicted when there are more than
+    ``max_tenants``. Evicted clients are created again on their next use. The rate
+    limiters and the metrics of the accounts are kept until they are unregistered,
+    so an evicted account does not come back with a full quota nor reset counters.
+
+    When ``tracing`` is enabled or an ``on_timings`` callback is given, the clients
+    trace their requests on the shared session. The other keyword arguments are
+    passed to every :class:`FreshChatClient`::
+
+        async with TenantClientPool(retry=RetryPolicy()) as tenants:
+            tenants.register("acme", FreshChatConfiguration(app_id=..., token=...))
+            user = await User.get(tenants.client("acme"), user_id)
+    """
+
+    def __init__(
+        self,
+        pool: Optional[PoolConfiguration] = None,
+        rate_limiter: Optional[Callable[[], RateLimiter]] = RateLimiter,
+        cache: Optional[Callable[[], ResponseCache]] = None,
+        metrics: bool = False,
+        idle_timeout: Optional[float] = 600.0,
+        max_tenants: Optional[int] = None,
+        tracing: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        if isinstance(cache, ResponseCache):
+            raise TypeError("The cache of the accounts is created with a factory")
+        self.pool = pool or PoolConfiguration()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.metrics = metrics
+        self.idle_timeout = idle_timeout
+        self.max_tenants = max_tenants
+        self.tracing = tracing or kwargs.get("on_timings") is not None
+        self.client_kwargs = kwargs
+        self.evicted = 0
+        self.configurations: Dict[str, FreshChatConfiguration] = {}
+        self.rate_limiters: Dict[str, RateLimiter] = {}
+        self.collectors: Dict[str, MetricsCollector] = {}
+        self._tenants: "OrderedDict[str, Tenant]" = OrderedDict()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._last_eviction = time.monotonic()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Property returns the session shared by all the clients, creating it if
+        needed
+        """
+        if self._session is None or self._session.closed:
+            self._session = create_session(
+                self.pool,
+                tracing=self.tracing,
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+        return self._session
+
+    def register(self, tenant_id: str, config: FreshChatConfiguration) -> None:
+        """
+        Registers or replaces the configuration of an account
+        :param tenant_id: the id of the account in the application
+        :param config: the configuration of the account
+        """
+        self.configurations[tenant_id] = config
+        self._tenants.pop(tenant_id, None)
+
+    def unregister(self, tenant_id: str) -> None:
+        """
+        Removes an account, its client, its rate limiter and its metrics
+        """
+        self.configurations.pop(tenant_id, None)
+        self.rate_limiters.pop(tenant_id, None)
+        self.collectors.pop(tenant_id, None)
+        self._tenants.pop(tenant_id, None)
+
+    def client(
+        self, tenant_id: str, config: Optional[FreshChatConfiguration] = None
+    ) -> FreshChatClient:
+        """
+        Returns the client of an account, creating it if needed
+        :param tenant_id: the id of the account in the application
+        :param config: the configuration of the account, registered if given
+        """
+        if config is not None and self.configurations.get(tenant_id) != config:
+            self.register(tenant_id, config)
+        self._evict_idle_periodically()
+
+        tenant = self._tenants.get(tenant_id)
+        if tenant is None:
+            tenant = self._tenants[tenant_id] = self._create(tenant_id)
+            if self.max_tenants is not None:
+                while len(self._tenants) > self.max_tenants:
+                    self._tenants.popitem(last=False)
+                    self.evicted += 1
+        else:
+            self._tenants.move_to_end(tenant_id)
+        tenant.last_used = time.monotonic()
+        return tenant.client
+
+    def _create(self, tenant_id: str) -> Tenant:
+        config = self.configurations.get(tenant_id)
+        if config is None:
+            raise KeyError(f"Unknown tenant {tenant_id}")
+        rate_limiter = self.rate_limiters.get(tenant_id)
+        if rate_limiter is None and self.rate_limiter is not None:
+            rate_limiter = self.rate_limiters[tenant_id] = self.rate_limiter()
+        kwargs = dict(self.client_kwargs)
+        if self.metrics:
+            collector = self.collectors.get(tenant_id)
+            if collector is None:
+                collector = self.collectors[tenant_id] = MetricsCollector(
+                    labels={"tenant": tenant_id}
+                )
+            kwargs["hooks"] = [*kwargs.get("hooks", ()), collector]
+        client = FreshChatClient(
+            config=config,
+            pool=self.pool,
+            rate_limiter=rate_limiter,
+            cache=self.cache() if self.cache is not None else None,
+            tracing=self.tracing,
+            session=self.session,
+            **kwargs,
+        )
+        return Tenant(client=client)
+
+    def _evict_idle_periodically(self) -> None:
+        if self.idle_timeout is None:
+            return
+        now = time.monotonic()
+        if now - self._last_eviction >= self.idle_timeout / 10:
+            self._last_eviction = now
+            self.evict_idle(now)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Evicts the clients unused for ``idle_timeout`` seconds
+        :return: the number of evicted clients
+        """
+        if self.idle_timeout is None:
+            return 0
+        deadline = (now if now is not None else time.monotonic()) - self.idle_timeout
+        # the tenants are ordered from the least to the most recently used
+        idle: List[str] = []
+        for tenant_id, tenant in self._tenants.items():
+            if tenant.last_used > deadline:
+                break
+            idle.append(tenant_id)
+        for tenant_id in idle:
+            del self._tenants[tenant_id]
+        self.evicted += len(idle)
+        return len(idle)
+
+    def tenant_metrics(self, tenant_id: str) -> Optional[MetricsCollector]:
+        """
+        Returns the metrics collector of an account, created with its first client
+        """
+        return self.collectors.get(tenant_id)
+
+    def render_metrics(self) -> str:
+        """
+        Returns the metrics of the accounts, labelled with their id, in the
+        Prometheus text exposition format
+        """
+        return render_metrics(self.collectors.values())
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return tenant_id in self._tenants
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._tenants))
+
+    def __len__(self) -> int:
+        return len(self._tenants)
+
+    async def close(self) -> None:
+        """
+        Drops all the clients and closes the shared session
+        """
+        self._tenants.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "TenantClientPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
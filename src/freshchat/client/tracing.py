@@ -0,0 +1,126 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+
+@dataclass
+class RequestTimings:
+    """
+    Class represents the duration in seconds of the phases of one attempt of a
+    request, recorded with an aiohttp TraceConfig. Phases which did not happen,
+    e.g. the connection of a request reusing a pooled connection, are None.
+
+    :param queued: waiting for a free connection of the pool
+    :param dns: resolving the host name, None on a DNS cache hit
+    :param connect: establishing a new connection, including the DNS resolution and
+    the TLS handshake
+    :param ttfb: from sending the request until its response headers are received,
+    from the start of the request with aiohttp older than 3.8
+    :param transfer: reading and decoding the response body
+    :param total: from the start of the request until its body is read
+    """
+
+    method: Optional[str] = field(default=None)
+    url: Optional[str] = field(default=None)
+    status: Optional[int] = field(default=None)
+    reused_connection: bool = field(default=False)
+    queued: Optional[float] = field(default=None)
+    dns: Optional[float] = field(default=None)
+    connect: Optional[float] = field(default=None)
+    ttfb: Optional[float] = field(default=None)
+    transfer: Optional[float] = field(default=None)
+    total: Optional[float] = field(default=None)
+    started: float = field(default_factory=time.perf_counter, repr=False)
+    marks: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    def mark(self, name: str) -> None:
+        self.marks[name] = time.perf_counter()
+
+    def elapsed(self, name: str) -> Optional[float]:
+        """
+        Returns the seconds elapsed since the mark of the given name, if any
+        """
+        start = self.marks.get(name)
+        return time.perf_counter() - start if start is not None else None
+
+    def finish(self, status: Optional[int] = None) -> None:
+        """
+        Records the end of the attempt once its response body is read or it failed
+        """
+        self.status = status
+        if self.ttfb is not None:
+            self.transfer = self.elapsed("response")
+        self.total = time.perf_counter() - self.started
+
+
+TimingsCallback = Callable[[RequestTimings], Any]
+
+
+def _timings(context: Any) -> Optional[RequestTimings]:
+    timings = context.trace_request_ctx
+    return timings if isinstance(timings, RequestTimings) else None
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Creates an aiohttp TraceConfig which records the phases of the requests on
+    the :class:`RequestTimings` given as their ``trace_request_ctx``, requests
+    without one are not traced
+    """
+    trace_config = aiohttp.TraceConfig()
+
+    def start(name: str):
+        async def callback(_, context, __) -> None:
+            timings = _timings(context)
+            if timings is not None:
+                timings.mark(name)
+
+        return callback
+
+    def end(name: str):
+        async def callback(_, context, __) -> None:
+            timings = _timings(context)
+            if timings is not None:
+                setattr(timings, name, timings.elapsed(name))
+
+        return callback
+
+    async def on_request_start(_, context, params) -> None:
+        timings = _timings(context)
+        if timings is not None:
+            timings.method = params.method
+            timings.url = str(params.url)
+            timings.mark("ttfb")
+
+    async def on_request_headers_sent(_, context, __) -> None:
+        timings = _timings(context)
+        if timings is not None:
+            timings.mark("ttfb")
+
+    async def on_request_end(_, context, __) -> None:
+        timings = _timings(context)
+        if timings is not None:
+            timings.ttfb = timings.elapsed("ttfb")
+            timings.mark("response")
+
+    async def on_connection_reuseconn(_, context, __) -> None:
+        timings = _timings(context)
+        if timings is not None:
+            timings.reused_connection = True
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_queued_start.append(start("queued"))
+    trace_config.on_connection_queued_end.append(end("queued"))
+    trace_config.on_dns_resolvehost_start.append(start("dns"))
+    trace_config.on_dns_resolvehost_end.append(end("dns"))
+    trace_config.on_connection_create_start.append(start("connect"))
+    trace_config.on_connection_create_end.append(end("connect"))
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    # the signal was added in aiohttp 3.8, before it the ttfb includes the
+    # connection phases
+    if hasattr(trace_config, "on_request_headers_sent"):
+        trace_config.on_request_headers_sent.append(on_request_headers_sent)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
@@ -1,11 +1,29 @@
-from dataclasses import asdict, dataclass, field
-from typing import Any, AnyStr, ClassVar, Dict, List, Optional, Union
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, AnyStr, AsyncIterator, ClassVar, Dict, List, Optional, Union
 
 from freshchat.client.client import FreshChatClient
+from freshchat.models.base import Model, slotted
+from freshchat.models.pagination import paginate
 
+FROM_TIME_PARAM = "from_time"
 
+
+def format_time(value: datetime) -> str:
+    """
+    Returns a datetime in the ISO 8601 format of Freshchat API, naive datetimes are
+    considered in UTC
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+@slotted
 @dataclass
-class User:
+class User(Model):
     """
     Class which represents a freshchat user. A user can be an external user or an
     agent
@@ -32,8 +50,8 @@ class User:
         Creates a new user instance with the given kwargs
         """
         user = cls(**kwargs)
-        response = await client.post(endpoint=user.endpoint, json=asdict(user))
-        return cls(**response.body)
+        response = await client.post(endpoint=user.endpoint, json=user.to_payload())
+        return cls.from_payload(response.body)
 
     @classmethod
     async def get(cls, client: FreshChatClient, user_id: str) -> "User":
@@ -42,11 +60,12 @@ class User:
         """
         user = cls(id=user_id)
         response = await client.get(user.get_endpoint)
-        return cls(**response.body)
+        return cls.from_payload(response.body)
 
 
+@slotted
 @dataclass
-class Message:
+class Message(Model):
     """
     Class which represents freshchat message format
     """
@@ -66,8 +85,9 @@ class Message:
         return f"/conversations/{self.conversation_id}/messages"
 
 
+@slotted
 @dataclass
-class Conversation:
+class Conversation(Model):
     """
     Class which represents freshchat conversation format
     """
@@ -97,9 +117,11 @@ class Conversation:
     async def create(
         cls,
         client: FreshChatClient,
-        user_id: str,
+        user_id: Optional[str] = None,
         channel_id: Optional[str] = None,
         init_message: Optional[str] = None,
+        user: Optional[User] = None,
+        fetch_user: bool = True,
     ) -> "Conversation":
         """
         Create a new conversation instance
@@ -107,58 +129,79 @@ class Conversation:
         :param user_id: the id of the user who creates the conversation
         :param channel_id: the id of the channel which the conversation will be assigned
         :param init_message: the initial message of the conversation
+        :param user: an already loaded user, the user is not fetched when it is given
+        :param fetch_user: if False, the user is not fetched and only its id is sent
         :return: an instance of the class with the additional information returned from
         Freshchat API
         """
-        user = await User().get(client=client, user_id=user_id)
-        conversation_body = {
-            "app_id": client.config.app_id,
-            "channel_id": channel_id or client.config.default_channel_id,
-            "users": [asdict(user)],
-            "messages": [
-                asdict(
-                    Message(
-                        **{
-                            "app_id": client.config.app_id,
-                            "actor_id": user.id,
-                            "channel_id": channel_id
-                            or client.config.default_channel_id,
-                            "message_parts": [{"text": {"content": init_message}}],
-                        }
-                    )
+        if user is None:
+            user = (
+                await User.get(client=client, user_id=cls._user_id(user_id))
+                if fetch_user
+                else User(id=cls._user_id(user_id))
+            )
+        channel_id = channel_id or client.config.default_channel_id
+        conversation = cls(
+            app_id=client.config.app_id,
+            channel_id=channel_id,
+            users=[user],
+            messages=[
+                Message(
+                    app_id=client.config.app_id,
+                    actor_id=user.id,
+                    channel_id=channel_id,
+                    message_parts=[{"text": {"content": init_message}}],
                 )
             ],
-        }
-
-        conversation = cls(**conversation_body)
+        )
 
         response = await client.post(
-            endpoint=conversation.endpoint, json=asdict(conversation)
+            endpoint=conversation.endpoint, json=conversation.to_payload()
         )
-        conversation = cls(**response.body)
+        conversation = cls.from_payload(response.body)
         conversation.users = [user]
         return conversation
 
     @classmethod
     async def get(
-        cls, client: FreshChatClient, conversation_id: str, user_id: str
+        cls,
+        client: FreshChatClient,
+        conversation_id: str,
+        user_id: Optional[str] = None,
+        user: Optional[User] = None,
+        fetch_user: bool = True,
     ) -> "Conversation":
         """
-        Method which returns an existing conversation based on the conversation_id
+        Method which returns an existing conversation based on the conversation_id.
+        The user and the conversation are fetched concurrently
         :param client: FreshChatClient to make the necessary requests
         :param conversation_id: the id of the conversation
         :param user_id: the id of the user
+        :param user: an already loaded user, the user is not fetched when it is given
+        :param fetch_user: if False, the user is not fetched and the users of the
+        conversation are the ones returned from Freshchat API
         :return: an instance of the class with the additional information returned from
         Freshchat API
         """
-
-        user = await User().get(client=client, user_id=user_id)
         conversation = cls(conversation_id=conversation_id)
-        response = await client.get(conversation.get_endpoint)
-        conversation = cls(**response.body)
-        conversation.users = [user]
+        if user is None and fetch_user:
+            user, response = await asyncio.gather(
+                User.get(client=client, user_id=cls._user_id(user_id)),
+                client.get(conversation.get_endpoint),
+            )
+        else:
+            response = await client.get(conversation.get_endpoint)
+        conversation = cls.from_payload(response.body)
+        if user is not None:
+            conversation.users = [user]
         return conversation
 
+    @staticmethod
+    def _user_id(user_id: Optional[str]) -> str:
+        if user_id is None:
+            raise ValueError("Either a user or a user_id is required")
+        return user_id
+
     async def send(
         self,
         client: FreshChatClient,
@@ -187,9 +230,9 @@ class Conversation:
 
         message_model = Message(**properties)
         response = await client.post(
-            endpoint=message_model.endpoint, json=asdict(message_model)
+            endpoint=message_model.endpoint, json=message_model.to_payload()
         )
-        return Message(**response.body)
+        return Message.from_payload(response.body)
 
     async def resolve(self, client: FreshChatClient) -> "Conversation":
         """
@@ -200,11 +243,45 @@ class Conversation:
         """
         status = {"status": "resolved"}
         response = await client.put(endpoint=self.get_endpoint, json=status)
-        return Conversation(**response.body)
-
+        return Conversation.from_payload(response.body)
 
+    async def iter_messages(
+        self,
+        client: FreshChatClient,
+        since: Optional[Union[str, datetime]] = None,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Message]:
+        """
+        Iterates over the messages of the conversation one at a time, following the
+        pages of its transcript, so at most two pages are held in memory
+        :param client: FreshChatClient to make the necessary requests
+        :param since: only the messages created from this time are returned, naive
+        datetimes are in UTC
+        :param page_size: the number of messages requested per page
+        :param prefetch: if True, the next page is fetched while the current one is
+        consumed
+        """
+        params = {}
+        if since is not None:
+            params[FROM_TIME_PARAM] = (
+                format_time(since) if isinstance(since, datetime) else since
+            )
+        async for message in paginate(
+            client=client,
+            endpoint=f"{self.get_endpoint}/messages",
+            key="messages",
+            factory=Message.from_payload,
+            page_size=page_size,
+            params=params,
+            prefetch=prefetch,
+        ):
+            yield message
+
+
+@slotted
 @dataclass
-class Group:
+class Group(Model):
     """
     Class which represents freshchat group format
     """
@@ -215,8 +292,9 @@ class Group:
     routing_type: Optional[str] = field(default=None)
 
 
+@slotted
 @dataclass
-class Channel:
+class Channel(Model):
     """
     Class which represents freshchat channel object
     """
@@ -231,8 +309,9 @@ class Channel:
     welcome_message: Optional[Dict[Any, Any]] = field(default_factory=dict)
 
 
+@slotted
 @dataclass
-class Channels:
+class Channels(Model):
     """
     Class which represents freshchat channels. It is the returning
     value of get channels request
@@ -250,10 +329,35 @@ class Channels:
         Returns a list of Channel
         """
         response = await client.get(Channels().endpoint)
-        return Channels(**response.body).channels
-
+        return Channels.from_payload(response.body).channels
 
+    @classmethod
+    async def iter(
+        cls,
+        client: FreshChatClient,
+        page_size: Optional[int] = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Channel]:
+        """
+        Iterates over all the channels, following the pages of the list
+        :param client: FreshChatClient to make the necessary requests
+        :param page_size: the number of channels requested per page
+        :param prefetch: if True, the next page is fetched while the current one is
+        consumed
+        """
+        async for channel in paginate(
+            client=client,
+            endpoint=cls.endpoint,
+            key="channels",
+            factory=Channel.from_payload,
+            page_size=page_size,
+            prefetch=prefetch,
+        ):
+            yield channel
+
+
+@slotted
 @dataclass
-class Actor:
+class Actor(Model):
     actor_type: Optional[str] = field(default=None)
     actor_id: Optional[str] = field(default=None)
@@ -0,0 +1,88 @@
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, FrozenSet, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Class decorator which rebuilds a dataclass with ``__slots__`` for its fields, so
+    its instances do not carry a per-instance ``__dict__``. It has to be applied on
+    top of the ``@dataclass`` decorator, class variables and properties are kept
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+
+    names = tuple(f.name for f in fields(cls))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in names and key not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = names
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+_FIELD_SETS: Dict[type, FrozenSet[str]] = {}
+
+
+def field_names(cls: type) -> Tuple[str, ...]:
+    """
+    Returns the names of the fields of a dataclass, computed once per class
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def _field_set(cls: type) -> FrozenSet[str]:
+    names = _FIELD_SETS.get(cls)
+    if names is None:
+        names = _FIELD_SETS[cls] = frozenset(field_names(cls))
+    return names
+
+
+def _payload_value(value: Any) -> Any:
+    if isinstance(value, Model):
+        return value.to_payload()
+    if isinstance(value, list):
+        return [_payload_value(item) for item in value]
+    return value
+
+
+class Model:
+    """
+    Base class of the Freshchat models which provides their wire format
+    serialisation
+    """
+
+    __slots__ = ()
+
+    def to_payload(self) -> Dict[str, Any]:
+        """
+        Returns the payload of the model to be sent to Freshchat API. Fields which
+        are None or empty lists and dictionaries are left out, nested models are
+        serialised and any other value is passed as it is without being copied
+        """
+        payload = {}
+        for name in field_names(type(self)):
+            value = getattr(self, name)
+            if value is None or (isinstance(value, (list, dict)) and not value):
+                continue
+            payload[name] = _payload_value(value)
+        return payload
+
+    @classmethod
+    def from_payload(cls: Type[T], payload: Dict[str, Any]) -> T:
+        """
+        Creates an instance of the model from a payload returned by Freshchat API,
+        keys which are not fields of the model are ignored
+        """
+        names = _field_set(cls)
+        if names.issuperset(payload):
+            return cls(**payload)
+        return cls(**{key: value for key, value in payload.items() if key in names})
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from freshchat.client.client import FreshChatClient
+from freshchat.models import Conversation, Message
+
+BulkItem = Union[Tuple[Conversation, str], Tuple[Conversation, str, Dict[str, Any]]]
+
+
+@dataclass
+class BulkItemResult:
+    """
+    Class which represents the outcome of a single message of a bulk send, it holds
+    either the sent message or the exception raised while sending it
+    """
+
+    conversation: Conversation
+    message: Optional[Message] = field(default=None)
+    exception: Optional[Exception] = field(default=None)
+    latency: float = field(default=0.0)
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+
+@dataclass
+class BulkResult:
+    """
+    Class which represents the outcome of a bulk send. The results are in the same
+    order as the given items
+    """
+
+    results: List[BulkItemResult] = field(default_factory=list)
+    elapsed: float = field(default=0.0)
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for result in self.results if result.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    @property
+    def throughput(self) -> float:
+        """
+        Property returns the number of messages sent per second
+        """
+        return len(self.results) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        if not self.results:
+            return 0.0
+        return sum(result.latency for result in self.results) / len(self.results)
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Returns the latency of the given percentile, e.g. 99 for p99
+        """
+        latencies = sorted(result.latency for result in self.results)
+        if not latencies:
+            return 0.0
+        index = max(
+            0, min(len(latencies) - 1, round(percentile / 100 * len(latencies)) - 1)
+        )
+        return latencies[index]
+
+
+async def _send_item(client: FreshChatClient, item: BulkItem) -> BulkItemResult:
+    conversation, message, *rest = item
+    kwargs = dict(rest[0]) if rest else {}
+    result = BulkItemResult(conversation=conversation)
+    start = time.perf_counter()
+    try:
+        result.message = await conversation.send(
+            client=client, message=message, **kwargs
+        )
+    except Exception as error:
+        result.exception = error
+    result.latency = time.perf_counter() - start
+    return result
+
+
+async def send_bulk(
+    client: FreshChatClient, items: Iterable[BulkItem], concurrency: int = 10
+) -> BulkResult:
+    """
+    Sends messages to many conversations with at most ``concurrency`` requests in
+    flight. A failing message does not stop the others, its exception is returned
+    in its result instead
+
+    :param client: FreshChatClient to make the necessary requests
+    :param items: tuples of a conversation, the message to send and optionally the
+    additional message properties passed to :meth:`Conversation.send`
+    :param concurrency: the maximum number of messages sent at the same time
+    :return: a BulkResult with one result per item, in the order of the items
+    """
+    pending: Sequence[BulkItem] = list(items)
+    results: List[Optional[BulkItemResult]] = [None] * len(pending)
+    indexes = iter(range(len(pending)))
+
+    async def worker() -> None:
+        for index in indexes:
+            results[index] = await _send_item(client, pending[index])
+
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(worker() for _ in range(max(1, min(concurrency, len(pending)))))
+    )
+    return BulkResult(results=results, elapsed=time.perf_counter() - start)
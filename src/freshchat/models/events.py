@@ -1,11 +1,13 @@
-from dataclasses import asdict, dataclass, field
-from typing import Any, AnyStr, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, AnyStr, Callable, Dict, Iterable, List, Optional, Union
 
-from freshchat.models import Actor, Conversation
+from freshchat.models import Actor, Conversation, User
+from freshchat.models.base import Model, slotted
 
 
+@slotted
 @dataclass
-class Message:
+class Message(Model):
     """
     Class which represents freshchat new message event
     """
@@ -25,17 +27,19 @@ class Message:
 
     @classmethod
     def create(cls, incoming_message: Dict[AnyStr, AnyStr]) -> "Message":
+        incoming_message = dict(incoming_message)
         conversation = Conversation(
             conversation_id=incoming_message.pop("conversation_id"),
             channel_id=incoming_message.pop("channel_id"),
             app_id=incoming_message.pop("app_id"),
         )
-        incoming_message["conversation"] = asdict(conversation)
+        incoming_message["conversation"] = conversation
         return cls(**incoming_message)
 
 
+@slotted
 @dataclass
-class Reopen:
+class Reopen(Model):
     """
     Class which represents freshchat conversation reopen event
     """
@@ -49,8 +53,9 @@ class Reopen:
             self.conversation = Conversation(**self.conversation)
 
 
+@slotted
 @dataclass
-class Resolve:
+class Resolve(Model):
     """
     Class which represents freshchat conversation resolve event
     """
@@ -64,8 +69,29 @@ class Resolve:
             self.conversation = Conversation(**self.conversation)
 
 
+@slotted
 @dataclass
-class IncomingEvent:
+class Assignment(Model):
+    """
+    Class which represents freshchat conversation assignment event
+    """
+
+    assignor: str = field(default=None)
+    assignor_id: str = field(default=None)
+    to_agent_id: Optional[str] = field(default=None)
+    to_group_id: Optional[str] = field(default=None)
+    from_agent_id: Optional[str] = field(default=None)
+    from_group_id: Optional[str] = field(default=None)
+    conversation: Conversation = field(default_factory=Conversation)
+
+    def __post_init__(self):
+        if isinstance(self.conversation, dict):
+            self.conversation = Conversation(**self.conversation)
+
+
+@slotted
+@dataclass
+class IncomingEvent(Model):
     """
     Class which accepts an incoming event and based on the type creates the
     corresponding event
@@ -77,12 +103,187 @@ class IncomingEvent:
     data: Any = field(default_factory=None)
 
     def __post_init__(self):
-        if isinstance(self.data, dict):
-            if "message" in self.data:
-                self.data = Message.create(self.data.get("message"))
-            elif "resolve" in self.data:
-                self.data = Resolve(**self.data.get("resolve"))
-            elif "reopen" in self.data:
-                self.data = Reopen(**self.data.get("reopen"))
+        self.data = parse_event_data(self.data, self.action)
         if isinstance(self.actor, dict):
             self.actor = Actor(**self.actor)
+
+    @property
+    def conversation_id(self) -> Optional[str]:
+        """
+        Property returns the id of the conversation of the event, if any
+        """
+        conversation = getattr(self.data, "conversation", None)
+        return getattr(conversation, "conversation_id", None)
+
+    @classmethod
+    def lazy(cls, payload: Dict[str, Any]) -> "LazyIncomingEvent":
+        """
+        Returns a lazy event of the payload whose data is parsed on first access
+        """
+        return LazyIncomingEvent(payload)
+
+
+EventFactory = Callable[[Dict[AnyStr, Any]], Any]
+
+
+class EventRegistry:
+    """
+    Class which maps the payload keys of the incoming event data, e.g. ``message``,
+    and the event actions, e.g. ``message_create``, to the models which parse them.
+    Applications can register additional Freshchat event types on
+    :data:`event_registry`
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, EventFactory] = {}
+        self._keys: Dict[str, str] = {}
+
+    def register(
+        self,
+        key: str,
+        factory: Union[EventFactory, type],
+        actions: Iterable[str] = (),
+    ) -> None:
+        """
+        Registers the model of a payload key
+        :param key: the key of the payload in the event data
+        :param factory: a callable creating the event model from the payload or a
+        model class, which is created with its ``from_payload``
+        :param actions: the event actions whose payload is found under the key
+        """
+        if isinstance(factory, type) and issubclass(factory, Model):
+            factory = factory.from_payload
+        self._factories[key] = factory
+        for action in actions:
+            self._keys[action] = key
+
+    def key(self, action: Optional[str]) -> Optional[str]:
+        """
+        Returns the payload key registered for the action, if any
+        """
+        return self._keys.get(action)
+
+    def parse(self, data: Any, action: Optional[str] = None) -> Any:
+        """
+        Creates the event model of the data, using the key registered for the
+        action and falling back to the keys found in the data. Data of unknown
+        types is returned as it is
+        """
+        if not isinstance(data, dict):
+            return data
+        key = self._keys.get(action)
+        if key is not None and key in data:
+            return self._factories[key](data[key])
+        for key, payload in data.items():
+            factory = self._factories.get(key)
+            if factory is not None:
+                return factory(payload)
+        return data
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._factories
+
+
+event_registry = EventRegistry()
+event_registry.register("message", Message.create, actions=("message_create",))
+event_registry.register("resolve", Resolve, actions=("conversation_resolution",))
+event_registry.register("reopen", Reopen, actions=("conversation_reopen",))
+event_registry.register("assignment", Assignment, actions=("conversation_assignment",))
+event_registry.register("user", User, actions=("user_create",))
+
+
+def parse_event_data(
+    data: Any,
+    action: Optional[str] = None,
+    registry: Optional[EventRegistry] = None,
+) -> Any:
+    """
+    Creates the event model of the data of an incoming event based on its type,
+    data of unknown types is returned as it is
+    """
+    return (registry or event_registry).parse(data, action)
+
+
+_NOT_PARSED = object()
+
+
+class LazyIncomingEvent:
+    """
+    Class which wraps the payload of an incoming event without parsing it. The
+    action, time and conversation id are read straight from the payload, the data
+    is parsed on first access and cached, so events which are filtered out only on
+    their action never pay for building the event models
+    """
+
+    __slots__ = ("payload", "_actor", "_data")
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.payload = payload
+        self._actor: Optional[Actor] = None
+        self._data: Any = _NOT_PARSED
+
+    @property
+    def action(self) -> Optional[str]:
+        return self.payload.get("action")
+
+    @property
+    def action_time(self) -> Optional[str]:
+        return self.payload.get("action_time")
+
+    @property
+    def actor(self) -> Actor:
+        if self._actor is None:
+            actor = self.payload.get("actor")
+            self._actor = (
+                Actor(**actor) if isinstance(actor, dict) else actor or Actor()
+            )
+        return self._actor
+
+    @property
+    def conversation_id(self) -> Optional[str]:
+        """
+        Property returns the id of the conversation of the event without parsing
+        its data
+        """
+        data = self.payload.get("data")
+        if not isinstance(data, dict) or not data:
+            return None
+        body = next(iter(data.values()))
+        if not isinstance(body, dict):
+            return None
+        if body.get("conversation_id"):
+            return body["conversation_id"]
+        conversation = body.get("conversation")
+        if isinstance(conversation, dict):
+            return conversation.get("conversation_id")
+        return getattr(conversation, "conversation_id", None)
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._data is not _NOT_PARSED
+
+    @property
+    def data(self) -> Any:
+        """
+        Property returns the event model of the data, parsed on first access
+        """
+        if self._data is _NOT_PARSED:
+            self._data = parse_event_data(self.payload.get("data"), self.action)
+        return self._data
+
+    def materialise(self) -> IncomingEvent:
+        """
+        Returns the fully parsed IncomingEvent, reusing the parsed data
+        """
+        return IncomingEvent(
+            actor=self.actor,
+            action=self.action,
+            action_time=self.action_time,
+            data=self.data,
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(action={self.action!r}, "
+            f"action_time={self.action_time!r}, parsed={self.is_parsed})"
+        )
@@ -0,0 +1,93 @@
+import asyncio
+from typing import Any, AnyStr, AsyncIterator, Callable, Dict, Optional, TypeVar
+from urllib.parse import parse_qsl, urlsplit
+
+from freshchat.client.client import FreshChatClient
+
+T = TypeVar("T")
+
+PAGE_PARAM = "page"
+PAGE_SIZE_PARAM = "items_per_page"
+
+
+def next_page_params(
+    body: Dict[AnyStr, Any], params: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Returns the request parameters of the page following the given one, using the
+    ``next_page`` link of the response or else its ``pagination`` information
+
+    :param body: the body of the response of the current page
+    :param params: the request parameters of the current page
+    :return: the parameters of the next page or None if it is the last page
+    """
+    links = body.get("links") or body.get("link") or {}
+    next_page = links.get("next_page") if isinstance(links, dict) else None
+    href = next_page.get("href") if isinstance(next_page, dict) else None
+    if href:
+        return {**params, **dict(parse_qsl(urlsplit(href).query))}
+
+    pagination = body.get("pagination") or {}
+    current_page = pagination.get("current_page")
+    total_pages = pagination.get("total_pages")
+    if current_page and total_pages and int(current_page) < int(total_pages):
+        return {**params, PAGE_PARAM: int(current_page) + 1}
+    return None
+
+
+async def paginate(
+    client: FreshChatClient,
+    endpoint: str,
+    key: str,
+    factory: Callable[[Dict[AnyStr, Any]], T],
+    page_size: Optional[int] = None,
+    params: Optional[Dict[str, Any]] = None,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """
+    Iterates over the items of a paginated list endpoint one page at a time. When
+    ``prefetch`` is enabled, the next page is requested while the items of the
+    current one are consumed, so at most two pages are held in memory
+
+    :param client: FreshChatClient to make the necessary requests
+    :param endpoint: Resource endpoint of the list
+    :param key: the key of the items in the body of the response
+    :param factory: callable which creates an item from its payload
+    :param page_size: the number of items per page
+    :param params: additional request parameters
+    :param prefetch: if True, the next page is fetched in the background
+    """
+    params = dict(params or {})
+    params.setdefault(PAGE_PARAM, 1)
+    if page_size is not None:
+        params[PAGE_SIZE_PARAM] = page_size
+
+    next_page: Optional[asyncio.Future] = asyncio.ensure_future(
+        client.get(endpoint, params=params)
+    )
+    try:
+        while next_page is not None:
+            response = await next_page
+            next_page = None
+            body = response.body if isinstance(response.body, dict) else {}
+            items = body.get(key) or []
+
+            following = next_page_params(body, params) if items else None
+            if following is not None and prefetch:
+                next_page = asyncio.ensure_future(
+                    client.get(endpoint, params=following)
+                )
+
+            for item in items:
+                yield factory(item)
+
+            if following is not None and not prefetch:
+                next_page = asyncio.ensure_future(
+                    client.get(endpoint, params=following)
+                )
+            params = following
+    finally:
+        if next_page is not None:
+            if next_page.done() and not next_page.cancelled():
+                next_page.exception()
+            next_page.cancel()
@@ -0,0 +1,628 @@
+import asyncio
+import json
+import math
+import random
+import time
+from base64 import b64encode
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+import aiohttp
+from aiohttp import web
+from cafeteria.logging import LoggedObject
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import PKCS1_v1_5
+
+from freshchat.client.cassette import Recording, request_key
+from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import FreshChatConfiguration
+from freshchat.client.ratelimit import RETRY_AFTER_HEADER
+from freshchat.models import FROM_TIME_PARAM, format_time
+from freshchat.models.pagination import PAGE_PARAM, PAGE_SIZE_PARAM
+from freshchat.webhook.server import SIGNATURE_HEADER
+
+Latency = Callable[[random.Random], float]
+
+
+def constant(seconds: float) -> Latency:
+    """
+    Returns a latency distribution which always waits the given seconds
+    """
+    return lambda _: seconds
+
+
+def uniform(low: float, high: float) -> Latency:
+    """
+    Returns a latency distribution uniform between low and high seconds
+    """
+    return lambda generator: generator.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Latency:
+    """
+    Returns a log-normal latency distribution of the given median in seconds, whose
+    long tail resembles the latency of a real API
+    """
+    mu = math.log(median)
+    return lambda generator: generator.lognormvariate(mu, sigma)
+
+
+@dataclass
+class Faults:
+    """
+    Class represents the errors injected by :class:`FakeFreshchat`. The rates are
+    the probability of a request to be answered with 429 or 503, rate limited
+    responses carry a Retry-After header of ``retry_after`` seconds
+    """
+
+    rate_limited: float = field(default=0.0)
+    unavailable: float = field(default=0.0)
+    retry_after: float = field(default=1.0)
+
+
+def now() -> str:
+    return format_time(datetime.now(timezone.utc))
+
+
+class FakeFreshchat(LoggedObject):
+    """
+    Class represents a local fake of the Freshchat API for load and chaos testing.
+    Users, conversations, their messages and channels are kept in memory and the
+    endpoints used by :mod:`freshchat.models` are implemented on top of them.
+
+    Every request waits for a delay drawn from the ``latency`` distribution and
+    may be answered with an injected error according to the ``faults``.
+
+    When a ``webhook_url`` is given, the messages sent and the conversations
+    resolved through the API are delivered to it as webhook events signed with the
+    private key of the fake, whose public key is :attr:`public_key`::
+
+        async with FakeFreshchat(latency=lognormal(0.05)) as fake:
+            async with FreshChatClient(fake.configuration()) as client:
+                user = await User.create(client, email="peter@test.ai")
+    """
+
+    def __init__(
+        self,
+        latency: Optional[Latency] = None,
+        faults: Optional[Faults] = None,
+        channels: int = 3,
+        webhook_url: Optional[str] = None,
+        key_size: int = 2048,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.faults = faults or Faults()
+        self.webhook_url = webhook_url
+        self.key_size = key_size
+        self.random = random.Random(seed)
+        self.app_id = str(uuid4())
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.conversations: Dict[str, Dict[str, Any]] = {}
+        self.messages: Dict[str, List[Dict[str, Any]]] = {}
+        self.channels: List[Dict[str, Any]] = [
+            {
+                "id": str(uuid4()),
+                "name": f"Channel {index}",
+                "enabled": True,
+                "public": True,
+                "updated_time": now(),
+                "tags": [],
+            }
+            for index in range(channels)
+        ]
+        self.requests: Dict[str, int] = {}
+        self.url: Optional[str] = None
+        self._private_key: Optional[Any] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._deliveries: List["asyncio.Task"] = []
+
+    @property
+    def default_channel_id(self) -> str:
+        return self.channels[0]["id"]
+
+    def configuration(self, token: str = "token") -> FreshChatConfiguration:
+        """
+        Returns a client configuration pointing to the running fake
+        """
+        return FreshChatConfiguration(
+            app_id=self.app_id,
+            token=token,
+            default_channel_id=self.default_channel_id,
+            url=self.url,
+        )
+
+    @property
+    def private_key(self) -> Any:
+        if self._private_key is None:
+            self._private_key = RSA.generate(self.key_size)
+        return self._private_key
+
+    @property
+    def public_key(self) -> str:
+        """
+        Property returns the public key of the webhook signatures in the PEM format
+        accepted by :class:`freshchat.webhook.security.SecurityManager`
+        """
+        body = b64encode(self.private_key.publickey().exportKey("DER")).decode()
+        return f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
+
+    def sign(self, body: bytes) -> str:
+        signature = PKCS1_v1_5.new(self.private_key).sign(SHA256.new(body))
+        return b64encode(signature).decode()
+
+    def create_app(self) -> web.Application:
+        """
+        Creates the aiohttp application of the fake API
+        """
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_post("/users", self._create_user)
+        app.router.add_get("/users/{id}", self._get_user)
+        app.router.add_post("/conversations", self._create_conversation)
+        app.router.add_get("/conversations/{id}", self._get_conversation)
+        app.router.add_put("/conversations/{id}", self._update_conversation)
+        app.router.add_post("/conversations/{id}/messages", self._send_message)
+        app.router.add_get("/conversations/{id}/messages", self._list_messages)
+        app.router.add_get("/channels", self._list_channels)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Starts serving the fake API, on a free port by default
+        :return: the base url of the fake API
+        """
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}/"
+        return self.url
+
+    async def stop(self) -> None:
+        """
+        Waits for the pending webhook deliveries and stops serving the fake API
+        """
+        await asyncio.gather(*self._deliveries, return_exceptions=True)
+        self._deliveries = []
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeFreshchat":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def emit(
+        self, event: Dict[str, Any], url: Optional[str] = None
+    ) -> Optional[int]:
+        """
+        Delivers a signed webhook event
+        :param event: the payload of the event
+        :param url: the url receiving the event, ``webhook_url`` by default
+        :return: the status of the response
+        """
+        url = url or self.webhook_url
+        if url is None:
+            raise ValueError("A webhook url is required")
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        body = json.dumps(event).encode()
+        async with self._session.post(
+            url,
+            data=body,
+            headers={
+                SIGNATURE_HEADER: self.sign(body),
+                "Content-Type": "application/json",
+            },
+        ) as response:
+            return response.status
+
+    def message_event(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the ``message_create`` webhook event of a stored message
+        """
+        conversation = self.conversations[message["conversation_id"]]
+        return {
+            "actor": {
+                "actor_type": message["actor_type"],
+                "actor_id": message["actor_id"],
+            },
+            "action": "message_create",
+            "action_time": message["created_time"],
+            "data": {
+                "message": {
+                    **message,
+                    "app_id": self.app_id,
+                    "channel_id": conversation["channel_id"],
+                }
+            },
+        }
+
+    def resolve_event(self, conversation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Returns the ``conversation_resolution`` webhook event of a conversation
+        """
+        return {
+            "actor": {"actor_type": "agent", "actor_id": "fake"},
+            "action": "conversation_resolution",
+            "action_time": now(),
+            "data": {
+                "resolve": {
+                    "resolver": "agent",
+                    "resolver_id": "fake",
+                    "conversation": {
+                        key: value
+                        for key, value in conversation.items()
+                        if key != "messages"
+                    },
+                }
+            },
+        }
+
+    def add_user(self, **fields: Any) -> Dict[str, Any]:
+        """
+        Stores a user as if it was created through the API
+        :return: the stored user with its id
+        """
+        user = {**fields, "id": str(uuid4()), "created_time": now()}
+        self.users[user["id"]] = user
+        return user
+
+    def add_conversation(
+        self,
+        users: Iterable[Dict[str, Any]] = (),
+        channel_id: Optional[str] = None,
+        app_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Stores a new conversation of the given users as if it was created through
+        the API, users which are stored in the fake are referenced by their id
+        :return: the stored conversation with its id
+        """
+        conversation_id = str(uuid4())
+        conversation = {
+            "conversation_id": conversation_id,
+            "app_id": app_id or self.app_id,
+            "channel_id": channel_id or self.default_channel_id,
+            "status": "new",
+            "users": [self.users.get(user.get("id"), user) for user in users],
+        }
+        self.conversations[conversation_id] = conversation
+        return conversation
+
+    def add_message(
+        self,
+        conversation_id: str,
+        text: str,
+        actor_type: str = "user",
+        actor_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Stores a message of the conversation as if it was sent from outside the
+        API, e.g. by the user of the conversation, and emits its webhook event
+        """
+        conversation = self.conversations[conversation_id]
+        message = self._store_message(
+            conversation_id,
+            {
+                "actor_type": actor_type,
+                "actor_id": actor_id or conversation["users"][0]["id"],
+                "message_type": "normal",
+                "message_parts": [{"text": {"content": text}}],
+            },
+        )
+        self._deliver(self.message_event(message))
+        return message
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        if self.webhook_url is not None:
+            self._deliveries = [task for task in self._deliveries if not task.done()]
+            self._deliveries.append(asyncio.ensure_future(self._emit_logged(event)))
+
+    async def _emit_logged(self, event: Dict[str, Any]) -> None:
+        try:
+            await self.emit(event)
+        except aiohttp.ClientError as error:
+            self.logger.warning("Webhook delivery failed with %r", error)
+
+    def _store_message(
+        self, conversation_id: str, message: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        message = {
+            **message,
+            "id": str(uuid4()),
+            "created_time": now(),
+            "conversation_id": conversation_id,
+        }
+        self.messages.setdefault(conversation_id, []).append(message)
+        return message
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        route = request.match_info.route.resource
+        key = f"{request.method} {route.canonical if route else request.path}"
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+        if self.latency is not None:
+            await asyncio.sleep(max(0.0, self.latency(self.random)))
+        if not request.headers.get("Authorization", "").startswith("Bearer "):
+            return web.json_response({"message": "Unauthorised"}, status=401)
+
+        draw = self.random.random()
+        if draw < self.faults.rate_limited:
+            return web.json_response(
+                {"message": "Too many requests"},
+                status=429,
+                headers={RETRY_AFTER_HEADER: str(self.faults.retry_after)},
+            )
+        if draw < self.faults.rate_limited + self.faults.unavailable:
+            return web.json_response({"message": "Service unavailable"}, status=503)
+        return await handler(request)
+
+    @staticmethod
+    def _not_found(kind: str) -> web.Response:
+        return web.json_response({"message": f"{kind} not found"}, status=404)
+
+    @staticmethod
+    def _page(request: web.Request, key: str, items: list) -> Dict[str, Any]:
+        number = int(request.query.get(PAGE_PARAM, 1))
+        size = int(request.query.get(PAGE_SIZE_PARAM, 10))
+        total_pages = max(1, -(-len(items) // size))
+        body = {
+            key: items[(number - 1) * size : number * size],
+            "pagination": {
+                "total_items": len(items),
+                "total_pages": total_pages,
+                "current_page": number,
+                "items_per_page": size,
+            },
+            "links": {},
+        }
+        if number < total_pages:
+            query = {**request.query, PAGE_PARAM: number + 1, PAGE_SIZE_PARAM: size}
+            body["links"]["next_page"] = {
+                "href": str(request.rel_url.with_query(query)),
+                "rel": "next",
+                "method": "GET",
+            }
+        return body
+
+    async def _create_user(self, request: web.Request) -> web.Response:
+        return web.json_response(self.add_user(**await request.json()))
+
+    async def _get_user(self, request: web.Request) -> web.Response:
+        user = self.users.get(request.match_info["id"])
+        if user is None:
+            return self._not_found("User")
+        return web.json_response(user)
+
+    async def _create_conversation(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        conversation_id = self.add_conversation(
+            users=body.get("users", []),
+            channel_id=body.get("channel_id"),
+            app_id=body.get("app_id"),
+        )["conversation_id"]
+        for message in body.get("messages", []):
+            self._store_message(conversation_id, message)
+        return web.json_response(self._conversation(conversation_id))
+
+    def _conversation(self, conversation_id: str) -> Dict[str, Any]:
+        return {
+            **self.conversations[conversation_id],
+            "messages": self.messages.get(conversation_id, []),
+        }
+
+    async def _get_conversation(self, request: web.Request) -> web.Response:
+        conversation_id = request.match_info["id"]
+        if conversation_id not in self.conversations:
+            return self._not_found("Conversation")
+        return web.json_response(self._conversation(conversation_id))
+
+    async def _update_conversation(self, request: web.Request) -> web.Response:
+        conversation = self.conversations.get(request.match_info["id"])
+        if conversation is None:
+            return self._not_found("Conversation")
+        body = await request.json()
+        conversation.update(body)
+        if body.get("status") == "resolved":
+            self._deliver(self.resolve_event(conversation))
+        return web.json_response(self._conversation(conversation["conversation_id"]))
+
+    async def _send_message(self, request: web.Request) -> web.Response:
+        conversation_id = request.match_info["id"]
+        if conversation_id not in self.conversations:
+            return self._not_found("Conversation")
+        message = self._store_message(conversation_id, await request.json())
+        self._deliver(self.message_event(message))
+        return web.json_response(message)
+
+    async def _list_messages(self, request: web.Request) -> web.Response:
+        conversation_id = request.match_info["id"]
+        if conversation_id not in self.conversations:
+            return self._not_found("Conversation")
+        messages = self.messages.get(conversation_id, [])
+        from_time = request.query.get(FROM_TIME_PARAM)
+        if from_time:
+            messages = [
+                message for message in messages if message["created_time"] >= from_time
+            ]
+        return web.json_response(self._page(request, "messages", messages))
+
+    async def _list_channels(self, request: web.Request) -> web.Response:
+        return web.json_response(self._page(request, "channels", self.channels))
+
+
+class CassettePlayer:
+    """
+    Class represents a local server answering requests with the responses of a
+    cassette recorded with :class:`freshchat.client.cassette.CassetteRecorder`.
+    Requests are matched on their method, endpoint and parameters and the
+    recordings of the same request are served in their recorded order, the last one
+    being repeated once the others are exhausted. With ``realtime`` enabled, every
+    response is delayed by its recorded duration::
+
+        async with CassettePlayer(load_cassette("day.jsonl")) as player:
+            config = FreshChatConfiguration(app_id="app", token="token", url=player.url)
+    """
+
+    def __init__(self, recordings: Iterable[Recording], realtime: bool = False) -> None:
+        self.realtime = realtime
+        self.recordings: Dict[Tuple, Deque[Recording]] = {}
+        for recording in recordings:
+            self.recordings.setdefault(recording.key, deque()).append(recording)
+        self.served = 0
+        self.missed = 0
+        self.url: Optional[str] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    def create_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        return app
+
+    def _next(self, key: Tuple) -> Optional[Recording]:
+        recordings = self.recordings.get(key)
+        if not recordings:
+            return None
+        return recordings.popleft() if len(recordings) > 1 else recordings[0]
+
+    async def handle(self, request: web.Request) -> web.Response:
+        recording = self._next(request_key(request.method, request.path, request.query))
+        if recording is None:
+            self.missed += 1
+            return web.json_response({"message": "Not recorded"}, status=404)
+        if self.realtime and recording.duration:
+            await asyncio.sleep(recording.duration)
+        self.served += 1
+
+        headers = {}
+        content_type = "application/json"
+        for key, value in recording.headers.items():
+            if key.lower() == "content-type":
+                content_type = value.split(";")[0]
+            else:
+                headers[key] = value
+        if recording.body is None:
+            body = b""
+        elif isinstance(recording.body, str) and content_type != "application/json":
+            body = recording.body.encode("utf-8")
+        else:
+            body = json.dumps(recording.body).encode("utf-8")
+        return web.Response(
+            status=recording.status,
+            body=body,
+            headers=headers,
+            content_type=content_type,
+        )
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Starts serving the cassette, on a free port by default
+        :return: the base url of the player
+        """
+        self._runner = web.AppRunner(self.create_app())
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}/"
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "CassettePlayer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+
+@dataclass
+class ReplayResult:
+    """
+    Class represents the outcome of a replay. Errors are the requests which raised
+    an exception, including the ones whose recorded response was an error
+    """
+
+    requests: int = field(default=0)
+    errors: int = field(default=0)
+    elapsed: float = field(default=0.0)
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+
+async def replay(
+    client: FreshChatClient,
+    recordings: List[Recording],
+    speed: Optional[float] = 1.0,
+    concurrency: int = 100,
+) -> ReplayResult:
+    """
+    Sends the recorded requests through the client, e.g. to a
+    :class:`CassettePlayer`, to reproduce the traffic of the recording
+    :param client: FreshChatClient to make the requests
+    :param recordings: the recordings in their recorded order
+    :param speed: a positive factor, the requests are sent at their recorded offsets
+    divided by the speed, or as fast as possible on ``concurrency`` workers if it is
+    None
+    :param concurrency: the maximum number of requests in flight
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("The replay speed must be positive")
+    result = ReplayResult()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(recording: Recording) -> None:
+        try:
+            await client.request(
+                method=recording.method,
+                endpoint=recording.endpoint,
+                params=recording.params,
+                json=recording.json,
+            )
+        except Exception:
+            result.errors += 1
+        result.requests += 1
+
+    async def scheduled(recording: Recording) -> None:
+        async with semaphore:
+            await send(recording)
+
+    async def worker(pending) -> None:
+        for recording in pending:
+            await send(recording)
+
+    start = time.perf_counter()
+    if speed is None:
+        pending = iter(recordings)
+        await asyncio.gather(*(worker(pending) for _ in range(concurrency)))
+    else:
+        origin = recordings[0].start if recordings else 0.0
+        tasks = []
+        for recording in recordings:
+            delay = (recording.start - origin) / speed - (time.perf_counter() - start)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(scheduled(recording)))
+        await asyncio.gather(*tasks)
+    result.elapsed = time.perf_counter() - start
+    return result
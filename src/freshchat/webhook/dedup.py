@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from freshchat.client.cache import TTLCache
+
+
+def event_key(payload: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the deduplication key of the payload of an incoming event without
+    parsing it. Message events are keyed on the id of the message, other events on
+    their action, action time and actor. None is returned if the payload has
+    neither a message id nor an action time
+    """
+    data = payload.get("data")
+    if isinstance(data, dict):
+        message = data.get("message")
+        if isinstance(message, dict) and message.get("id"):
+            return f"message:{message['id']}"
+    action_time = payload.get("action_time")
+    if not action_time:
+        return None
+    actor = payload.get("actor")
+    if isinstance(actor, dict):
+        actor = f"{actor.get('actor_type')}:{actor.get('actor_id')}"
+    return f"{payload.get('action')}:{action_time}:{actor}"
+
+
+class DedupBackend:
+    """
+    Base class of the storage of the keys of the processed webhook events. A shared
+    backend, e.g. on Redis, lets several webhook servers skip each other's
+    duplicates
+    """
+
+    async def contains(self, key: str) -> bool:
+        """
+        Returns whether the key has been added
+        """
+        raise NotImplementedError
+
+    async def add(self, key: str) -> bool:
+        """
+        Adds the key atomically
+        :return: False if the key had already been added
+        """
+        raise NotImplementedError
+
+    async def discard(self, key: str) -> None:
+        """
+        Removes the key, so that a redelivery of the event is processed
+        """
+        raise NotImplementedError
+
+
+class MemoryDedupBackend(DedupBackend):
+    """
+    Class represents an in-process dedup backend which keeps up to ``maxsize`` keys
+    for ``ttl`` seconds
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: Optional[float] = 3600.0) -> None:
+        self.keys = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def contains(self, key: str) -> bool:
+        return key in self.keys
+
+    async def add(self, key: str) -> bool:
+        if key in self.keys:
+            return False
+        self.keys.set(key, True)
+        return True
+
+    async def discard(self, key: str) -> None:
+        self.keys.pop(key)
+
+
+@dataclass
+class DedupStats:
+    """
+    Class represents the counters of a deduplicator
+    """
+
+    checked: int = field(default=0)
+    duplicates: int = field(default=0)
+
+    @property
+    def duplicate_rate(self) -> float:
+        return self.duplicates / self.checked if self.checked else 0.0
+
+
+class Deduplicator:
+    """
+    Class responsible to detect the redeliveries of webhook events. The events are
+    looked up before their signature is verified and marked as processed once they
+    are accepted, so a forged payload can never suppress a genuine event.
+
+    The keys are stored on the given :class:`DedupBackend`, by default an in-memory
+    LRU of ``maxsize`` keys kept for ``ttl`` seconds
+    """
+
+    def __init__(
+        self,
+        backend: Optional[DedupBackend] = None,
+        maxsize: int = 10000,
+        ttl: Optional[float] = 3600.0,
+    ) -> None:
+        self.backend = backend or MemoryDedupBackend(maxsize=maxsize, ttl=ttl)
+        self.stats = DedupStats()
+
+    async def seen(self, key: Optional[str]) -> bool:
+        """
+        Returns whether the event of the key has already been accepted, events
+        without a key are never duplicates
+        """
+        if key is None:
+            return False
+        self.stats.checked += 1
+        if await self.backend.contains(key):
+            self.stats.duplicates += 1
+            return True
+        return False
+
+    async def mark(self, key: Optional[str]) -> bool:
+        """
+        Marks the event of the key as accepted
+        :return: False if a concurrent delivery of the event marked it first
+        """
+        if key is None:
+            return True
+        if await self.backend.add(key):
+            return True
+        self.stats.duplicates += 1
+        return False
+
+    async def unmark(self, key: Optional[str]) -> None:
+        """
+        Forgets the event of the key, e.g. when it could not be queued
+        """
+        if key is not None:
+            await self.backend.discard(key)
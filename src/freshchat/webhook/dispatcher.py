@@ -0,0 +1,81 @@
+from typing import Callable, Dict, List, Optional
+
+from cafeteria.logging import LoggedObject
+
+from freshchat.webhook.server import Event, EventHandler
+
+
+class EventDispatcher(LoggedObject):
+    """
+    Class responsible to route incoming events to the handlers registered for their
+    action. Handlers are looked up by action in a dictionary, events whose action has
+    no handler are passed to the fallback handler, if any.
+
+    The dispatcher is itself an event handler, so it can be registered on a
+    :class:`WebhookProcessor`::
+
+        dispatcher = EventDispatcher()
+
+        @dispatcher.on("message_create")
+        async def on_message(event):
+            ...
+
+        app = create_app(security_manager, handlers=[dispatcher])
+    """
+
+    def __init__(self, fallback: Optional[EventHandler] = None) -> None:
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self._fallback = fallback
+
+    def add_handler(self, action: str, handler: EventHandler) -> EventHandler:
+        """
+        Registers an async handler called with the events of the action
+        :param action: the action of the events, e.g. ``message_create``
+        :param handler: the async handler
+        """
+        self._handlers.setdefault(action, []).append(handler)
+        return handler
+
+    def on(self, *actions: str) -> Callable[[EventHandler], EventHandler]:
+        """
+        Decorator which registers an async handler for one or more actions
+        """
+
+        def decorator(handler: EventHandler) -> EventHandler:
+            for action in actions:
+                self.add_handler(action, handler)
+            return handler
+
+        return decorator
+
+    def fallback(self, handler: EventHandler) -> EventHandler:
+        """
+        Registers the async handler of the events whose action has no handler, it
+        can also be used as a decorator
+        """
+        self._fallback = handler
+        return handler
+
+    def handlers(self, action: Optional[str]) -> List[EventHandler]:
+        """
+        Returns the handlers registered for the action
+        """
+        return list(self._handlers.get(action, ()))
+
+    async def dispatch(self, event: Event) -> int:
+        """
+        Calls the handlers of the action of the event in their registration order
+        :param event: the incoming event
+        :return: the number of handlers called
+        """
+        handlers = self._handlers.get(event.action)
+        if handlers is None:
+            if self._fallback is None:
+                self.logger.debug("No handler for %s events", event.action)
+                return 0
+            handlers = [self._fallback]
+        for handler in handlers:
+            await handler(event)
+        return len(handlers)
+
+    __call__ = dispatch
@@ -1,45 +1,240 @@
+import asyncio
 import re
 from base64 import b64decode
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from Crypto.Hash import SHA256
 from Crypto.PublicKey import RSA
 from Crypto.Signature import PKCS1_v1_5
 
+PUBLIC_KEY_PATTERN = re.compile(
+    "^-----BEGIN (RSA )?PUBLIC KEY-----((.+)|\n(.+)\n)-----END (RSA )?PUBLIC KEY-----\n?$"
+)
+
+_PROCESS_MANAGERS: Dict[Tuple[str, ...], "SecurityManager"] = {}
+
+
+def _verify_in_process(
+    public_keys: Tuple[str, ...], signature: str, data: Union[bytes, str]
+) -> bool:
+    # managers are cached per worker process, so the keys are parsed once there too
+    manager = _PROCESS_MANAGERS.get(public_keys)
+    if manager is None:
+        manager = _PROCESS_MANAGERS[public_keys] = SecurityManager(list(public_keys))
+    return manager.verify_signature(signature, data)
+
+
+@dataclass
+class VerificationStats:
+    """
+    Class represents the counters of the asynchronous verifications of a
+    SecurityManager. The queue depth is the number of verifications submitted to
+    the pool which have not completed yet
+    """
+
+    pool_size: Optional[int] = field(default=None)
+    queue_depth: int = field(default=0)
+    submitted: int = field(default=0)
+    completed: int = field(default=0)
+    invalid: int = field(default=0)
+    errors: int = field(default=0)
+
 
 class SecurityManager:
     """
     Class responsible for the verification of the incoming signature using the
-    public key provided from Freshchat
+    public key provided from Freshchat.
+
+    Several public keys can be given to support key rotation, a signature is valid
+    if it is verified by any of them. The keys are parsed once, on the first
+    verification, and their verifiers are reused afterwards.
+
+    The asynchronous verifications run on the given executor, either a thread or a
+    process pool, so they do not block the event loop. If no executor is given, a
+    thread pool of ``max_workers`` threads is created on first use
     """
 
-    def __init__(self, public_key: str) -> None:
-        self.public_key = public_key
+    def __init__(
+        self,
+        public_key: Union[str, Sequence[str]],
+        executor: Optional[Executor] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        self.public_keys = public_key
+        self.max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._stats = VerificationStats()
 
-    def key_parse(self) -> str:
-        x = re.match(
-            "^-----BEGIN (RSA )?PUBLIC KEY-----((.+)|\n(.+)\n)-----END (RSA )?PUBLIC KEY-----\n?$",
-            self.public_key,
-        )
+    @property
+    def public_keys(self) -> List[str]:
+        """
+        Property returns the public keys accepted by the manager
+        """
+        return list(self._public_keys)
+
+    @public_keys.setter
+    def public_keys(self, public_keys: Union[str, Sequence[str]]) -> None:
+        keys = [public_keys] if isinstance(public_keys, str) else list(public_keys)
+        if not keys:
+            raise ValueError("At least one public key is required")
+        self._public_keys = keys
+        self._rsa_keys: Optional[List[Any]] = None
+        self._verifiers: Optional[List[Any]] = None
+
+    @property
+    def public_key(self) -> str:
+        """
+        Property returns the primary public key
+        """
+        return self._public_keys[0]
+
+    @public_key.setter
+    def public_key(self, public_key: str) -> None:
+        self.public_keys = public_key
+
+    def key_parse(self, public_key: Optional[str] = None) -> str:
+        x = PUBLIC_KEY_PATTERN.match(public_key or self.public_key)
         if x:
             return x.group(2).strip()
         raise ValueError("Invalid public key")
 
+    def _import_key(self, public_key: str) -> RSA:
+        return RSA.importKey(b64decode(self.key_parse(public_key)))
+
+    @property
+    def rsa_keys(self) -> List[Any]:
+        """
+        Property returns the RSA instances of all the public keys, parsed once
+        """
+        if self._rsa_keys is None:
+            self._rsa_keys = [self._import_key(key) for key in self._public_keys]
+        return self._rsa_keys
+
     @property
     def rsa_key(self) -> RSA:
         """
-        Property returns RSA instance from the public key
+        Property returns RSA instance from the primary public key
+        """
+        return self.rsa_keys[0]
+
+    @property
+    def verifiers(self) -> List[Any]:
+        """
+        Property returns the PKCS1_v1_5 verifiers of all the public keys
         """
-        data = b64decode(self.key_parse())
-        return RSA.importKey(data)
+        if self._verifiers is None:
+            self._verifiers = [PKCS1_v1_5.new(key) for key in self.rsa_keys]
+        return self._verifiers
 
-    def verify_signature(self, signature: str, data: str) -> bool:
+    def add_key(self, public_key: str) -> None:
+        """
+        Adds a public key which is accepted along with the existing ones, e.g. the
+        new key of a rotation. The key is validated immediately
+        :param public_key: the public key in PEM format
+        """
+        rsa_key = self._import_key(public_key)
+        self._public_keys.append(public_key)
+        if self._rsa_keys is not None:
+            self._rsa_keys.append(rsa_key)
+        if self._verifiers is not None:
+            self._verifiers.append(PKCS1_v1_5.new(rsa_key))
+
+    def remove_key(self, public_key: str) -> None:
+        """
+        Removes a public key which is no longer accepted, e.g. the old key of a
+        rotation
+        :param public_key: the public key in PEM format
+        """
+        self.public_keys = [key for key in self._public_keys if key != public_key]
+
+    def verify_signature(self, signature: str, data: Union[bytes, str]) -> bool:
         """
         Method which verifies if the data are signed correctly
         :param signature: sha256withrsa signature
         :param data: signed data
         :return: the result of the verification
         """
-        rsa_key = self.rsa_key
+        if isinstance(data, str):
+            data = data.encode("utf-8")
         digest = SHA256.new(data)
-        signer = PKCS1_v1_5.new(rsa_key)
-        return signer.verify(digest, b64decode(signature))
+        decoded_signature = b64decode(signature)
+        return any(
+            verifier.verify(digest, decoded_signature) for verifier in self.verifiers
+        )
+
+    @property
+    def executor(self) -> Executor:
+        """
+        Property returns the executor of the asynchronous verifications
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="freshchat-verify"
+            )
+        return self._executor
+
+    @property
+    def stats(self) -> VerificationStats:
+        """
+        Property returns a snapshot of the verification counters
+        """
+        return replace(
+            self._stats,
+            pool_size=getattr(self._executor, "_max_workers", self.max_workers),
+        )
+
+    async def verify_async(self, signature: str, data: Union[bytes, str]) -> bool:
+        """
+        Verifies the signature on the executor of the manager without blocking the
+        event loop
+        :param signature: sha256withrsa signature
+        :param data: signed data
+        :return: the result of the verification
+        """
+        executor = self.executor
+        if isinstance(executor, ProcessPoolExecutor):
+            call = partial(
+                _verify_in_process, tuple(self._public_keys), signature, data
+            )
+        else:
+            call = partial(self.verify_signature, signature, data)
+
+        self._stats.submitted += 1
+        self._stats.queue_depth += 1
+        try:
+            valid = await asyncio.get_running_loop().run_in_executor(executor, call)
+        except Exception:
+            self._stats.errors += 1
+            raise
+        finally:
+            self._stats.queue_depth -= 1
+        self._stats.completed += 1
+        if not valid:
+            self._stats.invalid += 1
+        return valid
+
+    async def verify_many(
+        self, items: Iterable[Tuple[str, Union[bytes, str]]]
+    ) -> List[bool]:
+        """
+        Verifies many signatures concurrently on the executor of the manager
+        :param items: tuples of a signature and the signed data
+        :return: the results of the verifications in the order of the items
+        """
+        return list(
+            await asyncio.gather(
+                *(self.verify_async(signature, data) for signature, data in items)
+            )
+        )
+
+    def close(self) -> None:
+        """
+        Shuts down the executor of the manager if it was created by the manager
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
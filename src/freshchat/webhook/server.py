@@ -0,0 +1,248 @@
+import asyncio
+import time
+from dataclasses import dataclass, field, replace
+from typing import Awaitable, Callable, Iterable, List, Optional, Tuple, Union
+
+from aiohttp import web
+from cafeteria.logging import LoggedObject
+
+from freshchat.client.codec import STDLIB_CODEC, JSONCodec
+from freshchat.models.events import IncomingEvent, LazyIncomingEvent
+from freshchat.webhook.dedup import Deduplicator, event_key
+from freshchat.webhook.security import SecurityManager
+
+SIGNATURE_HEADER = "X-Freshchat-Signature"
+
+Event = Union[IncomingEvent, LazyIncomingEvent]
+EventHandler = Callable[[Event], Awaitable[None]]
+
+
+@dataclass
+class WebhookStats:
+    """
+    Class represents the counters of a webhook processor. Rejected events had an
+    invalid signature or body, shed events were refused because the queue was full,
+    duplicates were redeliveries of accepted events and the latency is measured from
+    the reception of an event until its handlers have completed
+    """
+
+    accepted: int = field(default=0)
+    rejected: int = field(default=0)
+    shed: int = field(default=0)
+    duplicates: int = field(default=0)
+    processed: int = field(default=0)
+    failed: int = field(default=0)
+    queue_depth: int = field(default=0)
+    latency_total: float = field(default=0.0)
+    latency_max: float = field(default=0.0)
+
+    @property
+    def mean_latency(self) -> float:
+        handled = self.processed + self.failed
+        return self.latency_total / handled if handled else 0.0
+
+
+class WebhookProcessor(LoggedObject):
+    """
+    Class responsible to receive Freshchat webhook requests, verify their signature,
+    parse them into :class:`IncomingEvent` and hand them to the registered handlers.
+
+    Accepted events are put on a bounded queue consumed by a number of workers, the
+    request is answered as soon as the event is queued. When the queue is full, the
+    request is answered with 503 so that Freshchat delivers it again later.
+
+    With ``lazy`` enabled, handlers receive :class:`LazyIncomingEvent` instances
+    whose data is only parsed if a handler accesses it.
+
+    With a :class:`Deduplicator`, redeliveries of accepted events are answered with
+    200 without being verified, parsed or handled again
+    """
+
+    def __init__(
+        self,
+        security_manager: Optional[SecurityManager] = None,
+        handlers: Iterable[EventHandler] = (),
+        queue_size: int = 1000,
+        workers: int = 4,
+        signature_header: str = SIGNATURE_HEADER,
+        codec: Optional[JSONCodec] = None,
+        drain_timeout: float = 10.0,
+        lazy: bool = False,
+        deduplicator: Optional[Deduplicator] = None,
+    ) -> None:
+        self.security_manager = security_manager
+        self.handlers: List[EventHandler] = list(handlers)
+        self.queue_size = queue_size
+        self.workers = workers
+        self.signature_header = signature_header
+        self.codec = codec or STDLIB_CODEC
+        self.drain_timeout = drain_timeout
+        self.lazy = lazy
+        self.deduplicator = deduplicator
+        self._stats = WebhookStats()
+        self._queue: Optional["asyncio.Queue[Tuple[float, Event]]"] = None
+        self._tasks: List["asyncio.Task"] = []
+
+    def add_handler(self, handler: EventHandler) -> EventHandler:
+        """
+        Registers an async handler called with every accepted event, it can also be
+        used as a decorator
+        """
+        self.handlers.append(handler)
+        return handler
+
+    @property
+    def stats(self) -> WebhookStats:
+        """
+        Property returns a snapshot of the counters of the processor
+        """
+        return replace(
+            self._stats, queue_depth=self._queue.qsize() if self._queue else 0
+        )
+
+    async def start(self) -> None:
+        """
+        Creates the queue and starts the workers
+        """
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.ensure_future(self._work()) for _ in range(max(1, self.workers))
+        ]
+
+    async def stop(self) -> None:
+        """
+        Waits up to ``drain_timeout`` seconds for the queued events to be handled
+        and stops the workers
+        """
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.drain_timeout)
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    "Dropping %d queued webhook events", self._queue.qsize()
+                )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """
+        aiohttp handler of the webhook requests
+        """
+        if self._queue is None or self._queue.full():
+            self._stats.shed += 1
+            return web.Response(status=503)
+
+        body = await request.read()
+        try:
+            payload = self.codec.loads(body)
+        except (TypeError, ValueError):
+            self._stats.rejected += 1
+            return web.Response(status=400)
+
+        key = None
+        if self.deduplicator is not None and isinstance(payload, dict):
+            key = event_key(payload)
+            if await self.deduplicator.seen(key):
+                self._stats.duplicates += 1
+                return web.Response(status=200)
+
+        if self.security_manager is not None:
+            signature = request.headers.get(self.signature_header)
+            try:
+                valid = bool(signature) and await self.security_manager.verify_async(
+                    signature, body
+                )
+            except ValueError:
+                valid = False
+            if not valid:
+                self._stats.rejected += 1
+                return web.Response(status=401)
+
+        try:
+            event = self._parse(payload)
+        except (TypeError, ValueError, AttributeError, KeyError):
+            self._stats.rejected += 1
+            return web.Response(status=400)
+
+        if self.deduplicator is not None and not await self.deduplicator.mark(key):
+            self._stats.duplicates += 1
+            return web.Response(status=200)
+        try:
+            self._queue.put_nowait((time.monotonic(), event))
+        except asyncio.QueueFull:
+            self._stats.shed += 1
+            if self.deduplicator is not None:
+                await self.deduplicator.unmark(key)
+            return web.Response(status=503)
+        self._stats.accepted += 1
+        return web.Response(status=200)
+
+    def _parse(self, payload: dict) -> Event:
+        if not isinstance(payload, dict):
+            raise TypeError("The webhook payload is not an object")
+        if self.lazy:
+            return IncomingEvent.lazy(payload)
+        return IncomingEvent.from_payload(payload)
+
+    async def _work(self) -> None:
+        while True:
+            received, event = await self._queue.get()
+            try:
+                for handler in self.handlers:
+                    await handler(event)
+                self._stats.processed += 1
+            except Exception:
+                self._stats.failed += 1
+                self.logger.exception("Webhook handler failed for %s", event.action)
+            finally:
+                latency = time.monotonic() - received
+                self._stats.latency_total += latency
+                self._stats.latency_max = max(self._stats.latency_max, latency)
+                self._queue.task_done()
+
+
+# typed application keys are only available from aiohttp 3.9
+APP_KEY = (
+    web.AppKey("freshchat_webhook", WebhookProcessor)
+    if hasattr(web, "AppKey")
+    else "freshchat_webhook"
+)
+
+
+def create_app(
+    security_manager: Optional[SecurityManager] = None,
+    handlers: Iterable[EventHandler] = (),
+    path: str = "/",
+    processor: Optional[WebhookProcessor] = None,
+    **kwargs,
+) -> web.Application:
+    """
+    Creates an aiohttp application which receives Freshchat webhooks on the given
+    path. The processor is available as ``app[APP_KEY]``
+
+    :param security_manager: verifies the signature of the requests, if given
+    :param handlers: async handlers called with every accepted event
+    :param path: the path of the webhook endpoint
+    :param processor: an existing processor, it is created from the other arguments
+    if not given
+    :param kwargs: additional arguments of :class:`WebhookProcessor`
+    """
+    if processor is None:
+        processor = WebhookProcessor(
+            security_manager=security_manager, handlers=handlers, **kwargs
+        )
+
+    async def start(_: web.Application) -> None:
+        await processor.start()
+
+    async def stop(_: web.Application) -> None:
+        await processor.stop()
+
+    app = web.Application()
+    app[APP_KEY] = processor
+    app.router.add_post(path, processor.handle)
+    app.on_startup.append(start)
+    app.on_cleanup.append(stop)
+    return app
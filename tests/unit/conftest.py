@@ -1,4 +1,5 @@
-from typing import Any, AnyStr, Dict
+import json
+from typing import Any, AnyStr, AsyncIterator, Callable, Dict
 from uuid import uuid4
 
 import pytest
@@ -50,5 +51,20 @@ def session_data() -> Dict[AnyStr, Any]:
 
 
 @pytest.fixture
-def test_client(test_config) -> FreshChatClient:
-    return FreshChatClient(config=test_config)
+async def test_client(test_config) -> AsyncIterator[FreshChatClient]:
+    client = FreshChatClient(config=test_config)
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def request_json() -> Callable[[Dict[str, Any]], Any]:
+    """
+    Returns a function which decodes the json body of a request captured by an
+    aioresponses callback
+    """
+
+    def decode(kwargs: Dict[str, Any]) -> Any:
+        return json.loads(kwargs["data"])
+
+    return decode
@@ -0,0 +1,49 @@
+from dataclasses import asdict
+
+import pytest
+
+from freshchat.client.exceptions import ServerSideError
+from freshchat.models import Conversation, Message, User
+from freshchat.models.bulk import send_bulk
+
+
+def conversation(conversation_id: str) -> Conversation:
+    return Conversation(conversation_id=conversation_id, users=[User(id="user_uuid")])
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_preserves_order_and_errors(
+    test_client, mock_aioresponse, base_url
+):
+    for conversation_id in ("first", "third"):
+        mock_aioresponse.post(
+            f"{base_url}/conversations/{conversation_id}/messages",
+            payload=asdict(Message(conversation_id=conversation_id)),
+        )
+    mock_aioresponse.post(f"{base_url}/conversations/second/messages", status=500)
+
+    items = [
+        (conversation("first"), "Hello"),
+        (conversation("second"), "Hello"),
+        (conversation("third"), "Hello", {"message_type": "private"}),
+    ]
+    result = await send_bulk(test_client, items, concurrency=2)
+
+    assert [item.conversation.conversation_id for item in result.results] == [
+        "first",
+        "second",
+        "third",
+    ]
+    assert result.results[0].message.conversation_id == "first"
+    assert isinstance(result.results[1].exception, ServerSideError)
+    assert result.results[2].ok
+    assert (result.succeeded, result.failed) == (2, 1)
+    assert result.throughput > 0
+    assert result.latency_percentile(99) >= result.latency_percentile(50)
+
+
+@pytest.mark.asyncio
+async def test_send_bulk_without_items(test_client):
+    result = await send_bulk(test_client, [])
+    assert result.results == []
+    assert result.mean_latency == 0.0
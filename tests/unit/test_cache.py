@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+from aioresponses import CallbackResult
+
+from freshchat.client.cache import (
+    MemoryResponseCache,
+    TTLCache,
+    cache_key,
+    parent_paths,
+)
+from freshchat.client.client import FreshChatClient
+from freshchat.client.responses import FreshChatResponse
+from freshchat.models import Conversation
+
+
+def test_cache_key_ignores_slashes_and_param_order():
+    assert cache_key("users/abc/", {"b": 1, "a": "x"}) == cache_key(
+        "/users/abc", {"a": "x", "b": "1"}
+    )
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.stats.evictions == 1
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=2, ttl=-1)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats.misses == 1
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_removes_related_resources():
+    cache = MemoryResponseCache()
+    for endpoint in ("/conversations/abc", "/conversations/abc/messages", "/users/abc"):
+        cache.set(cache_key(endpoint), FreshChatResponse(None, body={}))
+    assert cache.invalidate("conversations/abc") == 2
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_client_serves_get_from_cache(test_config, mock_aioresponse, base_url):
+    mock_aioresponse.get(f"{base_url}/users/abc", payload={"id": "abc"})
+    cache = MemoryResponseCache()
+    async with FreshChatClient(config=test_config, cache=cache) as client:
+        first = await client.get("/users/abc")
+        second = await client.get("/users/abc")
+    assert first.body == second.body
+    assert len(mock_aioresponse.requests) == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_client_invalidates_cache_on_put(test_config, mock_aioresponse, base_url):
+    mock_aioresponse.get(f"{base_url}/conversations/abc", payload={}, repeat=True)
+    mock_aioresponse.put(f"{base_url}/conversations/abc", payload={})
+    cache = MemoryResponseCache()
+    async with FreshChatClient(config=test_config, cache=cache) as client:
+        await client.get("/conversations/abc")
+        await client.put("/conversations/abc", json={"status": "resolved"})
+        await client.get("/conversations/abc")
+    assert cache.stats.misses == 2
+    assert cache.stats.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_client_does_not_share_cached_responses_across_headers(
+    test_config, mock_aioresponse, base_url
+):
+    url = f"{base_url}/users/abc"
+    mock_aioresponse.get(url, payload={"locale": "en"})
+    mock_aioresponse.get(url, payload={"locale": "fr"})
+    cache = MemoryResponseCache()
+    async with FreshChatClient(config=test_config, cache=cache) as client:
+        for _ in range(2):
+            english = await client.get("/users/abc")
+            french = await client.get("/users/abc", headers={"Accept-Language": "fr"})
+            assert english.body == {"locale": "en"}
+            assert french.body == {"locale": "fr"}
+    assert (cache.stats.misses, cache.stats.hits) == (2, 2)
+
+
+def test_parent_paths():
+    assert parent_paths("conversations/abc/messages/") == [
+        "/conversations/abc/messages",
+        "/conversations/abc",
+        "/conversations",
+    ]
+
+
+def test_generation_changes_with_related_invalidations():
+    cache = MemoryResponseCache()
+    generation = cache.generation("/conversations/abc")
+    cache.invalidate("/users/abc")
+    cache.invalidate("/conversations/xyz")
+    assert cache.generation("/conversations/abc") == generation
+    for endpoint in ("/conversations/abc/messages", "/conversations"):
+        cache.invalidate(endpoint)
+        assert cache.generation("/conversations/abc") != generation
+        generation = cache.generation("/conversations/abc")
+
+
+def test_generation_counts_forgotten_invalidations():
+    cache = MemoryResponseCache(maxsize=2)
+    cache.invalidate("/conversations/abc")
+    generation = cache.generation("/conversations/abc")
+    cache.invalidate("/users/abc")
+    assert cache.generation("/conversations/abc") != generation
+
+
+@pytest.mark.asyncio
+async def test_client_does_not_cache_responses_invalidated_in_flight(
+    test_config, mock_aioresponse, base_url
+):
+    fetching, resolved = asyncio.Event(), asyncio.Event()
+
+    async def stale(*_, **__):
+        fetching.set()
+        await resolved.wait()
+        return CallbackResult(payload={"status": "new"})
+
+    url = f"{base_url}/conversations/abc"
+    mock_aioresponse.get(url, callback=stale)
+    mock_aioresponse.put(url, payload={"status": "resolved"})
+    mock_aioresponse.get(url, payload={"status": "resolved"})
+    cache = MemoryResponseCache()
+    async with FreshChatClient(config=test_config, cache=cache) as client:
+        request = asyncio.ensure_future(client.get("/conversations/abc"))
+        await fetching.wait()
+        await client.put("/conversations/abc", json={"status": "resolved"})
+        resolved.set()
+        assert (await request).body == {"status": "new"}
+        assert len(cache) == 0
+        response = await client.get("/conversations/abc")
+        assert response.body == {"status": "resolved"}
+
+
+@pytest.mark.asyncio
+async def test_cached_bodies_are_not_shared(test_config, mock_aioresponse, base_url):
+    mock_aioresponse.get(
+        f"{base_url}/conversations/abc",
+        payload={"conversation_id": "abc", "messages": [{"id": "message"}]},
+    )
+    cache = MemoryResponseCache()
+    async with FreshChatClient(config=test_config, cache=cache) as client:
+        first = await Conversation.get(client, "abc", fetch_user=False)
+        first.messages.append({"id": "other"})
+        second = await Conversation.get(client, "abc", fetch_user=False)
+        second.messages.clear()
+        third = await client.get("/conversations/abc")
+    assert third.body["messages"] == [{"id": "message"}]
+    assert len(mock_aioresponse.requests) == 1
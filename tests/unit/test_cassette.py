@@ -0,0 +1,144 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from freshchat.client import cassette
+from freshchat.client.cassette import (
+    REDACTED,
+    CassetteRecorder,
+    Recording,
+    load_cassette,
+    redact,
+    request_key,
+)
+from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import FreshChatConfiguration
+from freshchat.client.exceptions import ResourceNotFound
+from freshchat.models import Channels, User
+from freshchat.testing import CassettePlayer, FakeFreshchat, replay
+
+
+def test_redact_and_request_key():
+    headers = {"Authorization": "Bearer secret", "Accept": "application/json"}
+    assert redact(headers) == {"Authorization": REDACTED, "Accept": "application/json"}
+    assert request_key("get", "users/abc/", {"b": 2, "a": 1}) == (
+        "GET",
+        "/users/abc",
+        (("a", "1"), ("b", "2")),
+    )
+
+
+async def record(path):
+    async with FakeFreshchat() as fake:
+        with CassetteRecorder(str(path)) as recorder:
+            client = FreshChatClient(fake.configuration("secret"), recorder=recorder)
+            async with client:
+                user = await User.create(client, email="peter.griffin@test.ai")
+                await User.get(client, user.id)
+                channels = [c async for c in Channels.iter(client, page_size=2)]
+                with pytest.raises(ResourceNotFound):
+                    await User.get(client, "missing")
+    return user, channels
+
+
+@pytest.mark.asyncio
+async def test_recorder_writes_redacted_recordings(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    user, _ = await record(path)
+
+    assert "secret" not in path.read_text()
+    recordings = load_cassette(str(path))
+    assert [(r.method, r.endpoint, r.status) for r in recordings] == [
+        ("POST", "/users", 200),
+        ("GET", f"/users/{user.id}", 200),
+        ("GET", "/channels", 200),
+        ("GET", "/channels", 200),
+        ("GET", "/users/missing", 404),
+    ]
+    assert recordings[0].json == {"email": "peter.griffin@test.ai"}
+    assert recordings[0].request_headers["Authorization"] == REDACTED
+    assert recordings[1].body["id"] == user.id
+    assert recordings[3].params == {"page": "2", "items_per_page": "2"}
+    assert all(r.duration > 0 for r in recordings)
+    assert [r.start for r in recordings] == sorted(r.start for r in recordings)
+    assert len(path.read_text().splitlines()) == 5
+
+
+def test_recorder_writes_on_a_background_thread(tmp_path, monkeypatch):
+    openers = []
+
+    def tracked_open(*args, **kwargs):
+        openers.append(threading.current_thread())
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(cassette, "open", tracked_open, raising=False)
+    path = tmp_path / "cassette.jsonl"
+    response = SimpleNamespace(status=200, headers={}, body={"id": "abc"})
+    for _ in range(2):
+        with CassetteRecorder(str(path)) as recorder:
+            for index in range(100):
+                recorder.record(
+                    "GET",
+                    f"/users/{index}",
+                    None,
+                    None,
+                    {},
+                    response,
+                    time.perf_counter(),
+                )
+        assert recorder.recorded == 100
+
+    assert openers and threading.current_thread() not in openers
+    recordings = load_cassette(str(path))
+    assert [r.endpoint for r in recordings] == [f"/users/{i}" for i in range(100)] * 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("speed", [None, 100.0])
+async def test_replay_serves_the_recorded_responses(tmp_path, speed):
+    path = tmp_path / "cassette.jsonl"
+    user, channels = await record(path)
+    recordings = load_cassette(str(path))
+
+    async with CassettePlayer(recordings) as player:
+        config = FreshChatConfiguration(app_id="app", token="token", url=player.url)
+        async with FreshChatClient(config) as client:
+            assert await User.get(client, user.id) == user
+            assert [c async for c in Channels.iter(client, page_size=2)] == channels
+            result = await replay(client, recordings, speed=speed, concurrency=2)
+            with pytest.raises(ResourceNotFound):
+                await client.get("/users/never-recorded")
+
+    assert (result.requests, result.errors) == (5, 1)
+    assert result.throughput > 0
+    assert player.missed == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("speed", [0, -1.0])
+async def test_replay_rejects_non_positive_speed(speed):
+    async with FreshChatClient(FreshChatConfiguration("app", "token")) as client:
+        with pytest.raises(ValueError):
+            await replay(client, [], speed=speed)
+
+
+@pytest.mark.asyncio
+async def test_player_serves_text_and_empty_bodies():
+    recordings = [
+        Recording(
+            method="GET",
+            endpoint="/text",
+            headers={"Content-Type": "text/plain"},
+            body="plain",
+        ),
+        Recording(method="DELETE", endpoint="/users/abc", status=204),
+    ]
+    async with CassettePlayer(recordings, realtime=True) as player:
+        config = FreshChatConfiguration(app_id="app", token="token", url=player.url)
+        async with FreshChatClient(config) as client:
+            assert (await client.get("/text")).body == "plain"
+            response = await client.request("DELETE", "/users/abc")
+            assert (response.status, response.body) == (204, None)
+    assert player.served == 2
@@ -1,9 +1,15 @@
-from typing import AnyStr, Dict
+import asyncio
+import gc
+import threading
+from typing import AnyStr, AsyncIterator, Dict
 
 import pytest
 
 from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import PoolConfiguration
 from freshchat.client.responses import FreshChatResponse
+from freshchat.models import Channels
+from freshchat.testing import FakeFreshchat
 
 
 @pytest.fixture
@@ -12,15 +18,23 @@ def user_request_params() -> Dict[AnyStr, AnyStr]:
 
 
 @pytest.fixture
-def client_get(mock_aioresponse, test_config, base_url):
+async def client_get(
+    mock_aioresponse, test_config, base_url
+) -> AsyncIterator[FreshChatClient]:
     mock_aioresponse.get(f"{base_url}/users", payload={"foo": "bar"})
-    return FreshChatClient(config=test_config)
+    client = FreshChatClient(config=test_config)
+    yield client
+    await client.close()
 
 
 @pytest.fixture
-def client_post(mock_aioresponse, test_config, base_url):
+async def client_post(
+    mock_aioresponse, test_config, base_url
+) -> AsyncIterator[FreshChatClient]:
     mock_aioresponse.post(f"{base_url}/users", payload={"foo": "bar"})
-    return FreshChatClient(config=test_config)
+    client = FreshChatClient(config=test_config)
+    yield client
+    await client.close()
 
 
 def test_configuration_headers(test_config, token):
@@ -41,3 +55,73 @@ async def test_client_request_post(client_post, user_request_params):
     data = await resp.json()
     assert isinstance(resp, FreshChatResponse)
     assert {"foo": "bar"} == data
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_pooled_session(client_get, base_url, mock_aioresponse):
+    mock_aioresponse.get(f"{base_url}/users", payload={"foo": "bar"})
+    async with client_get as client:
+        await client.get(endpoint="/users")
+        session = client.session
+        await client.get(endpoint="/users")
+        assert client.session is session
+        assert not client.closed
+    assert client.closed
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_client_pool_configuration(test_config):
+    pool = PoolConfiguration(limit=5, limit_per_host=2, keepalive_timeout=1.0)
+    async with FreshChatClient(config=test_config, pool=pool) as client:
+        connector = client.session.connector
+        assert connector.limit == 5
+        assert connector.limit_per_host == 2
+
+
+@pytest.mark.asyncio
+async def test_client_request_merges_headers(
+    client_get, user_request_params, mock_aioresponse, base_url, token
+):
+    def callback(_, **kwargs):
+        assert kwargs["headers"] == {
+            "X-Foo": "bar",
+            "Authorization": f"Bearer {token}",
+        }
+
+    mock_aioresponse.get(f"{base_url}/users", payload={}, callback=callback)
+    user_request_params["headers"] = {"X-Foo": "bar"}
+    async with client_get as client:
+        await client.get(**user_request_params)
+
+
+def test_client_is_reusable_across_event_loops(recwarn):
+    fake = FakeFreshchat()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(fake.start(), loop).result()
+    client = FreshChatClient(config=fake.configuration())
+
+    async def list_channels():
+        channels = await Channels.get(client)
+        return channels, client.session
+
+    try:
+        sessions = []
+        for _ in range(2):
+            channels, session = asyncio.run(list_channels())
+            assert len(channels) == len(fake.channels)
+            sessions.append(session)
+        # the session of the closed loop is closed when the next one is created
+        assert sessions[0].closed and not sessions[1].closed
+        asyncio.run(client.close())
+        assert client.closed and sessions[1].closed
+        del sessions, session
+        gc.collect()
+        assert not [w for w in recwarn if "Unclosed" in str(w.message)]
+    finally:
+        asyncio.run_coroutine_threadsafe(fake.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
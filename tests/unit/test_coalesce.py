@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+from aioresponses import CallbackResult
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.exceptions import ResourceNotFound
+
+
+@pytest.fixture
+def coalescing_client(test_config):
+    return FreshChatClient(config=test_config, coalesce=True)
+
+
+async def slow_response(*_, **__):
+    await asyncio.sleep(0.05)
+    return CallbackResult(payload={"id": "abc"})
+
+
+@pytest.mark.asyncio
+async def test_identical_gets_share_one_request(
+    coalescing_client, mock_aioresponse, base_url
+):
+    mock_aioresponse.get(f"{base_url}/users/abc", payload={"id": "abc"}, repeat=True)
+    async with coalescing_client as client:
+        responses = await asyncio.gather(*(client.get("/users/abc") for _ in range(5)))
+    assert all(response is responses[0] for response in responses)
+    assert len(next(iter(mock_aioresponse.requests.values()))) == 1
+
+
+@pytest.mark.asyncio
+async def test_different_params_are_not_coalesced(
+    coalescing_client, mock_aioresponse, base_url
+):
+    mock_aioresponse.get(f"{base_url}/channels?page=1", payload={})
+    mock_aioresponse.get(f"{base_url}/channels?page=2", payload={})
+    async with coalescing_client as client:
+        first, second = await asyncio.gather(
+            client.get("/channels", params={"page": 1}),
+            client.get("/channels", params={"page": 2}),
+        )
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_errors_fan_out_to_all_waiters(
+    coalescing_client, mock_aioresponse, base_url
+):
+    mock_aioresponse.get(f"{base_url}/users/abc", status=404)
+    async with coalescing_client as client:
+        results = await asyncio.gather(
+            *(client.get("/users/abc") for _ in range(3)), return_exceptions=True
+        )
+    assert all(isinstance(result, ResourceNotFound) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_request(
+    coalescing_client, mock_aioresponse, base_url
+):
+    mock_aioresponse.get(f"{base_url}/users/abc", callback=slow_response)
+    async with coalescing_client as client:
+        cancelled = asyncio.ensure_future(client.get("/users/abc"))
+        waiter = asyncio.ensure_future(client.get("/users/abc"))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        response = await waiter
+    assert cancelled.cancelled()
+    assert response.body == {"id": "abc"}
@@ -0,0 +1,47 @@
+import pytest
+
+from freshchat.client import codec as codec_module
+from freshchat.client.client import FreshChatClient
+from freshchat.client.codec import STDLIB_CODEC, get_codec
+from freshchat.client.responses import FreshChatResponse
+
+
+def test_get_codec_by_name():
+    assert get_codec("json").name == "json"
+    with pytest.raises(ValueError):
+        get_codec("yaml")
+
+
+def test_get_codec_falls_back_to_stdlib(monkeypatch):
+    def missing():
+        raise ImportError
+
+    monkeypatch.setitem(codec_module.CODEC_FACTORIES, "orjson", missing)
+    monkeypatch.setitem(codec_module.CODEC_FACTORIES, "ujson", missing)
+    assert get_codec().name == "json"
+
+
+@pytest.mark.parametrize("codec", [STDLIB_CODEC, get_codec()])
+def test_codec_round_trip(codec):
+    document = {"messages": [{"message_parts": [{"text": {"content": "Grüße"}}]}]}
+    encoded = codec.dumps(document)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == document
+
+
+def test_decode_invalid_json_returns_text():
+    assert FreshChatResponse._decode(b"not json") == "not json"
+
+
+@pytest.mark.asyncio
+async def test_client_uses_codec(test_config, mock_aioresponse, base_url, request_json):
+    codec = get_codec()
+
+    def callback(_, **kwargs):
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+        assert request_json(kwargs) == {"email": "peter.griffin@test.ai"}
+
+    mock_aioresponse.post(f"{base_url}/users", payload={"id": "abc"}, callback=callback)
+    async with FreshChatClient(config=test_config, codec=codec) as client:
+        response = await client.post("/users", json={"email": "peter.griffin@test.ai"})
+    assert response.body == {"id": "abc"}
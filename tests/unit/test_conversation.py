@@ -68,26 +68,22 @@ def conversation_init() -> Conversation:
             "app_id": "random_uuid",
             "channel_id": "random_uuid",
             "users": [
-                asdict(
-                    User(
-                        **{
-                            "id": "random_uuid",
-                            "created_time": "timestamp_is_here",
-                            "email": "peter.griffin@test.ai",
-                        }
-                    )
+                User(
+                    **{
+                        "id": "random_uuid",
+                        "created_time": "timestamp_is_here",
+                        "email": "peter.griffin@test.ai",
+                    }
                 )
             ],
             "messages": [
-                asdict(
-                    Message(
-                        **{
-                            "app_id": "random_uuid",
-                            "actor_id": "random_uuid",
-                            "channel_id": "random_uuid",
-                            "message_parts": [{"text": {"content": "Hey dude!"}}],
-                        }
-                    )
+                Message(
+                    **{
+                        "app_id": "random_uuid",
+                        "actor_id": "random_uuid",
+                        "channel_id": "random_uuid",
+                        "message_parts": [{"text": {"content": "Hey dude!"}}],
+                    }
                 )
             ],
         }
@@ -106,13 +102,13 @@ def conversation_init() -> Conversation:
                     "email": "peter.griffin@test.ai",
                 }
             ),
-            asdict(conversation_init()),
+            conversation_init().to_payload(),
             asdict(conversation_response()),
         )
     ],
 )
 async def test_create_conversation(
-    user, json_body, output_data, test_client, mock_aioresponse, base_url
+    user, json_body, output_data, test_client, mock_aioresponse, base_url, request_json
 ):
     output_data["app_id"] = test_client.config.app_id
     json_body["app_id"] = test_client.config.app_id
@@ -122,7 +118,7 @@ async def test_create_conversation(
     json_body["messages"][0]["channel_id"] = test_client.config.default_channel_id
 
     def callback(_, **kwargs):
-        assert kwargs.get("json") == json_body
+        assert request_json(kwargs) == json_body
 
     mock_aioresponse.get(f"{base_url}/users/{user.id}", payload=asdict(user))
     mock_aioresponse.post(
@@ -144,7 +140,7 @@ async def test_create_conversation(
         (
             "Hello dude!",
             conversation_response(),
-            asdict(message_init()),
+            message_init().to_payload(),
             asdict(message_response()),
         )
     ],
@@ -157,12 +153,13 @@ async def test_create_message(
     test_client,
     mock_aioresponse,
     base_url,
+    request_json,
 ):
     output_data["app_id"] = test_client.config.app_id
     output_data["channel_id"] = test_client.config.default_channel_id
 
     def callback(_, **kwargs):
-        assert kwargs.get("json") == json_body
+        assert request_json(kwargs) == json_body
 
     mock_aioresponse.post(
         f"{base_url}/conversations/{conversation.conversation_id}/messages",
@@ -172,3 +169,66 @@ async def test_create_message(
 
     message_new = await conversation.send(client=test_client, message=message)
     assert asdict(message_new) == output_data
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_fetches_user_and_conversation(
+    test_client, mock_aioresponse, base_url
+):
+    conversation = conversation_response()
+    user = conversation.users[0]
+    output_data = asdict(conversation)
+    mock_aioresponse.get(f"{base_url}/users/{user.id}", payload=asdict(user))
+    mock_aioresponse.get(
+        f"{base_url}/conversations/{conversation.conversation_id}",
+        payload=output_data,
+    )
+    result = await Conversation.get(
+        client=test_client,
+        conversation_id=conversation.conversation_id,
+        user_id=user.id,
+    )
+    assert result.users == [user]
+    assert result.conversation_id == conversation.conversation_id
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_with_loaded_user(
+    test_client, mock_aioresponse, base_url
+):
+    conversation = conversation_response()
+    user = conversation.users[0]
+    mock_aioresponse.get(
+        f"{base_url}/conversations/{conversation.conversation_id}",
+        payload=asdict(conversation),
+    )
+    result = await Conversation.get(
+        client=test_client, conversation_id=conversation.conversation_id, user=user
+    )
+    assert result.users == [user]
+    assert len(mock_aioresponse.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_conversation_without_fetching_user(
+    test_client, mock_aioresponse, base_url, request_json
+):
+    def callback(_, **kwargs):
+        assert request_json(kwargs)["users"] == [{"id": "random_uuid"}]
+
+    mock_aioresponse.post(
+        f"{base_url}/conversations",
+        payload=asdict(conversation_response()),
+        callback=callback,
+    )
+    conversation = await Conversation.create(
+        client=test_client, user_id="random_uuid", fetch_user=False
+    )
+    assert conversation.users == [User(id="random_uuid")]
+    assert len(mock_aioresponse.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_requires_user(test_client):
+    with pytest.raises(ValueError):
+        await Conversation.get(client=test_client, conversation_id="random_uuid")
@@ -0,0 +1,48 @@
+import pytest
+
+from freshchat.webhook.dedup import Deduplicator, MemoryDedupBackend, event_key
+
+
+def test_event_key_of_message_events_uses_message_id():
+    payload = {
+        "action": "message_create",
+        "action_time": "time",
+        "data": {"message": {"id": "message_uuid"}},
+    }
+    assert event_key(payload) == "message:message_uuid"
+
+
+def test_event_key_of_other_events_uses_action_time_and_actor():
+    payload = {
+        "actor": {"actor_type": "agent", "actor_id": "agent_uuid"},
+        "action": "conversation_resolution",
+        "action_time": "time",
+        "data": {"resolve": {}},
+    }
+    assert event_key(payload) == "conversation_resolution:time:agent:agent_uuid"
+    assert event_key({"action": "conversation_resolution"}) is None
+
+
+@pytest.mark.asyncio
+async def test_deduplicator_detects_accepted_events():
+    deduplicator = Deduplicator()
+    assert not await deduplicator.seen("key")
+    assert await deduplicator.mark("key")
+    assert await deduplicator.seen("key")
+    assert not await deduplicator.mark("key")
+    assert not await deduplicator.seen(None)
+    assert await deduplicator.mark(None)
+    assert deduplicator.stats.checked == 2
+    assert deduplicator.stats.duplicates == 2
+    assert deduplicator.stats.duplicate_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_deduplicator_unmark_and_bounded_backend():
+    deduplicator = Deduplicator(backend=MemoryDedupBackend(maxsize=2))
+    for key in ("a", "b", "c"):
+        await deduplicator.mark(key)
+    assert not await deduplicator.seen("a")
+    await deduplicator.unmark("c")
+    assert not await deduplicator.seen("c")
+    assert await deduplicator.seen("b")
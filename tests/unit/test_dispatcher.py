@@ -0,0 +1,64 @@
+import pytest
+
+from freshchat.models.events import IncomingEvent
+from freshchat.webhook.dispatcher import EventDispatcher
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_events_by_action():
+    dispatcher = EventDispatcher()
+    received = []
+
+    @dispatcher.on("message_create", "conversation_reopen")
+    async def on_message(event):
+        received.append(("message", event.action))
+
+    @dispatcher.on("conversation_resolution")
+    async def on_resolve(event):
+        received.append(("resolve", event.action))
+
+    assert await dispatcher(IncomingEvent.lazy({"action": "message_create"})) == 1
+    assert await dispatcher(IncomingEvent.lazy({"action": "conversation_reopen"}))
+    assert await dispatcher.dispatch(
+        IncomingEvent(action="conversation_resolution", data=None)
+    )
+    assert received == [
+        ("message", "message_create"),
+        ("message", "conversation_reopen"),
+        ("resolve", "conversation_resolution"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_unknown_action_to_fallback():
+    dispatcher = EventDispatcher()
+    event = IncomingEvent.lazy({"action": "unknown"})
+    assert await dispatcher(event) == 0
+
+    received = []
+
+    @dispatcher.fallback
+    async def fallback(event):
+        received.append(event)
+
+    assert await dispatcher(event) == 1
+    assert received == [event]
+    assert not event.is_parsed
+
+
+@pytest.mark.asyncio
+async def test_dispatch_calls_handlers_in_registration_order():
+    dispatcher = EventDispatcher()
+    calls = []
+
+    async def first(_):
+        calls.append("first")
+
+    async def second(_):
+        calls.append("second")
+
+    dispatcher.add_handler("message_create", first)
+    dispatcher.add_handler("message_create", second)
+    assert dispatcher.handlers("message_create") == [first, second]
+    assert await dispatcher(IncomingEvent.lazy({"action": "message_create"})) == 2
+    assert calls == ["first", "second"]
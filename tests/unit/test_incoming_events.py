@@ -5,7 +5,15 @@ import pytest
 from freshchat.models import Conversation
 from freshchat.models import Message as OutgoingMessage
 from freshchat.models import User
-from freshchat.models.events import IncomingEvent, Message, Reopen, Resolve
+from freshchat.models.events import (
+    Assignment,
+    EventRegistry,
+    IncomingEvent,
+    Message,
+    Reopen,
+    Resolve,
+    event_registry,
+)
 
 
 @pytest.mark.asyncio
@@ -162,3 +170,98 @@ from freshchat.models.events import IncomingEvent, Message, Reopen, Resolve
 async def test_create_message(incoming_event, event_type):
     incoming_event = IncomingEvent(**incoming_event)
     assert isinstance(incoming_event.data, event_type)
+
+
+def message_event_payload():
+    return {
+        "actor": {"actor_type": "user", "actor_id": "user_uuid"},
+        "action": "message_create",
+        "action_time": "time",
+        "data": {
+            "message": {
+                "id": "message_uuid",
+                "actor_type": "user",
+                "actor_id": "user_uuid",
+                "message_parts": [{"text": {"content": "Hello dude!"}}],
+                "conversation_id": "conversation_uuid",
+                "app_id": "app_uuid",
+                "channel_id": "channel_uuid",
+            }
+        },
+    }
+
+
+def test_lazy_event_peeks_without_parsing():
+    event = IncomingEvent.lazy(message_event_payload())
+    assert event.action == "message_create"
+    assert event.actor.actor_id == "user_uuid"
+    assert event.conversation_id == "conversation_uuid"
+    assert not event.is_parsed
+
+
+def test_lazy_event_parses_data_once():
+    payload = message_event_payload()
+    event = IncomingEvent.lazy(payload)
+    data = event.data
+    assert isinstance(data, Message)
+    assert data.conversation.conversation_id == "conversation_uuid"
+    assert event.data is data
+    assert payload == message_event_payload()
+    assert event.conversation_id == "conversation_uuid"
+
+
+def test_lazy_event_materialises_incoming_event():
+    lazy_event = IncomingEvent.lazy(message_event_payload())
+    event = lazy_event.materialise()
+    assert event == IncomingEvent(**message_event_payload())
+    assert event.data is lazy_event.data
+    assert event.conversation_id == "conversation_uuid"
+
+
+def test_lazy_event_conversation_id_of_nested_conversation():
+    event = IncomingEvent.lazy(
+        {
+            "action": "conversation_resolution",
+            "data": {"resolve": {"conversation": {"conversation_id": "abc"}}},
+        }
+    )
+    assert event.conversation_id == "abc"
+    assert IncomingEvent.lazy({"action": "unknown"}).conversation_id is None
+
+
+def test_assignment_and_user_events_are_parsed():
+    event = IncomingEvent(
+        action="conversation_assignment",
+        data={
+            "assignment": {
+                "assignor": "agent",
+                "to_agent_id": "agent_uuid",
+                "conversation": {"conversation_id": "abc"},
+            }
+        },
+    )
+    assert isinstance(event.data, Assignment)
+    assert event.conversation_id == "abc"
+    event = IncomingEvent(
+        action="user_create", data={"user": {"id": "user_uuid", "unknown": 1}}
+    )
+    assert event.data == User(id="user_uuid")
+
+
+def test_registry_routes_by_action_and_keeps_unknown_data():
+    registry = EventRegistry()
+    registry.register("custom", Resolve, actions=("custom_action",))
+    data = {"other": {}, "custom": {"resolver": "agent"}}
+    assert registry.parse(data, "custom_action") == Resolve(resolver="agent")
+    assert registry.parse(data) == Resolve(resolver="agent")
+    assert registry.parse({"unknown": {}}) == {"unknown": {}}
+    assert "custom" in registry and "message" not in registry
+
+
+def test_registered_event_types_extend_the_default_registry():
+    event_registry.register("custom", lambda payload: payload["value"])
+    try:
+        event = IncomingEvent(action="custom", data={"custom": {"value": 42}})
+        assert event.data == 42
+    finally:
+        event_registry._factories.pop("custom")
@@ -0,0 +1,86 @@
+from uuid import uuid4
+
+import pytest
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.exceptions import ResourceNotFound
+from freshchat.client.metrics import (
+    Histogram,
+    MetricsCollector,
+    RequestMetrics,
+    endpoint_template,
+)
+
+
+def test_endpoint_template_replaces_ids():
+    conversation_id = str(uuid4())
+    assert (
+        endpoint_template(f"conversations/{conversation_id}/messages/")
+        == "/conversations/{id}/messages"
+    )
+    assert endpoint_template("/users/42?page=2") == "/users/{id}"
+    assert endpoint_template("/channels") == "/channels"
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [2, 3]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(5.65)
+
+
+def test_collector_renders_prometheus_text():
+    collector = MetricsCollector(buckets=(0.1, 1.0))
+    collector.request_started("GET", "/users/{id}")
+    collector.request_finished(
+        RequestMetrics(
+            method="GET",
+            endpoint="/users/{id}",
+            duration=0.05,
+            status=200,
+            bytes_out=0,
+            bytes_in=10,
+        )
+    )
+    text = collector.render()
+    labels = 'method="GET",endpoint="/users/{id}",status="200",exception=""'
+    assert f'freshchat_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+    assert f'freshchat_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in text
+    assert f"freshchat_request_duration_seconds_count{{{labels}}} 1" in text
+    assert f"freshchat_response_bytes_received_total{{{labels}}} 10" in text
+    assert "# TYPE freshchat_request_duration_seconds histogram" in text
+    assert "freshchat_requests_in_flight 0" in text
+
+
+@pytest.mark.asyncio
+async def test_client_reports_every_attempt(mock_aioresponse, test_config, base_url):
+    collector = MetricsCollector()
+    client = FreshChatClient(config=test_config, hooks=[collector])
+    mock_aioresponse.post(f"{base_url}/users/abc1/conversations", payload={"a": 1})
+    mock_aioresponse.get(f"{base_url}/users/abc2", status=404, payload={})
+    async with client:
+        await client.post("/users/abc1/conversations", json={"name": "x"})
+        with pytest.raises(ResourceNotFound):
+            await client.get("/users/abc2")
+
+    post, get = collector.histograms
+    assert post == ("POST", "/users/{id}/conversations", "200", "")
+    assert get == ("GET", "/users/{id}", "404", "ResourceNotFound")
+    assert collector.bytes_out[post] == len(b'{"name": "x"}')
+    assert collector.bytes_in[post] == len(b'{"a": 1}')
+    assert collector.histograms[get].count == 1
+    assert collector.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_reports_connection_errors(test_config, base_url):
+    collector = MetricsCollector()
+    client = FreshChatClient(config=test_config, hooks=[collector])
+    async with client:
+        with pytest.raises(Exception):
+            await client.get("/users/abc3")
+    ((method, endpoint, status, exception),) = collector.histograms
+    assert (method, endpoint, status) == ("GET", "/users/{id}", "")
+    assert exception
@@ -0,0 +1,76 @@
+import pickle
+from dataclasses import asdict, dataclass, field, fields
+
+import pytest
+
+from freshchat.models import Channels, Conversation, Message, User
+from freshchat.models.base import slotted
+from freshchat.models.events import IncomingEvent
+
+
+@pytest.mark.parametrize(
+    "model", [User, Message, Conversation, Channels, IncomingEvent]
+)
+def test_models_have_no_instance_dict(model):
+    instance = model(data={}) if model is IncomingEvent else model()
+    assert not hasattr(instance, "__dict__")
+    assert model.__slots__ == tuple(f.name for f in fields(model))
+    with pytest.raises(AttributeError):
+        instance.unknown = "value"
+
+
+def test_slotted_models_keep_dataclass_behaviour():
+    user = User(id="random_uuid", email="peter.griffin@test.ai")
+    conversation = Conversation(conversation_id="conversation_uuid", users=[user])
+    assert conversation.get_endpoint == "/conversations/conversation_uuid"
+    assert Conversation.endpoint == "/conversations"
+    assert asdict(conversation)["users"][0]["email"] == "peter.griffin@test.ai"
+    assert pickle.loads(pickle.dumps(conversation)) == conversation
+
+
+def test_slotted_requires_dataclass():
+    with pytest.raises(TypeError):
+
+        @slotted
+        class NotADataclass:
+            pass
+
+
+def test_slotted_keeps_default_factories():
+    @slotted
+    @dataclass
+    class Model:
+        items: list = field(default_factory=list)
+
+    first, second = Model(), Model()
+    first.items.append(1)
+    assert second.items == []
+
+
+def test_to_payload_skips_empty_fields():
+    message_parts = [{"text": {"content": "Hello dude!"}}]
+    conversation = Conversation(
+        app_id="app_uuid",
+        users=[User(id="user_uuid")],
+        messages=[Message(actor_id="user_uuid", message_parts=message_parts)],
+    )
+    payload = conversation.to_payload()
+    assert payload == {
+        "app_id": "app_uuid",
+        "status": "new",
+        "users": [{"id": "user_uuid"}],
+        "messages": [
+            {
+                "actor_type": "user",
+                "actor_id": "user_uuid",
+                "message_type": "normal",
+                "message_parts": message_parts,
+            }
+        ],
+    }
+    assert payload["messages"][0]["message_parts"][0] is message_parts[0]
+
+
+def test_from_payload_ignores_unknown_keys():
+    user = User.from_payload({"id": "user_uuid", "restore_id": "unknown"})
+    assert user == User(id="user_uuid")
@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from freshchat.client.client import FreshChatClient
+from freshchat.models import (
+    Channel,
+    Channels,
+    Conversation,
+    Message,
+    User,
+    format_time,
+)
+from freshchat.models.pagination import next_page_params, paginate
+from freshchat.testing import FakeFreshchat
+
+
+def channels_page(page: int, total_pages: int, next_link: bool = True):
+    body = {
+        "channels": [
+            # fields unknown to the model are ignored
+            {"id": f"channel_{page}_{index}", "locale": "en"}
+            for index in range(2)
+        ],
+        "pagination": {
+            "total_items": total_pages * 2,
+            "total_pages": total_pages,
+            "current_page": page,
+            "items_per_page": 2,
+        },
+        "links": {},
+    }
+    if next_link and page < total_pages:
+        body["links"]["next_page"] = {
+            "href": f"/channels?page={page + 1}&items_per_page=2",
+            "rel": "channels",
+            "type": "GET",
+        }
+    return body
+
+
+def test_next_page_params_from_link():
+    assert next_page_params(channels_page(1, 2), {"page": 1}) == {
+        "page": "2",
+        "items_per_page": "2",
+    }
+
+
+def test_next_page_params_from_pagination():
+    body = channels_page(1, 2, next_link=False)
+    assert next_page_params(body, {"page": 1, "items_per_page": 2}) == {
+        "page": 2,
+        "items_per_page": 2,
+    }
+    assert next_page_params(channels_page(2, 2), {"page": 2}) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_channels_iter_follows_pages(
+    prefetch, test_client, mock_aioresponse, base_url
+):
+    mock_aioresponse.get(
+        f"{base_url}/channels?page=1&items_per_page=2", payload=channels_page(1, 3)
+    )
+    mock_aioresponse.get(
+        f"{base_url}/channels?page=2&items_per_page=2", payload=channels_page(2, 3)
+    )
+    mock_aioresponse.get(
+        f"{base_url}/channels?page=3&items_per_page=2",
+        payload=channels_page(3, 3, next_link=False),
+    )
+    channels = [
+        channel
+        async for channel in Channels.iter(test_client, page_size=2, prefetch=prefetch)
+    ]
+    assert all(isinstance(channel, Channel) for channel in channels)
+    assert [channel.id for channel in channels] == [
+        f"channel_{page}_{index}" for page in (1, 2, 3) for index in range(2)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_paginate_stops_on_empty_page(test_client, mock_aioresponse, base_url):
+    mock_aioresponse.get(
+        f"{base_url}/channels?page=1", payload={"channels": [], "pagination": {}}
+    )
+    items = [
+        item async for item in paginate(test_client, "/channels", "channels", dict)
+    ]
+    assert items == []
+
+
+def test_format_time():
+    moment = datetime(2020, 1, 1, 10, 0, 0, 123456)
+    assert format_time(moment) == "2020-01-01T10:00:00.123Z"
+    offset = timezone(timedelta(hours=2))
+    assert format_time(moment.replace(tzinfo=offset)) == "2020-01-01T08:00:00.123Z"
+
+
+@pytest.mark.asyncio
+async def test_conversation_iter_messages_since(
+    test_client, mock_aioresponse, base_url
+):
+    endpoint = f"{base_url}/conversations/random_uuid/messages"
+    mock_aioresponse.get(
+        f"{endpoint}?from_time=2020-01-01T10:00:00.000Z&page=1&items_per_page=1",
+        payload={
+            "messages": [{"id": "message_1", "unknown": True}],
+            "pagination": {"total_pages": 2, "current_page": 1},
+        },
+    )
+    mock_aioresponse.get(
+        f"{endpoint}?from_time=2020-01-01T10:00:00.000Z&page=2&items_per_page=1",
+        payload={
+            "messages": [{"id": "message_2"}],
+            "pagination": {"total_pages": 2, "current_page": 2},
+        },
+    )
+    conversation = Conversation(conversation_id="random_uuid")
+    messages = [
+        message
+        async for message in conversation.iter_messages(
+            test_client, since=datetime(2020, 1, 1, 10), page_size=1
+        )
+    ]
+    assert messages == [Message(id="message_1"), Message(id="message_2")]
+
+
+@pytest.mark.asyncio
+async def test_conversation_iter_messages_streams_the_transcript():
+    async with FakeFreshchat() as fake:
+        async with FreshChatClient(config=fake.configuration()) as client:
+            user = await User.create(client, email="peter.griffin@test.ai")
+            conversation = await Conversation.create(
+                client, user=user, init_message="Hey dude!"
+            )
+            for index in range(5):
+                fake.add_message(conversation.conversation_id, f"Message {index}")
+            sent = fake.messages[conversation.conversation_id]
+
+            messages = [
+                message
+                async for message in conversation.iter_messages(client, page_size=2)
+            ]
+            assert [message.id for message in messages] == [
+                message["id"] for message in sent
+            ]
+            assert fake.requests["GET /conversations/{id}/messages"] == 3
+
+            since = sent[3]["created_time"]
+            assert [
+                message.created_time
+                async for message in conversation.iter_messages(client, since=since)
+            ] == [
+                message["created_time"]
+                for message in sent
+                if message["created_time"] >= since
+            ]
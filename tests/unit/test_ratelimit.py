@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.ratelimit import (
+    RateLimit,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+from freshchat.models import Channels
+from freshchat.testing import FakeFreshchat
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("2", 2.0), ("0.5", 0.5), ("-1", 0.0), (None, None), ("soon", None)],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    bucket = TokenBucket(RateLimit(requests=50, period=1.0, burst=1))
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_retry_after_blocks():
+    bucket = TokenBucket(RateLimit(requests=1000, period=1.0))
+    bucket.update(retry_after=0.05)
+    assert await bucket.acquire() >= 0.04
+
+
+def test_rate_limiter_matches_longest_prefix():
+    limiter = RateLimiter(
+        limit=RateLimit(requests=10),
+        endpoints={
+            "/conversations": RateLimit(requests=5),
+            "/conversations/abc/messages": RateLimit(requests=1),
+        },
+    )
+    conversation_buckets = limiter.buckets("/conversations/xyz")
+    message_buckets = limiter.buckets("conversations/abc/messages")
+    assert len(conversation_buckets) == 2
+    assert conversation_buckets[1].limit.requests == 5
+    assert message_buckets[1].limit.requests == 1
+    assert limiter.buckets("/users") == [limiter.account]
+
+
+def test_rate_limiter_learns_limit_from_headers():
+    limiter = RateLimiter()
+    limiter.update(
+        "/users", 200, {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "3"}
+    )
+    assert limiter.account.capacity == 100
+    assert limiter.account.tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_client_waits_for_rate_limiter(test_config, mock_aioresponse, base_url):
+    mock_aioresponse.get(
+        f"{base_url}/users",
+        payload={},
+        headers={"X-RateLimit-Remaining": "0"},
+        repeat=True,
+    )
+    limiter = RateLimiter(limit=RateLimit(requests=20, period=1.0))
+    async with FreshChatClient(config=test_config, rate_limiter=limiter) as client:
+        await client.get("/users")
+        start = time.monotonic()
+        await client.get("/users")
+    assert time.monotonic() - start >= 0.04
+
+
+def test_rate_limited_client_is_reusable_across_event_loops():
+    fake = FakeFreshchat()
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(fake.start(), loop).result()
+    limiter = RateLimiter(RateLimit(requests=100, period=1.0, burst=1))
+    client = FreshChatClient(config=fake.configuration(), rate_limiter=limiter)
+
+    async def list_channels():
+        # the last requests wait on the lock of the bucket
+        await asyncio.gather(*(Channels.get(client) for _ in range(3)))
+
+    try:
+        for _ in range(2):
+            asyncio.run(list_channels())
+        asyncio.run(client.close())
+    finally:
+        asyncio.run_coroutine_threadsafe(fake.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+    assert fake.requests["GET /channels"] == 6
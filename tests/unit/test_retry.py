@@ -0,0 +1,77 @@
+import pytest
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.exceptions import ServerUnavailable, TooManyRequests
+from freshchat.client.retry import RetryPolicy
+
+
+@pytest.fixture
+def retries():
+    return []
+
+
+@pytest.fixture
+def retry_client(test_config, retries):
+    policy = RetryPolicy(max_attempts=3, backoff_factor=0.001, on_retry=retries.append)
+    return FreshChatClient(config=test_config, retry=policy)
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(backoff_factor=1.0, max_backoff=3.0)
+    assert all(0 <= policy.backoff(attempt) <= 3.0 for attempt in range(1, 10))
+
+
+@pytest.mark.asyncio
+async def test_get_is_retried(retry_client, retries, mock_aioresponse, base_url):
+    mock_aioresponse.get(f"{base_url}/users", status=503)
+    mock_aioresponse.get(f"{base_url}/users", payload={"foo": "bar"})
+    async with retry_client as client:
+        response = await client.get("/users")
+    assert response.body == {"foo": "bar"}
+    assert len(retries) == 1
+    assert retries[0].attempt == 1
+    assert isinstance(retries[0].exception, ServerUnavailable)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured(
+    retry_client, retries, mock_aioresponse, base_url
+):
+    mock_aioresponse.get(
+        f"{base_url}/users", status=429, headers={"Retry-After": "0.02"}
+    )
+    mock_aioresponse.get(f"{base_url}/users", payload={})
+    async with retry_client as client:
+        await client.get("/users")
+    assert retries[0].delay == 0.02
+
+
+@pytest.mark.asyncio
+async def test_retries_stop_after_max_attempts(
+    retry_client, retries, mock_aioresponse, base_url
+):
+    mock_aioresponse.put(f"{base_url}/users", status=429, repeat=True)
+    async with retry_client as client:
+        with pytest.raises(TooManyRequests):
+            await client.put("/users")
+    assert len(retries) == 2
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_by_default(
+    retry_client, retries, mock_aioresponse, base_url
+):
+    mock_aioresponse.post(f"{base_url}/users", status=503)
+    async with retry_client as client:
+        with pytest.raises(ServerUnavailable):
+            await client.post("/users")
+    assert retries == []
+
+
+@pytest.mark.asyncio
+async def test_retries_respect_time_budget(test_config, mock_aioresponse, base_url):
+    mock_aioresponse.get(f"{base_url}/users", status=503, headers={"Retry-After": "5"})
+    policy = RetryPolicy(max_time=1.0)
+    async with FreshChatClient(config=test_config, retry=policy) as client:
+        with pytest.raises(ServerUnavailable):
+            await client.get("/users")
@@ -0,0 +1,104 @@
+from base64 import b64encode
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import PKCS1_v1_5
+
+from freshchat.webhook.security import SecurityManager
+
+PAYLOAD = b'{"actor": {"actor_type": "user"}, "action": "message_create"}'
+
+
+def public_pem(key) -> str:
+    body = b64encode(key.publickey().exportKey("DER")).decode()
+    return f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
+
+
+def sign(key, data: bytes) -> str:
+    return b64encode(PKCS1_v1_5.new(key).sign(SHA256.new(data))).decode()
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return RSA.generate(1024)
+
+
+@pytest.fixture(scope="module")
+def rotated_key():
+    return RSA.generate(1024)
+
+
+def test_verify_signature(private_key):
+    manager = SecurityManager(public_pem(private_key))
+    signature = sign(private_key, PAYLOAD)
+    assert manager.verify_signature(signature, PAYLOAD)
+    assert manager.verify_signature(signature, PAYLOAD.decode())
+    assert not manager.verify_signature(signature, PAYLOAD + b" ")
+
+
+def test_key_is_parsed_once(private_key, monkeypatch):
+    manager = SecurityManager(public_pem(private_key))
+    signature = sign(private_key, PAYLOAD)
+    manager.verify_signature(signature, PAYLOAD)
+
+    def fail(*_):
+        raise AssertionError("the key should not be parsed again")
+
+    monkeypatch.setattr(RSA, "importKey", fail)
+    assert manager.verify_signature(signature, PAYLOAD)
+
+
+def test_key_rotation(private_key, rotated_key):
+    manager = SecurityManager(public_pem(private_key))
+    old_signature = sign(private_key, PAYLOAD)
+    new_signature = sign(rotated_key, PAYLOAD)
+    assert not manager.verify_signature(new_signature, PAYLOAD)
+
+    manager.add_key(public_pem(rotated_key))
+    assert manager.verify_signature(old_signature, PAYLOAD)
+    assert manager.verify_signature(new_signature, PAYLOAD)
+
+    manager.remove_key(public_pem(private_key))
+    assert not manager.verify_signature(old_signature, PAYLOAD)
+    assert manager.verify_signature(new_signature, PAYLOAD)
+
+
+def test_invalid_key():
+    manager = SecurityManager("not a key")
+    with pytest.raises(ValueError):
+        manager.verify_signature("", PAYLOAD)
+    with pytest.raises(ValueError):
+        manager.add_key("not a key either")
+    with pytest.raises(ValueError):
+        SecurityManager([])
+
+
+@pytest.mark.asyncio
+async def test_verify_async_on_thread_pool(private_key):
+    manager = SecurityManager(public_pem(private_key), max_workers=2)
+    signature = sign(private_key, PAYLOAD)
+    try:
+        assert await manager.verify_async(signature, PAYLOAD)
+        results = await manager.verify_many(
+            [(signature, PAYLOAD), (signature, b"tampered"), (signature, PAYLOAD)]
+        )
+    finally:
+        manager.close()
+    assert results == [True, False, True]
+    stats = manager.stats
+    assert (stats.submitted, stats.completed, stats.invalid) == (4, 4, 1)
+    assert stats.queue_depth == 0
+    assert stats.pool_size == 2
+
+
+@pytest.mark.asyncio
+async def test_verify_async_on_process_pool(private_key):
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        manager = SecurityManager(public_pem(private_key), executor=executor)
+        assert await manager.verify_many([(sign(private_key, PAYLOAD), PAYLOAD)]) == [
+            True
+        ]
+        manager.close()
+    assert manager.stats.pool_size == 1
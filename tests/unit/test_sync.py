@@ -0,0 +1,91 @@
+import asyncio
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import pytest
+
+from freshchat.client.exceptions import ResourceNotFound
+from freshchat.client.sync import SyncFreshChatClient
+from freshchat.models import User
+from freshchat.testing import FakeFreshchat
+
+
+@pytest.fixture
+def fake_and_client():
+    fake = FakeFreshchat()
+    client = SyncFreshChatClient(config=None, timeout=10)
+    # the fake is served on the background loop of the client
+    client.run(fake.start())
+    client.client.config = fake.configuration()
+    yield fake, client
+    client.run(fake.stop())
+    client.close()
+
+
+def test_sync_client_runs_the_model_operations(fake_and_client):
+    fake, client = fake_and_client
+    user = client.create_user(email="peter.griffin@test.ai")
+    assert client.get_user(user.id) == user
+    conversation = client.create_conversation(user=user, init_message="Hey dude!")
+    message = client.send_message(conversation, "Hello dude!")
+    assert message.conversation_id == conversation.conversation_id
+    assert client.resolve_conversation(conversation).status == "resolved"
+    assert len(client.list_channels(page_size=2)) == len(fake.channels)
+    assert client.call(User.get, user_id=user.id) == user
+    with pytest.raises(ResourceNotFound):
+        client.get_user("missing")
+
+
+def test_sync_client_is_shared_by_threads(fake_and_client):
+    fake, client = fake_and_client
+    user = client.create_user(email="peter.griffin@test.ai")
+    session = client.client.session
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        users = list(executor.map(lambda _: client.get_user(user.id), range(64)))
+
+    assert users == [user] * 64
+    assert client.client.session is session
+    assert fake.requests["GET /users/{id}"] == 64
+
+
+def test_sync_client_close_stops_the_loop():
+    client = SyncFreshChatClient(config=None)
+    loop = client.loop
+    thread = client._thread
+    assert thread.is_alive() and thread is not threading.current_thread()
+    client.close()
+    assert not thread.is_alive()
+    assert loop.is_closed()
+    client.close()
+
+
+def test_sync_client_cancels_calls_which_time_out():
+    client = SyncFreshChatClient(config=None)
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with client:
+        with pytest.raises(TimeoutError):
+            client.run(slow(), timeout=0.01)
+        assert cancelled.wait(1)
+
+
+def test_sync_client_refuses_calls_from_its_loop(recwarn):
+    client = SyncFreshChatClient(config=None)
+
+    async def nested():
+        with pytest.raises(RuntimeError):
+            client.get("/users/abc")
+
+    with client:
+        client.run(nested())
+    gc.collect()
+    assert not [w for w in recwarn if "never awaited" in str(w.message)]
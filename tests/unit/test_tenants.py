@@ -0,0 +1,151 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from freshchat.client.cache import MemoryResponseCache
+from freshchat.client.configuration import FreshChatConfiguration
+from freshchat.client.tenants import TenantClientPool
+from freshchat.models import User
+from freshchat.testing import FakeFreshchat
+
+
+@pytest.mark.asyncio
+async def test_tenants_share_one_session():
+    async with FakeFreshchat() as fake, TenantClientPool() as tenants:
+        tenants.register("acme", fake.configuration("acme-token"))
+        tenants.register("globex", fake.configuration("globex-token"))
+        acme, globex = tenants.client("acme"), tenants.client("globex")
+
+        assert acme is not globex
+        assert acme.session is globex.session is tenants.session
+        assert acme.rate_limiter is not globex.rate_limiter
+        assert tenants.client("acme") is acme
+
+        user = await User.create(acme, email="peter.griffin@test.ai")
+        assert await User.get(globex, user.id) == user
+        assert fake.requests["GET /users/{id}"] == 1
+
+        await acme.close()
+        assert not tenants.session.closed
+    assert len(tenants) == 0
+
+
+def echo_app() -> web.Application:
+    async def echo(request: web.Request) -> web.Response:
+        return web.json_response({"authorization": request.headers["Authorization"]})
+
+    app = web.Application()
+    app.router.add_get("/echo", echo)
+    return app
+
+
+def config_of(server: TestServer, token: str) -> FreshChatConfiguration:
+    return FreshChatConfiguration(
+        app_id="app", token=token, url=str(server.make_url(""))
+    )
+
+
+@pytest.mark.asyncio
+async def test_tenants_send_their_own_token():
+    async with TestServer(echo_app()) as server, TenantClientPool() as tenants:
+        for tenant_id in ("acme", "globex"):
+            client = tenants.client(tenant_id, config_of(server, tenant_id))
+            response = await client.get("/echo")
+            assert response.body == {"authorization": f"Bearer {tenant_id}"}
+        assert not tenants.session.cookie_jar
+
+
+@pytest.mark.asyncio
+async def test_tenants_do_not_share_cached_responses():
+    with pytest.raises(TypeError):
+        TenantClientPool(cache=MemoryResponseCache())
+
+    pool = TenantClientPool(cache=MemoryResponseCache)
+    async with TestServer(echo_app()) as server, pool as tenants:
+        for _ in range(2):
+            for tenant_id in ("acme", "globex"):
+                client = tenants.client(tenant_id, config_of(server, tenant_id))
+                response = await client.get("/echo")
+                assert response.body == {"authorization": f"Bearer {tenant_id}"}
+        acme, globex = tenants.client("acme"), tenants.client("globex")
+        assert acme.cache is not globex.cache
+        assert acme.cache.stats.hits == globex.cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_tenants_trace_their_requests():
+    reported = []
+    async with TestServer(echo_app()) as server:
+        async with TenantClientPool(tracing=True) as tenants:
+            client = tenants.client("acme", config_of(server, "acme"))
+            traced = await client.get("/echo")
+        async with TenantClientPool(on_timings=reported.append) as tenants:
+            client = tenants.client("acme", config_of(server, "acme"))
+            await client.get("/echo")
+
+    assert traced.timings.connect > 0
+    assert [timings.connect > 0 for timings in reported] == [True]
+
+
+@pytest.mark.asyncio
+async def test_tenants_are_evicted_and_recreated():
+    config = FreshChatConfiguration(app_id="app", token="token")
+    async with TenantClientPool(idle_timeout=60, max_tenants=2) as tenants:
+        for tenant_id in ("a", "b", "c"):
+            tenants.register(tenant_id, config)
+        client = tenants.client("a")
+        tenants.client("b")
+        tenants.client("a")
+        tenants.client("c")
+        # b is the least recently used one
+        assert list(tenants) == ["a", "c"]
+        assert tenants.evicted == 1
+
+        assert tenants.evict_idle() == 0
+        tenants._tenants["a"].last_used -= 120
+        assert tenants.evict_idle() == 1
+        assert "a" not in tenants and "c" in tenants
+        assert tenants.client("a") is not client
+
+        with pytest.raises(KeyError):
+            tenants.client("unknown")
+
+
+@pytest.mark.asyncio
+async def test_tenant_metrics_are_labelled():
+    async with FakeFreshchat() as fake, TenantClientPool(metrics=True) as tenants:
+        for tenant_id in ("acme", "globex"):
+            client = tenants.client(tenant_id, fake.configuration())
+            await User.create(client, email=f"{tenant_id}@test.ai")
+        assert tenants.tenant_metrics("acme").labels == {"tenant": "acme"}
+
+        rendered = tenants.render_metrics()
+        assert rendered.count("# TYPE freshchat_request_duration_seconds") == 1
+        assert 'tenant="acme",method="POST",endpoint="/users"' in rendered
+        assert 'tenant="globex",method="POST",endpoint="/users"' in rendered
+
+
+@pytest.mark.asyncio
+async def test_evicted_tenants_keep_their_rate_limiter_and_metrics():
+    async with FakeFreshchat() as fake:
+        async with TenantClientPool(max_tenants=1, metrics=True) as tenants:
+            acme = tenants.client("acme", fake.configuration())
+            await User.create(acme, email="acme@test.ai")
+            tenants.client("globex", fake.configuration())
+            assert "acme" not in tenants
+
+            recreated = tenants.client("acme")
+            assert recreated is not acme
+            assert recreated.rate_limiter is acme.rate_limiter
+            await User.create(recreated, email="acme@test.ai")
+            assert tenants.tenant_metrics("acme").in_flight == 0
+            assert 'tenant="acme"' in tenants.render_metrics()
+            counts = [
+                histogram.count
+                for histogram in tenants.tenant_metrics("acme").histograms.values()
+            ]
+            assert counts == [2]
+
+            tenants.unregister("acme")
+            assert "acme" not in tenants.rate_limiters
+            assert tenants.tenant_metrics("acme") is None
@@ -0,0 +1,112 @@
+import asyncio
+import random
+
+import pytest
+from aiohttp.test_utils import TestServer
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.exceptions import ResourceNotFound, TooManyRequests
+from freshchat.client.retry import RetryPolicy
+from freshchat.models import Channels, Conversation, User
+from freshchat.models.events import Message, Resolve
+from freshchat.testing import FakeFreshchat, Faults, constant, lognormal, uniform
+from freshchat.webhook.security import SecurityManager
+from freshchat.webhook.server import create_app
+
+
+def test_latency_distributions():
+    generator = random.Random(1)
+    assert constant(0.1)(generator) == 0.1
+    assert 0.1 <= uniform(0.1, 0.2)(generator) <= 0.2
+    assert lognormal(0.05)(generator) > 0
+
+
+@pytest.mark.asyncio
+async def test_fake_keeps_the_state_of_the_models():
+    async with FakeFreshchat() as fake:
+        async with FreshChatClient(config=fake.configuration()) as client:
+            user = await User.create(client, email="peter.griffin@test.ai")
+            assert await User.get(client, user.id) == user
+            conversation = await Conversation.create(
+                client, user_id=user.id, init_message="Hey dude!"
+            )
+            message = await conversation.send(client, "Hello dude!")
+            fetched = await Conversation.get(
+                client, conversation.conversation_id, user=user
+            )
+            channels = [channel async for channel in Channels.iter(client, 2)]
+            with pytest.raises(ResourceNotFound):
+                await User.get(client, "missing")
+
+    stored = fake.messages[conversation.conversation_id]
+    assert [m["id"] for m in stored][1] == message.id
+    assert [m["id"] for m in fetched.messages] == [m["id"] for m in stored]
+    assert [channel.id for channel in channels] == [c["id"] for c in fake.channels]
+    assert fake.requests["GET /users/{id}"] == 3
+
+
+@pytest.mark.asyncio
+async def test_fake_is_seeded_without_requests():
+    async with FakeFreshchat() as fake:
+        user = fake.add_user(email="peter.griffin@test.ai")
+        conversation = fake.add_conversation(users=[{"id": user["id"]}])
+        fake.add_message(conversation["conversation_id"], "Hey dude!")
+        async with FreshChatClient(config=fake.configuration()) as client:
+            fetched = await Conversation.get(
+                client, conversation["conversation_id"], user_id=user["id"]
+            )
+
+    assert fetched.users == [User.from_payload(user)]
+    assert fetched.channel_id == fake.default_channel_id
+    assert [m["message_parts"] for m in fetched.messages] == [
+        [{"text": {"content": "Hey dude!"}}]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_fake_injects_faults():
+    faults = Faults(rate_limited=1.0, retry_after=0)
+    async with FakeFreshchat(faults=faults, seed=1) as fake:
+        async with FreshChatClient(config=fake.configuration()) as client:
+            with pytest.raises(TooManyRequests):
+                await client.get("/channels")
+            fake.faults = Faults(unavailable=0.5)
+            retry = RetryPolicy(max_attempts=10, backoff_factor=0)
+            async with FreshChatClient(fake.configuration(), retry=retry) as retried:
+                for _ in range(5):
+                    await retried.get("/channels")
+    assert fake.requests["GET /channels"] > 6
+
+
+@pytest.mark.asyncio
+async def test_fake_emits_signed_webhooks():
+    events = []
+
+    async def handler(event):
+        events.append(event)
+
+    async with FakeFreshchat(key_size=1024) as fake:
+        manager = SecurityManager(fake.public_key)
+        webhook = TestServer(create_app(security_manager=manager, handlers=[handler]))
+        async with webhook:
+            fake.webhook_url = str(webhook.make_url("/"))
+            async with FreshChatClient(config=fake.configuration()) as client:
+                user = await User.create(client, email="peter.griffin@test.ai")
+                conversation = await Conversation.create(
+                    client, user=user, init_message="Hey dude!"
+                )
+                await conversation.send(client, "Hello dude!")
+                fake.add_message(conversation.conversation_id, "Hi bot")
+                await conversation.resolve(client)
+            await fake.stop()
+            await asyncio.sleep(0.05)
+        manager.close()
+
+    messages = [event.data for event in events if event.action == "message_create"]
+    resolutions = [event.data for event in events if isinstance(event.data, Resolve)]
+    assert len(events) == 3 and len(resolutions) == 1
+    assert all(isinstance(message, Message) for message in messages)
+    assert {message.conversation.conversation_id for message in messages} == {
+        conversation.conversation_id
+    }
+    assert {message.actor_type for message in messages} == {"user"}
@@ -0,0 +1,87 @@
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from freshchat.client.client import FreshChatClient
+from freshchat.client.configuration import FreshChatConfiguration
+from freshchat.client.exceptions import ResourceNotFound
+from freshchat.client.tracing import RequestTimings, create_trace_config
+
+
+def create_app() -> web.Application:
+    async def user(request: web.Request) -> web.Response:
+        if request.match_info["user_id"] == "missing":
+            return web.json_response({"message": "not found"}, status=404)
+        return web.json_response({"id": request.match_info["user_id"]})
+
+    app = web.Application()
+    app.router.add_get("/users/{user_id}", user)
+    return app
+
+
+def client_of(server: TestServer, **kwargs) -> FreshChatClient:
+    config = FreshChatConfiguration(
+        app_id="app", token="token", url=str(server.make_url("/"))
+    )
+    return FreshChatClient(config=config, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_responses_carry_phase_timings():
+    async with TestServer(create_app()) as server:
+        async with client_of(server, tracing=True) as client:
+            first = await client.get("/users/a")
+            second = await client.get("/users/b")
+
+    assert first.timings.method == "GET"
+    assert first.timings.url.endswith("/users/a")
+    assert first.timings.status == 200
+    assert not first.timings.reused_connection
+    assert first.timings.connect > 0
+    assert first.timings.total >= first.timings.ttfb > 0
+    assert first.timings.transfer >= 0
+    assert second.timings.reused_connection
+    assert second.timings.connect is None
+
+
+@pytest.mark.asyncio
+async def test_timings_callback_is_called_for_failed_attempts():
+    reported = []
+    async with TestServer(create_app()) as server:
+        async with client_of(server, on_timings=reported.append) as client:
+            await client.get("/users/a")
+            with pytest.raises(ResourceNotFound):
+                await client.get("/users/missing")
+
+    assert [timings.status for timings in reported] == [200, 404]
+    assert all(isinstance(timings, RequestTimings) for timings in reported)
+
+
+@pytest.mark.asyncio
+async def test_requests_are_not_traced_by_default():
+    async with TestServer(create_app()) as server:
+        async with client_of(server) as client:
+            response = await client.get("/users/a")
+            assert response.timings is None
+            assert not client.session.trace_configs
+
+
+class LegacyTraceConfig(aiohttp.TraceConfig):
+    """
+    TraceConfig of aiohttp older than 3.8, without the headers sent signal
+    """
+
+    @property
+    def on_request_headers_sent(self):
+        raise AttributeError("on_request_headers_sent")
+
+
+@pytest.mark.asyncio
+async def test_trace_config_without_headers_sent_signal(monkeypatch):
+    monkeypatch.setattr(aiohttp, "TraceConfig", LegacyTraceConfig)
+    assert isinstance(create_trace_config(), LegacyTraceConfig)
+    async with TestServer(create_app()) as server:
+        async with client_of(server, tracing=True) as client:
+            response = await client.get("/users/a")
+    assert response.timings.total >= response.timings.ttfb > 0
@@ -29,21 +29,27 @@ def user_with_username() -> Dict[Any, Any]:
     [
         (
             {"email": "peter.griffin@test.ai"},
-            asdict(User(**{"email": "peter.griffin@test.ai"})),
+            {"email": "peter.griffin@test.ai"},
             asdict(User(**user_with_email())),
         ),
         (
             {"first_name": "Peter", "last_name": "Griffin"},
-            asdict(User(**{"first_name": "Peter", "last_name": "Griffin"})),
+            {"first_name": "Peter", "last_name": "Griffin"},
             asdict(User(**user_with_username())),
         ),
     ],
 )
 async def test_create_user(
-    input_data, json_body, output_data, test_client, mock_aioresponse, base_url
+    input_data,
+    json_body,
+    output_data,
+    test_client,
+    mock_aioresponse,
+    base_url,
+    request_json,
 ):
     def callback(_, **kwargs):
-        assert kwargs.get("json") == json_body
+        assert request_json(kwargs) == json_body
 
     mock_aioresponse.post(f"{base_url}/users", payload=output_data, callback=callback)
 
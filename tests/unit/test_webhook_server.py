@@ -0,0 +1,181 @@
+import asyncio
+import json
+from base64 import b64encode
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from Crypto.Hash import SHA256
+from Crypto.PublicKey import RSA
+from Crypto.Signature import PKCS1_v1_5
+
+from freshchat.models.events import IncomingEvent, LazyIncomingEvent, Resolve
+from freshchat.webhook.dedup import Deduplicator
+from freshchat.webhook.security import SecurityManager
+from freshchat.webhook.server import APP_KEY, SIGNATURE_HEADER, create_app
+
+EVENT = {
+    "actor": {"actor_type": "agent", "actor_id": "agent_uuid"},
+    "action": "conversation_resolution",
+    "action_time": "time",
+    "data": {
+        "resolve": {
+            "resolver": "agent",
+            "resolver_id": "agent_uuid",
+            "conversation": {"conversation_id": "conversation_uuid"},
+        }
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return RSA.generate(1024)
+
+
+@pytest.fixture
+def security_manager(private_key):
+    body = b64encode(private_key.publickey().exportKey("DER")).decode()
+    manager = SecurityManager(
+        f"-----BEGIN PUBLIC KEY-----\n{body}\n-----END PUBLIC KEY-----"
+    )
+    yield manager
+    manager.close()
+
+
+def signed(private_key, payload):
+    body = json.dumps(payload).encode()
+    signature = PKCS1_v1_5.new(private_key).sign(SHA256.new(body))
+    return body, {SIGNATURE_HEADER: b64encode(signature).decode()}
+
+
+@pytest.mark.asyncio
+async def test_webhook_events_are_handled(private_key, security_manager):
+    events = []
+
+    async def handler(event: IncomingEvent):
+        events.append(event)
+
+    app = create_app(security_manager=security_manager, handlers=[handler])
+    body, headers = signed(private_key, EVENT)
+    async with TestClient(TestServer(app)) as client:
+        response = await client.post("/", data=body, headers=headers)
+        assert response.status == 200
+        response = await client.post("/", data=body, headers={SIGNATURE_HEADER: "AA=="})
+        assert response.status == 401
+        response = await client.post("/", data=b"[]", headers={})
+        assert response.status == 401
+        await asyncio.sleep(0.01)
+        stats = app[APP_KEY].stats
+
+    assert isinstance(events[0].data, Resolve)
+    assert (stats.accepted, stats.rejected, stats.processed) == (1, 2, 1)
+
+
+@pytest.mark.asyncio
+async def test_webhook_rejects_invalid_body():
+    app = create_app()
+    async with TestClient(TestServer(app)) as client:
+        response = await client.post("/", data=b"not json")
+        assert response.status == 400
+
+
+@pytest.mark.asyncio
+async def test_webhook_rejects_signed_events_missing_fields(
+    private_key, security_manager
+):
+    payload = {
+        "actor": {"actor_type": "user", "actor_id": "user_uuid"},
+        "action": "message_create",
+        "action_time": "time",
+        "data": {"message": {"id": "message_uuid", "conversation_id": "uuid"}},
+    }
+    app = create_app(security_manager=security_manager)
+    body, headers = signed(private_key, payload)
+    async with TestClient(TestServer(app)) as client:
+        response = await client.post("/", data=body, headers=headers)
+        assert response.status == 400
+        stats = app[APP_KEY].stats
+    assert (stats.accepted, stats.rejected) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_webhook_sheds_load_when_queue_is_full():
+    release = asyncio.Event()
+
+    async def blocking_handler(_):
+        await release.wait()
+
+    app = create_app(handlers=[blocking_handler], queue_size=1, workers=1)
+    body = json.dumps(EVENT).encode()
+    async with TestClient(TestServer(app)) as client:
+        statuses = []
+        for _ in range(3):
+            response = await client.post("/", data=body)
+            statuses.append(response.status)
+            await asyncio.sleep(0.01)
+        release.set()
+        stats = app[APP_KEY].stats
+
+    assert statuses == [200, 200, 503]
+    assert stats.shed == 1
+
+
+@pytest.mark.asyncio
+async def test_webhook_handler_failures_are_counted():
+    async def failing_handler(_):
+        raise RuntimeError("boom")
+
+    app = create_app(handlers=[failing_handler])
+    async with TestClient(TestServer(app)) as client:
+        await client.post("/", data=json.dumps(EVENT).encode())
+        await asyncio.sleep(0.01)
+        stats = app[APP_KEY].stats
+    assert stats.failed == 1
+    assert stats.latency_max >= stats.mean_latency > 0
+
+
+@pytest.mark.asyncio
+async def test_webhook_lazy_events():
+    events = []
+
+    async def handler(event):
+        events.append(event)
+
+    app = create_app(handlers=[handler], lazy=True)
+    async with TestClient(TestServer(app)) as client:
+        await client.post("/", data=json.dumps(EVENT).encode())
+        await asyncio.sleep(0.01)
+
+    assert isinstance(events[0], LazyIncomingEvent)
+    assert events[0].conversation_id == "conversation_uuid"
+    assert not events[0].is_parsed
+
+
+@pytest.mark.asyncio
+async def test_webhook_skips_redelivered_events(private_key, security_manager):
+    events = []
+
+    async def handler(event):
+        events.append(event)
+
+    app = create_app(
+        security_manager=security_manager,
+        handlers=[handler],
+        deduplicator=Deduplicator(),
+    )
+    body, headers = signed(private_key, EVENT)
+    async with TestClient(TestServer(app)) as client:
+        forged = await client.post("/", data=body, headers={SIGNATURE_HEADER: "AA=="})
+        statuses = [forged.status]
+        for _ in range(3):
+            response = await client.post("/", data=body, headers=headers)
+            statuses.append(response.status)
+        await asyncio.sleep(0.01)
+        stats = app[APP_KEY].stats
+        deduplicator = app[APP_KEY].deduplicator
+
+    assert statuses == [401, 200, 200, 200]
+    assert len(events) == 1
+    assert (stats.accepted, stats.duplicates) == (1, 2)
+    assert security_manager.stats.submitted == 2
+    assert deduplicator.stats.duplicate_rate == 0.5